@@ -1,24 +1,45 @@
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-from db.database import engine, Base
-from api.routers import cars, rentals, metrics
-from api.middleware.logging_middleware import log_requests
-from api.middleware.metrics_middleware import metrics_middleware
+from db.database import engine, AsyncSessionLocal
+from db.migrations.runner import run_migrations
+from api.routers import cars, rentals, reservations, analytics, metrics
+from api.middleware.telemetry_middleware import TelemetryMiddleware
+from common.messaging.rabbitmq_publisher import RabbitMQPublisher
+from services.outbox_relay import OutboxRelay
+from services.rental_archiver import RentalArchiver
+from services.car_change_listener import CarChangeListener
+from services.worker_metrics_fetcher import WorkerMetricsFetcher
+from repositories.car_cache import car_cache
+from common.logger import Logger
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await run_migrations(engine, Logger())
+    car_change_listener = CarChangeListener(Logger(), car_cache)
+    car_change_listener.start()
+    message_publisher = RabbitMQPublisher(Logger())
+    outbox_relay = OutboxRelay(Logger(), message_publisher, AsyncSessionLocal)
+    outbox_relay.start()
+    rental_archiver = RentalArchiver(Logger(), AsyncSessionLocal)
+    rental_archiver.start()
+    app.state.worker_metrics_fetcher = WorkerMetricsFetcher(Logger())
+    app.state.worker_metrics_fetcher.start()
     yield
+    await app.state.worker_metrics_fetcher.stop()
+    await rental_archiver.stop()
+    await outbox_relay.stop()
+    await car_change_listener.stop()
+    await message_publisher.close()
     await engine.dispose()
 
 app = FastAPI(title="DriveNow API", lifespan=lifespan)
 
-app.middleware("http")(metrics_middleware)
-app.middleware("http")(log_requests)
+app.add_middleware(TelemetryMiddleware)
 
 app.include_router(cars.router)
 app.include_router(rentals.router)
+app.include_router(reservations.router)
+app.include_router(analytics.router)
 app.include_router(metrics.router)
 
 if __name__ == "__main__":
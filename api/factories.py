@@ -1,29 +1,57 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.database import get_db
 from repositories.car_repository import CarRepository
+from repositories.cached_car_repository import CachedCarRepository
+from repositories.car_cache import car_cache
 from repositories.rental_repository import RentalRepository
+from repositories.reservation_repository import ReservationRepository
+from repositories.rental_analytics_repository import RentalAnalyticsRepository
+from repositories.outbox_repository import OutboxRepository
+from repositories.unit_of_work import UnitOfWork
+from repositories.interfaces.unit_of_work_interface import IUnitOfWork
 from services.car_service import CarService
 from services.rental_service import RentalService
+from services.reservation_service import ReservationService
+from services.analytics_service import AnalyticsService
 from services.interfaces.car_service_interface import ICarService
 from services.interfaces.rental_service_interface import IRentalService
+from services.interfaces.reservation_service_interface import IReservationService
+from services.interfaces.analytics_service_interface import IAnalyticsService
 from services.interfaces.metrics_service_interface import IMetricsService
 from services.metrics_service import MetricsService
-from common.messaging.rabbitmq_publisher import RabbitMQPublisher
+from services.interfaces.worker_metrics_fetcher_interface import IWorkerMetricsFetcher
+from common.interfaces.message_publisher_interface import IMessagePublisher
+from common.messaging.outbox_publisher import OutboxPublisher
 from common.logger import Logger
 
-def car_service_factory(db: AsyncSession = Depends(get_db)) -> ICarService:
+def message_publisher_factory(db: AsyncSession = Depends(get_db)) -> IMessagePublisher:
+    return OutboxPublisher(OutboxRepository(db))
+
+def unit_of_work_factory(db: AsyncSession = Depends(get_db)) -> IUnitOfWork:
+    return UnitOfWork(db)
+
+def car_service_factory(db: AsyncSession = Depends(get_db), event_publisher: IMessagePublisher = Depends(message_publisher_factory), unit_of_work: IUnitOfWork = Depends(unit_of_work_factory)) -> ICarService:
     logger = Logger()
-    event_publisher = RabbitMQPublisher(logger)
-    repository = CarRepository(db)
-    return CarService(logger, event_publisher, repository)
+    repository = CachedCarRepository(CarRepository(db), car_cache)
+    return CarService(logger, event_publisher, repository, unit_of_work)
 
-def rental_service_factory(db: AsyncSession = Depends(get_db)) -> IRentalService:
+def rental_service_factory(db: AsyncSession = Depends(get_db), event_publisher: IMessagePublisher = Depends(message_publisher_factory), unit_of_work: IUnitOfWork = Depends(unit_of_work_factory)) -> IRentalService:
     logger = Logger()
-    event_publisher = RabbitMQPublisher(logger)
     rental_repo = RentalRepository(db)
-    car_repo = CarRepository(db)
-    return RentalService(logger, event_publisher, rental_repo, car_repo)
+    return RentalService(logger, event_publisher, rental_repo, unit_of_work)
+
+def reservation_service_factory(db: AsyncSession = Depends(get_db), unit_of_work: IUnitOfWork = Depends(unit_of_work_factory)) -> IReservationService:
+    logger = Logger()
+    reservation_repo = ReservationRepository(db)
+    return ReservationService(logger, reservation_repo, unit_of_work)
+
+def analytics_service_factory(db: AsyncSession = Depends(get_db)) -> IAnalyticsService:
+    logger = Logger()
+    return AnalyticsService(logger, RentalAnalyticsRepository(db))
 
 def metrics_service_factory() -> IMetricsService:
     return MetricsService()
+
+def worker_metrics_fetcher_factory(request: Request) -> IWorkerMetricsFetcher:
+    return request.app.state.worker_metrics_fetcher
@@ -0,0 +1,22 @@
+import orjson
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+from fastapi import Response
+from pydantic import BaseModel
+
+# Matches what FastAPI renders through the response models: UUIDs and enums as their string values,
+# compact separators, UTF-8 without escaping, and "Z" for any zero UTC offset.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+def response_fields(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+def dump_entity(entity: Any, fields: Tuple[str, ...]) -> bytes:
+    return orjson.dumps({name: getattr(entity, name) for name in fields}, option=ORJSON_OPTIONS)
+
+def dump_entities(entities: Iterable[Any], fields: Tuple[str, ...]) -> bytes:
+    # Keys follow the response schema's field order so the bytes are identical to the validated path.
+    return orjson.dumps([{name: getattr(entity, name) for name in fields} for entity in entities], option=ORJSON_OPTIONS)
+
+def entities_response(entities: Iterable[Any], fields: Tuple[str, ...], headers: Optional[Dict[str, str]] = None) -> Response:
+    # Returned as-is by FastAPI, skipping response-model validation and any headers set on an injected Response.
+    return Response(content=dump_entities(entities, fields), media_type="application/json", headers=headers)
@@ -1,20 +0,0 @@
-from fastapi import Request, Response
-from typing import Callable, Awaitable
-from common.logger import Logger
-import time
-
-logger = Logger()
-
-async def log_requests(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-    start_time = time.time()
-    logger.info(f"Request started: {request.method} {request.url.path}")
-    
-    try:
-        response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
-        logger.info(f"Request completed: {request.method} {request.url.path} in {process_time:.2f}ms")
-        return response
-    except Exception as e:
-        process_time = (time.time() - start_time) * 1000
-        logger.error(f"Request failed: {request.method} {request.url.path} in {process_time:.2f}ms with error: {str(e)}")
-        raise e
@@ -0,0 +1,80 @@
+import random
+import time
+from typing import Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from services.interfaces.metrics_service_interface import IMetricsService
+from services.metrics_service import MetricsService
+from common.interfaces.logger_interface import ILogger
+from common.logger import Logger
+from common.config import settings
+from db.query_metrics import QueryStats, track_queries
+
+UNMATCHED_ROUTE = "unmatched"
+KNOWN_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+def route_label(scope: Scope) -> str:
+    # The template ("/cars/{car_id}") keeps one series per route; raw paths would add one per id or probe.
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+def method_label(scope: Scope) -> str:
+    return scope["method"] if scope["method"] in KNOWN_METHODS else "OTHER"
+
+class TelemetryMiddleware:
+    def __init__(self, app: ASGIApp, metrics_service: Optional[IMetricsService] = None, logger: Optional[ILogger] = None, access_log_sample_rate: float = settings.ACCESS_LOG_SAMPLE_RATE, db_debug_headers: bool = settings.DB_DEBUG_HEADERS) -> None:
+        self.app = app
+        self.metrics_service = metrics_service or MetricsService()
+        self.logger = logger or Logger()
+        self.access_log_sample_rate = access_log_sample_rate
+        self.db_debug_headers = db_debug_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+        recorded = False
+        query_stats = track_queries()
+
+        async def send_with_telemetry(message: Message) -> None:
+            nonlocal status_code, recorded
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.db_debug_headers:
+                    # Covers the statements issued before the response started; a streamed body may add more.
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"x-db-queries", str(query_stats.queries).encode()),
+                        (b"x-db-time", f"{query_stats.seconds * 1000:.2f}ms".encode()),
+                    ]
+            await send(message)
+            # Streaming bodies arrive in several messages; the request is done once the last one is sent,
+            # which is also before any background task runs.
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                recorded = True
+                self._record(scope, status_code, start_ns, query_stats)
+
+        try:
+            await self.app(scope, receive, send_with_telemetry)
+        except Exception as e:
+            if not recorded:
+                recorded = True
+                self._record(scope, 500, start_ns, query_stats, error=e)
+            raise
+        finally:
+            if not recorded:
+                # The client went away before the response was complete.
+                self._record(scope, status_code, start_ns, query_stats)
+
+    def _record(self, scope: Scope, status_code: int, start_ns: int, query_stats: QueryStats, error: Optional[Exception] = None) -> None:
+        elapsed_seconds = (time.perf_counter_ns() - start_ns) / 1e9
+        endpoint = route_label(scope)
+        self.metrics_service.record_request_time(method_label(scope), endpoint, status_code, elapsed_seconds)
+        self.metrics_service.record_request_queries(endpoint, query_stats.queries, query_stats.seconds)
+        if error is not None:
+            self.logger.error("Request failed: %s %s in %.2fms with error: %s", scope["method"], scope["path"], elapsed_seconds * 1000, error)
+        elif status_code >= 500 or random.random() < self.access_log_sample_rate:
+            # Server errors are always logged; the rest of the access log can be sampled down under load.
+            self.logger.info("Request completed: %s %s %d in %.2fms", scope["method"], scope["path"], status_code, elapsed_seconds * 1000)
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, Query, status, HTTPException
+from typing import List
+from datetime import date
+from api.factories import analytics_service_factory
+from services.interfaces.analytics_service_interface import IAnalyticsService
+from api.schemas.analytics_schemas import CarUtilizationResponse, ModelUtilizationResponse, RentalDurationsResponse, HourlyActivityResponse
+from common.exceptions import DatabaseException, InputValidationException
+from common.logger import Logger
+from common.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+logger = Logger()
+
+@router.get("/utilization/cars", response_model=List[CarUtilizationResponse])
+async def get_car_utilization(
+    from_date: date,
+    to_date: date,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    service: IAnalyticsService = Depends(analytics_service_factory),
+):
+    """
+    List the most used cars between two UTC dates (inclusive).
+
+    Utilization is the share of the window a car spent rented. Figures come 
+    from daily rollups that are updated when a rental ends, so rentals that 
+    are still active are not counted yet.
+    """
+    try:
+        return await service.get_car_utilization(from_date, to_date, limit)
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error retrieving car utilization: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error retrieving car utilization: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.get("/utilization/models", response_model=List[ModelUtilizationResponse])
+async def get_model_utilization(from_date: date, to_date: date, service: IAnalyticsService = Depends(analytics_service_factory)):
+    """
+    Summarize utilization per car model between two UTC dates (inclusive).
+
+    Every registered car of a model counts towards its capacity, including 
+    cars that were never rented in the window.
+    """
+    try:
+        return await service.get_model_utilization(from_date, to_date)
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error retrieving model utilization: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error retrieving model utilization: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.get("/rental-durations", response_model=RentalDurationsResponse)
+async def get_rental_durations(from_date: date, to_date: date, service: IAnalyticsService = Depends(analytics_service_factory)):
+    """
+    Describe how long rentals that ended between two UTC dates lasted.
+
+    Returns the duration histogram and the p50, p90 and p99 durations, which 
+    are estimated by interpolating within the histogram buckets.
+    """
+    try:
+        return await service.get_rental_durations(from_date, to_date)
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error retrieving rental durations: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error retrieving rental durations: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.get("/busiest-hours", response_model=List[HourlyActivityResponse])
+async def get_busiest_hours(from_date: date, to_date: date, service: IAnalyticsService = Depends(analytics_service_factory)):
+    """
+    Rank the 24 UTC hours of the day by how many cars were in use.
+
+    For each hour, returns the rentals that started in it and the average 
+    number of cars rented during it across the window, busiest first.
+    """
+    try:
+        return await service.get_busiest_hours(from_date, to_date)
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error retrieving busiest hours: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error retrieving busiest hours: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
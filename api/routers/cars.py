@@ -1,16 +1,22 @@
-from fastapi import APIRouter, Depends, status, HTTPException
-from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional, Union
 from uuid import UUID
-from domain.entities.car import CarStatus
+from domain.entities.car import CarEntity, CarFilter, CarStatus
 from api.factories import car_service_factory
 from services.interfaces.car_service_interface import ICarService
-from api.schemas.car_schemas import CarCreate, CarResponse, CarUpdate
+from api.schemas.car_schemas import CarCreate, CarResponse, CarUpdate, CarBulkCreate, CarBulkCreateResponse, CarBulkCreateFailure, CarBulkStatusUpdate, CarBulkStatusUpdateResponse
 from common.exceptions import NotFoundException, DatabaseException, InputValidationException
 from common.logger import Logger
+from common.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from common.config import settings
+from api.fast_json import dump_entity, entities_response, response_fields
 
 router = APIRouter(prefix="/cars", tags=["cars"])
 logger = Logger()
 
+CAR_RESPONSE_FIELDS = response_fields(CarResponse)
+
 @router.post("", response_model=CarResponse, status_code=status.HTTP_201_CREATED)
 async def create_car(car: CarCreate, service: ICarService = Depends(car_service_factory)):
     """
@@ -30,6 +36,57 @@ async def create_car(car: CarCreate, service: ICarService = Depends(car_service_
         logger.critical(f"Unexpected error creating car: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
 
+@router.post("/bulk", response_model=CarBulkCreateResponse)
+async def create_cars_bulk(payload: CarBulkCreate, service: ICarService = Depends(car_service_factory)):
+    """
+    Register a batch of new cars in one request.
+
+    Every item is validated with the same rules as a single car registration. 
+    Valid items are inserted together and reported under `created`; invalid 
+    ones are reported under `failed` with their position in the batch and do 
+    not prevent the rest from being registered.
+    """
+    try:
+        created, failures = await service.create_cars([(car.model, car.year) for car in payload.cars])
+        return CarBulkCreateResponse(
+            created=[CarResponse.model_validate(car) for car in created],
+            failed=[CarBulkCreateFailure(index=index, error=error) for index, error in failures.items()],
+        )
+    except DatabaseException as e:
+        logger.error(f"Database error creating cars in bulk: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error creating cars in bulk: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.post("/bulk/status", response_model=CarBulkStatusUpdateResponse)
+async def update_cars_status_bulk(payload: CarBulkStatusUpdate, service: ICarService = Depends(car_service_factory)):
+    """
+    Move a set of cars to a new status in one request.
+
+    Targets either the listed `car_ids`, every car currently in `current_status`, 
+    or the listed cars that are in that status when both are given. Cars with an 
+    active rental are never touched and are reported under `rented`; cars already 
+    in the requested status are reported under `unchanged`. Moving cars into or 
+    out of `in_use` is reserved to rentals.
+    """
+    try:
+        transitions, not_found = await service.update_cars_status(payload.status, car_ids=payload.car_ids, current_status=payload.current_status)
+        return CarBulkStatusUpdateResponse(
+            updated=[t.car_id for t in transitions if t.updated],
+            unchanged=[t.car_id for t in transitions if not t.updated and not t.rented],
+            rented=[t.car_id for t in transitions if t.rented],
+            not_found=not_found,
+        )
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error updating car statuses in bulk: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error updating car statuses in bulk: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
 @router.put("/{car_id}", response_model=CarResponse)
 async def update_car(car_id: UUID, car_update: CarUpdate, service: ICarService = Depends(car_service_factory)):
     """
@@ -52,18 +109,112 @@ async def update_car(car_id: UUID, car_update: CarUpdate, service: ICarService =
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
 
 @router.get("", response_model=List[CarResponse])
-async def get_cars(car_status: Optional[CarStatus] = None, service: ICarService = Depends(car_service_factory)):
+async def get_cars(
+    response: Response,
+    car_status: Optional[CarStatus] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    service: ICarService = Depends(car_service_factory),
+):
     """
     List all vehicles with optional status filtering.
 
     Retrieves the complete fleet or a subset of vehicles filtered by their 
     current status (available, in_use, or under_maintenance).
+
+    Passing `limit` (and the `cursor` from the previous page's `X-Next-Cursor` 
+    header) returns the fleet page by page, ordered by creation time. Passing 
+    `stream=true` returns the whole fleet as newline-delimited JSON, written 
+    while rows are read from the database.
     """
     try:
-        return await service.get_all_cars(car_status)
+        if stream:
+            return StreamingResponse(_stream_cars_ndjson(service.stream_cars(car_status)), media_type="application/x-ndjson")
+
+        next_cursor = None
+        if limit is None and cursor is None:
+            cars = await service.get_all_cars(car_status)
+        else:
+            cars, next_cursor = await service.get_cars_page(car_status, limit or DEFAULT_PAGE_LIMIT, cursor)
+
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        if settings.FAST_JSON_RESPONSES:
+            return entities_response(cars, CAR_RESPONSE_FIELDS, headers)
+        response.headers.update(headers)
+        return cars
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except DatabaseException as e:
         logger.error(f"Database error retrieving cars: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
     except Exception as e:
         logger.critical(f"Unexpected error retrieving cars: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.get("/search", response_model=List[CarResponse])
+async def search_cars(
+    response: Response,
+    car_status: Optional[CarStatus] = None,
+    model: Optional[str] = Query(None, min_length=1),
+    min_year: Optional[int] = None,
+    max_year: Optional[int] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+    service: ICarService = Depends(car_service_factory),
+):
+    """
+    Search the fleet by status, model and production year.
+
+    Filters can be combined: a status, a model name prefix (case-insensitive) 
+    and an inclusive [min_year, max_year] range, all applied in the database. 
+    Results are ordered by creation time and paginated; pass the 
+    `X-Next-Cursor` header of one page as `cursor` to fetch the next one.
+    """
+    try:
+        filters = CarFilter(status=car_status, model_prefix=model, min_year=min_year, max_year=max_year)
+        cars, next_cursor = await service.search_cars(filters, limit, cursor)
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        if settings.FAST_JSON_RESPONSES:
+            return entities_response(cars, CAR_RESPONSE_FIELDS, headers)
+        response.headers.update(headers)
+        return cars
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error searching cars: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error searching cars: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.get("/{car_id}", response_model=CarResponse)
+async def get_car(car_id: UUID, service: ICarService = Depends(car_service_factory)):
+    """
+    Retrieve a single vehicle by its ID.
+
+    Served from the in-process car cache when possible; cached entries are 
+    dropped as soon as the car is written by any API instance.
+    """
+    try:
+        return await service.get_car(car_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error retrieving car {car_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error retrieving car {car_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+async def _stream_cars_ndjson(cars: AsyncIterator[CarEntity]) -> AsyncIterator[Union[str, bytes]]:
+    try:
+        fast_json = settings.FAST_JSON_RESPONSES
+        async for car in cars:
+            if fast_json:
+                yield dump_entity(car, CAR_RESPONSE_FIELDS) + b"\n"
+            else:
+                yield CarResponse.model_validate(car).model_dump_json() + "\n"
+    except Exception as e:
+        # Headers are already sent, so the only signal left to the client is a truncated stream.
+        logger.error(f"Error while streaming cars, response truncated: {e}")
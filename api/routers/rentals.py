@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
+from typing import List, Optional
 from uuid import UUID
+from datetime import datetime
+from domain.entities.rental import RentalFilter
 from api.factories import rental_service_factory
 from services.interfaces.rental_service_interface import IRentalService
 from api.schemas.rental_schemas import RentalCreate, RentalResponse
 from common.exceptions import NotFoundException, CarStatusUnavailableException, RentalAlreadyEndedException, DatabaseException, InputValidationException
 from common.logger import Logger
+from common.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from common.config import settings
+from api.fast_json import entities_response, response_fields
 
 router = APIRouter(prefix="/rentals", tags=["rentals"])
 logger = Logger()
 
+RENTAL_RESPONSE_FIELDS = response_fields(RentalResponse)
+
 @router.post("", response_model=RentalResponse, status_code=status.HTTP_201_CREATED)
 async def create_rental(rental: RentalCreate, service: IRentalService = Depends(rental_service_factory)):
     """
@@ -54,3 +62,43 @@ async def end_rental_by_car_id(car_id: UUID, service: IRentalService = Depends(r
     except Exception as e:
         logger.critical(f"Unexpected error ending rental for car {car_id}: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.get("", response_model=List[RentalResponse])
+async def get_rentals(
+    response: Response,
+    active: Optional[bool] = None,
+    car_id: Optional[UUID] = None,
+    customer_name: Optional[str] = Query(None, min_length=1),
+    from_time: Optional[datetime] = None,
+    to_time: Optional[datetime] = None,
+    include_archived: bool = False,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+    service: IRentalService = Depends(rental_service_factory),
+):
+    """
+    List rentals, newest first, with server-side filtering.
+
+    Filters can be combined: only active (or only ended) rentals, a single car, 
+    a customer name prefix (case-insensitive), and a time window that keeps 
+    rentals overlapping [from_time, to_time). Rentals that ended long ago are 
+    moved to the archive and only listed with `include_archived=true`. Results 
+    are paginated; pass the `X-Next-Cursor` header of one page as `cursor` to 
+    fetch the next one.
+    """
+    try:
+        filters = RentalFilter(active=active, car_id=car_id, customer_name=customer_name, from_time=from_time, to_time=to_time, include_archived=include_archived)
+        rentals, next_cursor = await service.get_rentals_page(filters, limit, cursor)
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        if settings.FAST_JSON_RESPONSES:
+            return entities_response(rentals, RENTAL_RESPONSE_FIELDS, headers)
+        response.headers.update(headers)
+        return rentals
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error retrieving rentals: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error retrieving rentals: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
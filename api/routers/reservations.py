@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
+from typing import List, Optional
+from uuid import UUID
+from datetime import datetime
+from api.factories import reservation_service_factory
+from services.interfaces.reservation_service_interface import IReservationService
+from api.schemas.reservation_schemas import ReservationCreate, ReservationResponse
+from api.schemas.car_schemas import CarResponse
+from api.routers.cars import CAR_RESPONSE_FIELDS
+from common.exceptions import NotFoundException, ReservationConflictException, DatabaseException, InputValidationException
+from common.logger import Logger
+from common.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from common.config import settings
+from api.fast_json import entities_response
+
+router = APIRouter(prefix="/reservations", tags=["reservations"])
+logger = Logger()
+
+@router.post("", response_model=ReservationResponse, status_code=status.HTTP_201_CREATED)
+async def create_reservation(reservation: ReservationCreate, service: IReservationService = Depends(reservation_service_factory)):
+    """
+    Book a car for a future [start_time, end_time) window.
+
+    Times must include a time zone. Fails with 409 when the car already has a 
+    booking overlapping the window; back-to-back bookings are allowed. Other 
+    customers cannot start a rental on the car once the booking is close.
+    """
+    try:
+        return await service.create_reservation(reservation.car_id, reservation.customer_name, reservation.start_time, reservation.end_time)
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ReservationConflictException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error creating reservation: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error creating reservation: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.get("/free-cars", response_model=List[CarResponse])
+async def get_free_cars(
+    response: Response,
+    start_time: datetime,
+    end_time: datetime,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = None,
+    service: IReservationService = Depends(reservation_service_factory),
+):
+    """
+    List available cars with no booking overlapping [start_time, end_time).
+
+    Results are ordered by creation time and paginated; pass the 
+    `X-Next-Cursor` header of one page as `cursor` to fetch the next one.
+    """
+    try:
+        cars, next_cursor = await service.get_free_cars_page(start_time, end_time, limit, cursor)
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        if settings.FAST_JSON_RESPONSES:
+            return entities_response(cars, CAR_RESPONSE_FIELDS, headers)
+        response.headers.update(headers)
+        return cars
+    except InputValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error retrieving free cars: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error retrieving free cars: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
+
+@router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_reservation(reservation_id: UUID, service: IReservationService = Depends(reservation_service_factory)):
+    """
+    Cancel a booking and free its window for other customers.
+    """
+    try:
+        await service.cancel_reservation(reservation_id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except DatabaseException as e:
+        logger.error(f"Database error cancelling reservation {reservation_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error")
+    except Exception as e:
+        logger.critical(f"Unexpected error cancelling reservation {reservation_id}: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred")
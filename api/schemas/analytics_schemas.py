@@ -0,0 +1,49 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+
+class CarUtilizationResponse(BaseModel):
+    car_id: UUID
+    model: str
+    rented_seconds: float
+    rentals: int
+    utilization: float
+
+    class Config:
+        from_attributes = True
+
+class ModelUtilizationResponse(BaseModel):
+    model: str
+    cars: int
+    rented_seconds: float
+    rentals: int
+    utilization: float
+
+    class Config:
+        from_attributes = True
+
+class DurationBucketResponse(BaseModel):
+    lower_seconds: int
+    upper_seconds: Optional[int]
+    rentals: int
+
+    class Config:
+        from_attributes = True
+
+class RentalDurationsResponse(BaseModel):
+    rentals: int
+    p50_seconds: Optional[float]
+    p90_seconds: Optional[float]
+    p99_seconds: Optional[float]
+    buckets: List[DurationBucketResponse]
+
+    class Config:
+        from_attributes = True
+
+class HourlyActivityResponse(BaseModel):
+    hour_of_day: int
+    rentals_started: int
+    average_cars_in_use: float
+
+    class Config:
+        from_attributes = True
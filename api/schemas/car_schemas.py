@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 from domain.entities.car import CarStatus
@@ -19,6 +19,35 @@ class CarResponse(BaseModel):
     class Config:
         from_attributes = True
 
+MAX_BULK_CARS = 1000
+
+class CarBulkCreateItem(BaseModel):
+    # The year rule is checked per item by the service so one out-of-range row does not reject the whole batch.
+    model: str = Field(..., min_length=2)
+    year: int = Field(..., json_schema_extra={"example": 2000})
+
+class CarBulkCreate(BaseModel):
+    cars: List[CarBulkCreateItem] = Field(..., min_length=1, max_length=MAX_BULK_CARS)
+
+class CarBulkCreateFailure(BaseModel):
+    index: int
+    error: str
+
+class CarBulkCreateResponse(BaseModel):
+    created: List[CarResponse]
+    failed: List[CarBulkCreateFailure]
+
+class CarBulkStatusUpdate(BaseModel):
+    status: CarStatus
+    car_ids: Optional[List[UUID]] = Field(None, min_length=1, max_length=MAX_BULK_CARS)
+    current_status: Optional[CarStatus] = None
+
+class CarBulkStatusUpdateResponse(BaseModel):
+    updated: List[UUID]
+    unchanged: List[UUID]
+    rented: List[UUID]
+    not_found: List[UUID]
+
 class CarUpdate(BaseModel):
     model: Optional[str] = Field(None, min_length=2)
     year: Optional[int] = Field(None, ge=1950, json_schema_extra={"example": 2000})
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from uuid import UUID
+from datetime import datetime
+
+class ReservationCreate(BaseModel):
+    car_id: UUID
+    customer_name: str = Field(..., min_length=2, description="Customer name cannot be empty")
+    start_time: datetime
+    end_time: datetime
+
+class ReservationResponse(BaseModel):
+    id: UUID
+    car_id: UUID
+    customer_name: str
+    start_time: datetime
+    end_time: datetime
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,85 @@
+# Per-request overhead of the API telemetry middleware: the two BaseHTTPMiddleware-style functions the API
+# used to register versus the single ASGI TelemetryMiddleware, on a trivial in-process endpoint.
+# Run with: python -m benchmarks.middleware_overhead [requests]
+import asyncio
+import sys
+import time
+from typing import Awaitable, Callable
+import httpx
+from fastapi import FastAPI, Request, Response
+from api.middleware.telemetry_middleware import TelemetryMiddleware, method_label, route_label
+from common.interfaces.logger_interface import ILogger
+from services.metrics_service import MetricsService
+
+class NullLogger(ILogger):
+    def info(self, message: str, *args: object) -> None:
+        pass
+
+    def warning(self, message: str, *args: object) -> None:
+        pass
+
+    def error(self, message: str, *args: object) -> None:
+        pass
+
+    def critical(self, message: str, *args: object) -> None:
+        pass
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/cars/{car_id}")
+    async def get_car(car_id: str):
+        return {"id": car_id}
+
+    return app
+
+def baseline_app() -> FastAPI:
+    return _app()
+
+def http_middleware_app() -> FastAPI:
+    app = _app()
+    logger, metrics_service = NullLogger(), MetricsService()
+
+    async def metrics_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        metrics_service.record_request_time(method_label(request.scope), route_label(request.scope), response.status_code, time.time() - start_time)
+        return response
+
+    async def log_requests(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        start_time = time.time()
+        logger.info(f"Request started: {request.method} {request.url.path}")
+        response = await call_next(request)
+        logger.info(f"Request completed: {request.method} {request.url.path} in {(time.time() - start_time) * 1000:.2f}ms")
+        return response
+
+    app.middleware("http")(metrics_middleware)
+    app.middleware("http")(log_requests)
+    return app
+
+def asgi_middleware_app() -> FastAPI:
+    app = _app()
+    app.add_middleware(TelemetryMiddleware, logger=NullLogger())
+    return app
+
+async def measure(app: FastAPI, requests: int) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(200):
+            await client.get("/cars/warmup")
+        start = time.perf_counter_ns()
+        for i in range(requests):
+            await client.get(f"/cars/{i}")
+        return (time.perf_counter_ns() - start) / requests / 1000
+
+async def main(requests: int) -> None:
+    results = {name: await measure(factory(), requests) for name, factory in (
+        ("no middleware", baseline_app),
+        ("2 x app.middleware('http')", http_middleware_app),
+        ("TelemetryMiddleware (ASGI)", asgi_middleware_app),
+    )}
+    baseline = results["no middleware"]
+    for name, micros in results.items():
+        print(f"{name:<30} {micros:8.1f} us/request  (+{micros - baseline:6.1f} us)")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,71 @@
+# CPU time and allocations of the car read path: loading ORM instances (identity map, instance state) and
+# copying them into CarEntity, versus the Core select that maps rows straight into slotted entities. Uses an
+# in-memory SQLite database so only the Python-side cost is measured; the SQL sent to Postgres is unchanged.
+# Run with: python -m benchmarks.read_path [cars]
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Tuple
+from uuid import uuid4
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from db.car_model import Car as CarModel
+from db.database import Base
+from domain.entities.car import CarEntity, CarStatus
+from repositories.car_repository import _SELECT_CARS, _SELECT_CAR_BY_ID
+
+def orm_page(session: Session) -> List[CarEntity]:
+    models = session.execute(select(CarModel)).scalars().all()
+    return [CarEntity(id=m.id, model=m.model, year=m.year, status=m.status, created_at=m.created_at, updated_at=m.updated_at) for m in models]
+
+def core_page(session: Session) -> List[CarEntity]:
+    return [CarEntity(*row) for row in session.execute(_SELECT_CARS)]
+
+def orm_by_id(session: Session, car_id) -> CarEntity:
+    m = session.execute(select(CarModel).filter(CarModel.id == car_id)).scalars().first()
+    return CarEntity(id=m.id, model=m.model, year=m.year, status=m.status, created_at=m.created_at, updated_at=m.updated_at)
+
+def core_by_id(session: Session, car_id) -> CarEntity:
+    return CarEntity(*session.execute(_SELECT_CAR_BY_ID, {"car_id": car_id}).first())
+
+def measure(session: Session, function: Callable[[], object], repeat: int) -> Tuple[float, float]:
+    # Every call runs in a fresh session state, like one request per session.
+    function()
+    session.expunge_all()
+    start = time.perf_counter_ns()
+    for _ in range(repeat):
+        function()
+        session.expunge_all()
+    micros = (time.perf_counter_ns() - start) / repeat / 1000
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    session.expunge_all()
+    return micros, peak / 1024
+
+def main(count: int) -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[CarModel.__table__])
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ids = [uuid4() for _ in range(count)]
+    with engine.begin() as connection:
+        connection.execute(insert(CarModel.__table__), [
+            {"id": car_id, "model": f"Model {i}", "year": 2000 + i % 25, "status": CarStatus.AVAILABLE, "created_at": start + timedelta(seconds=i), "updated_at": start}
+            for i, car_id in enumerate(ids)
+        ])
+
+    repeat = max(20, 20000 // count)
+    with Session(engine) as session:
+        for name, orm, core, runs in (
+            (f"list {count} cars", lambda: orm_page(session), lambda: core_page(session), repeat),
+            ("get car by id", lambda: orm_by_id(session, ids[0]), lambda: core_by_id(session, ids[0]), 2000),
+        ):
+            orm_micros, orm_kib = measure(session, orm, runs)
+            core_micros, core_kib = measure(session, core, runs)
+            print(f"{name:>16}: ORM {orm_micros:8.1f} us {orm_kib:8.1f} KiB peak   Core {core_micros:8.1f} us {core_kib:8.1f} KiB peak   ({orm_micros / core_micros:.1f}x CPU, {orm_kib / core_kib:.1f}x memory)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
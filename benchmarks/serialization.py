@@ -0,0 +1,59 @@
+# Serialization cost of a car list: the response-model path (validate entities into CarResponse, then
+# render) versus the opt-in orjson path that dumps the entities directly, both in isolation and through
+# GET /cars end to end.
+# Run with: python -m benchmarks.serialization [cars]
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+from unittest.mock import AsyncMock
+import httpx
+from pydantic import TypeAdapter
+from api.api import app
+from api.factories import car_service_factory
+from api.fast_json import dump_entities, response_fields
+from api.schemas.car_schemas import CarResponse
+from common.config import settings
+from domain.entities.car import CarEntity
+from services.interfaces.car_service_interface import ICarService
+
+def make_cars(count: int) -> List[CarEntity]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [CarEntity(model=f"Model {i}", year=2000 + i % 25, created_at=start + timedelta(seconds=i, microseconds=i), updated_at=start) for i in range(count)]
+
+def per_call_micros(function: Callable[[], object], repeat: int) -> float:
+    function()
+    start = time.perf_counter_ns()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter_ns() - start) / repeat / 1000
+
+async def per_request_micros(cars: List[CarEntity], fast: bool, repeat: int) -> float:
+    service = AsyncMock(spec=ICarService)
+    service.get_all_cars.return_value = cars
+    app.dependency_overrides[car_service_factory] = lambda: service
+    settings.FAST_JSON_RESPONSES = fast
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        await client.get("/cars")
+        start = time.perf_counter_ns()
+        for _ in range(repeat):
+            await client.get("/cars")
+        return (time.perf_counter_ns() - start) / repeat / 1000
+
+def main(count: int) -> None:
+    cars = make_cars(count)
+    adapter = TypeAdapter(List[CarResponse])
+    fields = response_fields(CarResponse)
+    repeat = max(10, 20000 // count)
+
+    model_path = per_call_micros(lambda: adapter.dump_json(adapter.validate_python(cars, from_attributes=True)), repeat)
+    fast_path = per_call_micros(lambda: dump_entities(cars, fields), repeat)
+    print(f"serialize {count} cars: response model {model_path:9.1f} us   orjson {fast_path:9.1f} us   ({model_path / fast_path:.1f}x)")
+
+    model_request = asyncio.run(per_request_micros(cars, False, repeat))
+    fast_request = asyncio.run(per_request_micros(cars, True, repeat))
+    print(f"GET /cars ({count} cars): response model {model_request:9.1f} us   orjson {fast_request:9.1f} us   ({model_request / fast_request:.1f}x)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -1,4 +1,5 @@
 import os
+from typing import List
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,10 +11,40 @@ class ConfigManager:
         self.POSTGRES_DB: str = self._get_required_env("POSTGRES_DB")
         self.POSTGRES_HOST: str = self._get_required_env("POSTGRES_HOST")
         self.POSTGRES_PORT: str = self._get_required_env("POSTGRES_PORT")
+        self.DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+        self.DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+        self.DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+        self.DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+        self.DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+        self.DB_SLOW_QUERY_SECONDS: float = float(os.getenv("DB_SLOW_QUERY_SECONDS", "0.25"))
+        self.DB_DEBUG_HEADERS: bool = os.getenv("DB_DEBUG_HEADERS", "false").lower() == "true"
         self.LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
         self.LOG_FILE: str = self._get_required_env("LOG_FILE")
+        self.LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+        self.ACCESS_LOG_SAMPLE_RATE: float = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
         self.RABBITMQ_HOST: str = self._get_required_env("RABBITMQ_HOST")
+        self.RABBITMQ_CHANNEL_POOL_SIZE: int = int(os.getenv("RABBITMQ_CHANNEL_POOL_SIZE", "10"))
+        self.OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+        self.OUTBOX_POLL_INTERVAL_SECONDS: float = float(os.getenv("OUTBOX_POLL_INTERVAL_SECONDS", "0.5"))
+        self.OUTBOX_MAX_BACKOFF_SECONDS: float = float(os.getenv("OUTBOX_MAX_BACKOFF_SECONDS", "30"))
+        self.WORKER_PREFETCH_COUNT: int = int(os.getenv("WORKER_PREFETCH_COUNT", "200"))
+        self.WORKER_BATCH_SIZE: int = int(os.getenv("WORKER_BATCH_SIZE", "100"))
+        self.WORKER_BATCH_TIMEOUT_SECONDS: float = float(os.getenv("WORKER_BATCH_TIMEOUT_SECONDS", "0.05"))
+        self.WORKER_DEDUP_WINDOW: int = int(os.getenv("WORKER_DEDUP_WINDOW", "100000"))
+        self.WORKER_PROCESSES: int = int(os.getenv("WORKER_PROCESSES", "1"))
+        self.WORKER_METRICS_MULTIPROC_DIR: str = os.getenv("WORKER_METRICS_MULTIPROC_DIR", "/tmp/drivenow_worker_metrics")
+        self.RENTAL_ARCHIVE_AFTER_DAYS: float = float(os.getenv("RENTAL_ARCHIVE_AFTER_DAYS", "90"))
+        self.RENTAL_ARCHIVE_BATCH_SIZE: int = int(os.getenv("RENTAL_ARCHIVE_BATCH_SIZE", "1000"))
+        self.RENTAL_ARCHIVE_INTERVAL_SECONDS: float = float(os.getenv("RENTAL_ARCHIVE_INTERVAL_SECONDS", "60"))
+        self.RENTAL_RESERVATION_BUFFER_HOURS: float = float(os.getenv("RENTAL_RESERVATION_BUFFER_HOURS", "24"))
+        self.CAR_CACHE_MAX_SIZE: int = int(os.getenv("CAR_CACHE_MAX_SIZE", "10000"))
+        self.CAR_CACHE_TTL_SECONDS: float = float(os.getenv("CAR_CACHE_TTL_SECONDS", "30"))
+        self.FAST_JSON_RESPONSES: bool = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+        self.HTTP_LATENCY_BUCKETS: List[float] = self._get_float_list("HTTP_LATENCY_BUCKETS", "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5")
         self.WORKER_METRICS_URL: str = self._get_required_env("WORKER_METRICS_URL")
+        self.WORKER_METRICS_REFRESH_SECONDS: float = float(os.getenv("WORKER_METRICS_REFRESH_SECONDS", "5"))
+        self.WORKER_METRICS_TIMEOUT_SECONDS: float = float(os.getenv("WORKER_METRICS_TIMEOUT_SECONDS", "2"))
 
     def _get_required_env(self, key: str) -> str:
         value = os.getenv(key)
@@ -21,6 +52,9 @@ class ConfigManager:
             raise ValueError(f"Missing required environment variable: {key}")
         return value
 
+    def _get_float_list(self, key: str, default: str) -> List[float]:
+        return [float(value) for value in os.getenv(key, default).split(",") if value.strip()]
+
     def get_database_url(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
@@ -10,6 +10,10 @@ class RentalAlreadyEndedException(Exception):
     def __init__(self, message: str):
         super().__init__(message)
 
+class ReservationConflictException(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+
 class DatabaseException(Exception):
     def __init__(self, message: str, original_exception: Exception | None = None):
         super().__init__(message)
@@ -18,3 +22,8 @@ class DatabaseException(Exception):
 class InputValidationException(Exception):
     def __init__(self, message: str):
         super().__init__(message)
+
+class MessagePublishException(Exception):
+    def __init__(self, message: str, original_exception: Exception | None = None):
+        super().__init__(message)
+        self.original_exception = original_exception
@@ -2,17 +2,17 @@ from abc import ABC, abstractmethod
 
 class ILogger(ABC):
     @abstractmethod
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: object) -> None:
         pass
 
     @abstractmethod
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: object) -> None:
         pass
 
     @abstractmethod
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: object) -> None:
         pass
 
     @abstractmethod
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: object) -> None:
         pass
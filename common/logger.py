@@ -1,8 +1,27 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+from prometheus_client import Counter
 from common.config import settings
 from common.interfaces.logger_interface import ILogger
 
+LOG_RECORDS_DROPPED = Counter('drivenow_log_records_dropped', 'Number of log records dropped because the logging queue was full')
+
+class BoundedQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats the message on the calling thread; leave that to the listener thread.
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Dropping beats blocking the event loop behind a stalled disk or console.
+            LOG_RECORDS_DROPPED.inc()
+
 class Logger(ILogger):
     _instance = None
 
@@ -15,31 +34,48 @@ class Logger(ILogger):
     def _setup(self):
         self.logger = logging.getLogger("drivenow")
         self.logger.setLevel(settings.LOG_LEVEL)
+        self.listener: Optional[QueueListener] = None
 
         if self.logger.hasHandlers():
             self.logger.handlers.clear()
 
         formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        handlers: List[logging.Handler] = []
+        file_error: Optional[Exception] = None
 
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
         try:
             file_handler = logging.FileHandler(settings.LOG_FILE)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
-            self.logger.error(f"Failed to setup file logging: {e}")
+            file_error = e
+
+        if settings.LOG_QUEUE_SIZE > 0:
+            # Handlers run on a listener thread; the caller only enqueues the unformatted record.
+            log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+            self.logger.addHandler(BoundedQueueHandler(log_queue))
+            self.listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self.listener.start()
+            atexit.register(self.listener.stop)
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+        if file_error is not None:
+            self.logger.error("Failed to setup file logging: %s", file_error)
 
-    def info(self, message: str) -> None:
-        self.logger.info(message)
+    def info(self, message: str, *args: object) -> None:
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
-        self.logger.warning(message)
+    def warning(self, message: str, *args: object) -> None:
+        self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
-        self.logger.error(message)
+    def error(self, message: str, *args: object) -> None:
+        self.logger.error(message, *args)
 
-    def critical(self, message: str) -> None:
-        self.logger.critical(message)
+    def critical(self, message: str, *args: object) -> None:
+        self.logger.critical(message, *args)
@@ -1,9 +1,13 @@
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from datetime import datetime
 
 class MessageEvent(BaseModel):
     event_type: str
     payload: Dict[str, Any]
+    occurred_at: Optional[datetime] = None
+    sequence: Optional[int] = None
+    txid: Optional[int] = None
 
     def to_json(self) -> str:
         return self.model_dump_json()
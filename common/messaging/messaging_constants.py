@@ -5,3 +5,4 @@ EVENT_CAR_STATUS_CHANGED_TO_AVAILABLE = "car.status.changed.to.available"
 EVENT_CAR_STATUS_CHANGED_FROM_AVAILABLE = "car.status.changed.from.available"
 EVENT_RENTAL_CREATED = "rental.created"
 EVENT_RENTAL_ENDED = "rental.ended"
+EVENT_CARS_AVAILABILITY_CHANGED = "cars.availability.changed"
@@ -0,0 +1,10 @@
+from typing import Any, Dict
+from common.interfaces.message_publisher_interface import IMessagePublisher
+from repositories.interfaces.outbox_repository_interface import IOutboxRepository
+
+class OutboxPublisher(IMessagePublisher):
+    def __init__(self, outbox_repository: IOutboxRepository) -> None:
+        self.outbox_repository = outbox_repository
+
+    async def publish_event(self, event_type: str, payload: Dict[str, Any]) -> None:
+        await self.outbox_repository.add(event_type, payload)
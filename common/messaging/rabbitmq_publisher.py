@@ -1,37 +1,92 @@
+import asyncio
 import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
+from prometheus_client import Counter
+from datetime import datetime, timezone
+from typing import List, Optional
 from common.interfaces.message_publisher_interface import IMessagePublisher
 from common.interfaces.logger_interface import ILogger
 from common.messaging.messaging_constants import METRICS_QUEUE_NAME
 from common.messaging.message_schema import MessageEvent
 from common.config import settings
+from common.exceptions import MessagePublishException
+
+RABBITMQ_CONNECTIONS_OPENED = Counter('drivenow_rabbitmq_connections_opened', 'Number of RabbitMQ connections opened by the event publisher (initial connect and reconnects)')
+RABBITMQ_CONNECTION_REUSES = Counter('drivenow_rabbitmq_connection_reuses', 'Number of event publishes served by an already open RabbitMQ connection')
 
 class RabbitMQPublisher(IMessagePublisher):
-    def __init__(self, logger: ILogger) -> None:
+    def __init__(self, logger: ILogger, channel_pool_size: int = settings.RABBITMQ_CHANNEL_POOL_SIZE) -> None:
         self.logger = logger
         self.host: str = settings.RABBITMQ_HOST
-        self.connection = None
-        self.channel = None
+        self.channel_pool_size = channel_pool_size
+        self.connection: Optional[AbstractRobustConnection] = None
+        self.channel_pool: Optional[Pool[AbstractChannel]] = None
+        self._connect_lock = asyncio.Lock()
+
+    def _is_connected(self) -> bool:
+        return self.connection is not None and not self.connection.is_closed and self.channel_pool is not None
+
+    async def _connect(self) -> bool:
+        if self._is_connected():
+            RABBITMQ_CONNECTION_REUSES.inc()
+            return True
 
-    async def _connect(self) -> None:
-        if not self.connection or self.connection.is_closed:
+        async with self._connect_lock:
+            if self._is_connected():
+                RABBITMQ_CONNECTION_REUSES.inc()
+                return True
             try:
-                self.connection = await aio_pika.connect_robust(host=self.host)
-                self.channel = await self.connection.channel()
-                await self.channel.declare_queue(METRICS_QUEUE_NAME, durable=True)
+                connection = await aio_pika.connect_robust(host=self.host)
+                channel_pool: Pool[AbstractChannel] = Pool(connection.channel, max_size=self.channel_pool_size)
+                async with channel_pool.acquire() as channel:
+                    await channel.declare_queue(METRICS_QUEUE_NAME, durable=True)
+                self.connection = connection
+                self.channel_pool = channel_pool
+                RABBITMQ_CONNECTIONS_OPENED.inc()
+                return True
             except Exception as e:
-                self.logger.error(f"Failed to connect to RabbitMQ: {e}")
+                self.logger.error("Failed to connect to RabbitMQ: %s", e)
+                return False
 
     async def publish_event(self, event_type: str, payload: dict) -> None:
-        await self._connect()
-        if not self.channel:
-            self.logger.error(f"Cannot publish event {event_type}, no RMQ channel")
+        if not await self._connect():
+            self.logger.error("Cannot publish event %s, no RMQ channel", event_type)
             return
-        
-        message_event = MessageEvent(event_type=event_type, payload=payload)
+
+        message_event = MessageEvent(event_type=event_type, payload=payload, occurred_at=datetime.now(timezone.utc))
+        try:
+            async with self.channel_pool.acquire() as channel:
+                await channel.default_exchange.publish(self._to_message(message_event), routing_key=METRICS_QUEUE_NAME)
+            self.logger.info("Published message queue event: %s", event_type)
+        except Exception as e:
+            self.logger.error("Failed to publish event: %s", e)
+            await self.close()
+
+    async def publish_batch(self, events: List[MessageEvent]) -> None:
+        if not await self._connect():
+            raise MessagePublishException(f"Cannot publish {len(events)} events, no RMQ channel")
+
+        try:
+            # Channels are opened with publisher confirms, so each publish resolves once the broker has
+            # persisted the message; issuing them together pipelines the confirms for the whole batch.
+            async with self.channel_pool.acquire() as channel:
+                await asyncio.gather(*(channel.default_exchange.publish(self._to_message(event), routing_key=METRICS_QUEUE_NAME) for event in events))
+        except Exception as e:
+            await self.close()
+            raise MessagePublishException(f"Failed to publish {len(events)} events: {e}", original_exception=e)
+
+    def _to_message(self, message_event: MessageEvent) -> aio_pika.Message:
+        return aio_pika.Message(body=message_event.to_json().encode(), delivery_mode=aio_pika.DeliveryMode.PERSISTENT)
+
+    async def close(self) -> None:
+        channel_pool, connection = self.channel_pool, self.connection
+        self.channel_pool = None
+        self.connection = None
         try:
-            message = aio_pika.Message(body=message_event.to_json().encode(), delivery_mode=aio_pika.DeliveryMode.PERSISTENT)
-            await self.channel.default_exchange.publish(message, routing_key=METRICS_QUEUE_NAME)
-            self.logger.info(f"Published message queue event: {event_type}")
+            if channel_pool and not channel_pool.is_closed:
+                await channel_pool.close()
+            if connection and not connection.is_closed:
+                await connection.close()
         except Exception as e:
-            self.logger.error(f"Failed to publish event: {e}")
-            self.connection = None
+            self.logger.warning("Error while closing RabbitMQ connection: %s", e)
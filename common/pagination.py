@@ -0,0 +1,20 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+from common.exceptions import InputValidationException
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+def encode_cursor(sort_value: datetime, item_id: UUID) -> str:
+    raw = f"{sort_value.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        sort_value, item_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(sort_value), UUID(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InputValidationException("Invalid pagination cursor")
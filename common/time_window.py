@@ -0,0 +1,10 @@
+from datetime import datetime
+from typing import Optional
+from common.exceptions import InputValidationException
+
+def validate_time_window(start: Optional[datetime], end: Optional[datetime], start_name: str, end_name: str) -> None:
+    # Naive timestamps would be read in the database session's time zone, which the caller cannot see.
+    if any(bound is not None and bound.tzinfo is None for bound in (start, end)):
+        raise InputValidationException(f"{start_name} and {end_name} must include a time zone")
+    if start is not None and end is not None and start >= end:
+        raise InputValidationException(f"{start_name} must be earlier than {end_name}")
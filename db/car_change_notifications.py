@@ -0,0 +1,2 @@
+# Notified by the cars_changed trigger (installed by migration 1) with the id of every updated or deleted car.
+CARS_CHANGED_CHANNEL = "cars_changed"
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Enum, DateTime
+from sqlalchemy import Integer, String, Enum, DateTime, Index, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from .database import Base
@@ -9,11 +9,20 @@ from domain.entities.car import CarStatus
 class Car(Base):
     __tablename__ = "cars"
 
-    id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     model: Mapped[str] = mapped_column(String, nullable=False)
     year: Mapped[int] = mapped_column(Integer, nullable=False)
-    status: Mapped[CarStatus] = mapped_column(Enum(CarStatus), default=CarStatus.AVAILABLE, nullable=False, index=True)
+    status: Mapped[CarStatus] = mapped_column(Enum(CarStatus), default=CarStatus.AVAILABLE, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     rentals = relationship("Rental", back_populates="car")
+
+    __table_args__ = (
+        Index('ix_cars_created_at_id', 'created_at', 'id'),
+        Index('ix_cars_status_created_at_id', 'status', 'created_at', 'id'),
+    )
+
+# COLLATE "C" is Postgres-only, so other dialects (the SQLite benchmarks) create the table without this index.
+Index('ix_cars_search_status_model_year', Car.status, func.lower(Car.model).collate('C'), Car.year, postgresql_include=['model', 'id', 'created_at', 'updated_at']).ddl_if(dialect="postgresql")
+Index('ix_cars_search_status_year', Car.status, Car.year, postgresql_include=['model', 'id', 'created_at', 'updated_at'])
@@ -1,10 +1,25 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from common.config import settings
+from common.logger import Logger
+from db.instrumented_pool import InstrumentedAsyncPool, observe_pool
+from db.query_metrics import install_query_hooks
 
 DATABASE_URL = settings.get_database_url()
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    poolclass=InstrumentedAsyncPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+)
+observe_pool(engine.pool, settings.DB_MAX_OVERFLOW)
+install_query_hooks(engine.sync_engine, Logger(), settings.DB_SLOW_QUERY_SECONDS)
 AsyncSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 class Base(DeclarativeBase):
@@ -0,0 +1,26 @@
+import time
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+DB_POOL_CHECKED_OUT = Gauge('drivenow_db_pool_checked_out', 'Number of database connections currently checked out of the pool')
+DB_POOL_CAPACITY = Gauge('drivenow_db_pool_capacity', 'Maximum number of database connections the pool may open (pool size plus overflow)')
+DB_POOL_WAIT = Histogram('drivenow_db_pool_wait_seconds', 'Time spent acquiring a database connection from the pool, including opening overflow connections', buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30))
+DB_POOL_TIMEOUTS = Counter('drivenow_db_pool_timeouts', 'Number of connection requests that gave up after waiting pool_timeout seconds for a free connection')
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    def _do_get(self) -> ConnectionPoolEntry:
+        # Checkouts that find the pool exhausted wait inside _do_get, so its duration is the queueing delay.
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - start)
+
+def observe_pool(pool: AsyncAdaptedQueuePool, max_overflow: int) -> None:
+    # The pool keeps its overflow limit private, so the caller passes the value it configured the engine with.
+    DB_POOL_CHECKED_OUT.set_function(pool.checkedout)
+    DB_POOL_CAPACITY.set(pool.size() + max(max_overflow, 0))
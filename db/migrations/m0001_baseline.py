@@ -0,0 +1,75 @@
+from db.car_change_notifications import CARS_CHANGED_CHANNEL
+from db.migrations.migration import Migration
+
+# The schema as create_all and the startup trigger install left it. Every statement tolerates existing objects,
+# so databases created before migrations existed are adopted as version 1 (and gain outbox.txid if missing).
+MIGRATION = Migration(
+    version=1,
+    description="baseline schema",
+    statements=(
+        """
+        DO $$ BEGIN
+            CREATE TYPE carstatus AS ENUM ('AVAILABLE', 'IN_USE', 'MAINTENANCE');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS cars (
+            id UUID NOT NULL,
+            model VARCHAR NOT NULL,
+            year INTEGER NOT NULL,
+            status carstatus NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_cars_id ON cars (id)",
+        "CREATE INDEX IF NOT EXISTS ix_cars_created_at_id ON cars (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_cars_status_created_at_id ON cars (status, created_at, id)",
+        """
+        CREATE TABLE IF NOT EXISTS rentals (
+            id UUID NOT NULL,
+            car_id UUID NOT NULL,
+            customer_name VARCHAR NOT NULL,
+            start_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            end_date TIMESTAMP WITH TIME ZONE,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (car_id) REFERENCES cars (id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_rentals_id ON rentals (id)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_car_id ON rentals (car_id)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_car_id_active ON rentals (car_id)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_car_id_end_date ON rentals (car_id, end_date)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_start_date_id ON rentals (start_date, id)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_active_start_date_id ON rentals (start_date, id) WHERE end_date IS NULL",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_car_id_start_date_id ON rentals (car_id, start_date, id)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_customer_name_lower ON rentals (lower(customer_name) text_pattern_ops)",
+        """
+        CREATE TABLE IF NOT EXISTS outbox (
+            id BIGSERIAL NOT NULL,
+            event_type VARCHAR NOT NULL,
+            payload JSONB NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (id)
+        )
+        """,
+        "ALTER TABLE outbox ADD COLUMN IF NOT EXISTS txid BIGINT DEFAULT pg_current_xact_id()::text::bigint NOT NULL",
+        f"""
+        CREATE OR REPLACE FUNCTION notify_cars_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CARS_CHANGED_CHANNEL}', OLD.id::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE OR REPLACE TRIGGER cars_changed
+        AFTER UPDATE OR DELETE ON cars
+        FOR EACH ROW EXECUTE FUNCTION notify_cars_changed()
+        """,
+    ),
+)
@@ -0,0 +1,19 @@
+from db.migrations.migration import Migration
+
+# One partial unique index replaces the three car_id indexes: it serves every "open rental for this car" lookup,
+# makes a second open rental per car impossible, and is only touched by rentals that are still open.
+# ix_rentals_car_id_start_date_id keeps car_id as a leading column for the foreign key and per-car listings,
+# the id indexes duplicated the primary keys, and ix_cars_status is a prefix of ix_cars_status_created_at_id.
+MIGRATION = Migration(
+    version=2,
+    description="replace redundant rentals car_id indexes with a partial unique index",
+    statements=(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_rentals_car_id_active ON rentals (car_id) WHERE end_date IS NULL",
+        "DROP INDEX IF EXISTS ix_rentals_car_id",
+        "DROP INDEX IF EXISTS ix_rentals_car_id_active",
+        "DROP INDEX IF EXISTS ix_rentals_car_id_end_date",
+        "DROP INDEX IF EXISTS ix_rentals_id",
+        "DROP INDEX IF EXISTS ix_cars_id",
+        "DROP INDEX IF EXISTS ix_cars_status",
+    ),
+)
@@ -0,0 +1,26 @@
+from db.migrations.migration import Migration
+
+# rentals keeps open rentals and recently ended ones; the archiver moves older history into rentals_archive,
+# whose monthly partitions it creates on demand. ix_rentals_end_date lets it find those rows without a scan.
+MIGRATION = Migration(
+    version=3,
+    description="add partitioned rentals_archive for ended rentals",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS rentals_archive (
+            id UUID NOT NULL,
+            start_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            car_id UUID NOT NULL,
+            customer_name VARCHAR NOT NULL,
+            end_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (id, start_date)
+        ) PARTITION BY RANGE (start_date)
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_rentals_archive_start_date_id ON rentals_archive (start_date, id)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_archive_car_id_start_date_id ON rentals_archive (car_id, start_date, id)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_archive_customer_name_lower ON rentals_archive (lower(customer_name) text_pattern_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_rentals_end_date ON rentals (end_date) WHERE end_date IS NOT NULL",
+    ),
+)
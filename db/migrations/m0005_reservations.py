@@ -0,0 +1,25 @@
+from db.migrations.migration import Migration
+
+# Overlapping bookings for the same car are rejected by the exclusion constraint itself, so the check holds under
+# concurrency without locking and costs one GiST probe. btree_gist provides the "=" operator class for car_id.
+MIGRATION = Migration(
+    version=5,
+    description="add reservations with a per-car non-overlap constraint",
+    statements=(
+        "CREATE EXTENSION IF NOT EXISTS btree_gist",
+        """
+        CREATE TABLE IF NOT EXISTS reservations (
+            id UUID NOT NULL,
+            car_id UUID NOT NULL,
+            customer_name VARCHAR NOT NULL,
+            period TSTZRANGE NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY (car_id) REFERENCES cars (id),
+            CONSTRAINT ex_reservations_car_period EXCLUDE USING gist (car_id WITH =, period WITH &&),
+            CONSTRAINT ck_reservations_period_bounded CHECK (NOT isempty(period) AND NOT lower_inf(period) AND NOT upper_inf(period))
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_reservations_period ON reservations USING gist (period)",
+    ),
+)
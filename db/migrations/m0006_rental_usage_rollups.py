@@ -0,0 +1,71 @@
+from db.migrations.migration import Migration
+from db.rental_rollup_model import ROLLUP_SLOTS
+from domain.entities.analytics import DURATION_BUCKET_BOUNDS_SECONDS
+
+# Pre-aggregated rental usage for the analytics endpoints, so a year of history is read from a few thousand
+# rollup rows instead of the rentals tables. Rentals ending from now on are added by end_active_rental in the
+# same statement that closes them; the rentals that already ended (including archived ones) are backfilled here.
+_ENDED_RENTALS = "(SELECT car_id, start_date, end_date FROM rentals WHERE end_date IS NOT NULL UNION ALL SELECT car_id, start_date, end_date FROM rentals_archive) AS r"
+_SLOT = f"hashtext(r.car_id::text) & {ROLLUP_SLOTS - 1}"
+_BUCKET_BOUNDS = "ARRAY[" + ", ".join(str(bound) for bound in DURATION_BUCKET_BOUNDS_SECONDS) + "]"
+
+MIGRATION = Migration(
+    version=6,
+    description="add rental usage rollups for analytics",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS rental_usage_hourly (
+            hour TIMESTAMP WITH TIME ZONE NOT NULL,
+            slot SMALLINT NOT NULL,
+            rented_seconds DOUBLE PRECISION NOT NULL,
+            rentals_started INTEGER NOT NULL,
+            PRIMARY KEY (hour, slot)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS rental_usage_daily_by_car (
+            day DATE NOT NULL,
+            car_id UUID NOT NULL,
+            rented_seconds DOUBLE PRECISION NOT NULL,
+            rentals INTEGER NOT NULL,
+            PRIMARY KEY (day, car_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS rental_durations_daily (
+            day DATE NOT NULL,
+            slot SMALLINT NOT NULL,
+            bucket SMALLINT NOT NULL,
+            rentals INTEGER NOT NULL,
+            PRIMARY KEY (day, slot, bucket)
+        )
+        """,
+        f"""
+        INSERT INTO rental_usage_hourly (hour, slot, rented_seconds, rentals_started)
+        SELECT h.hour, {_SLOT},
+               sum(greatest(0, extract(epoch FROM least(r.end_date, h.hour + interval '1 hour') - greatest(r.start_date, h.hour)))),
+               count(*) FILTER (WHERE h.hour = date_trunc('hour', r.start_date, 'UTC'))
+        FROM {_ENDED_RENTALS}
+        CROSS JOIN generate_series(date_trunc('hour', r.start_date, 'UTC'), r.end_date, interval '1 hour') AS h(hour)
+        WHERE h.hour < r.end_date OR h.hour = date_trunc('hour', r.start_date, 'UTC')
+        GROUP BY 1, 2
+        """,
+        f"""
+        INSERT INTO rental_usage_daily_by_car (day, car_id, rented_seconds, rentals)
+        SELECT (d.day AT TIME ZONE 'UTC')::date, r.car_id,
+               sum(greatest(0, extract(epoch FROM least(r.end_date, d.day + interval '1 day') - greatest(r.start_date, d.day)))),
+               count(*) FILTER (WHERE d.day = date_trunc('day', r.end_date, 'UTC'))
+        FROM {_ENDED_RENTALS}
+        CROSS JOIN generate_series(date_trunc('day', r.start_date, 'UTC'), r.end_date, interval '1 day') AS d(day)
+        WHERE d.day < r.end_date OR d.day = date_trunc('day', r.end_date, 'UTC')
+        GROUP BY 1, 2
+        """,
+        f"""
+        INSERT INTO rental_durations_daily (day, slot, bucket, rentals)
+        SELECT (r.end_date AT TIME ZONE 'UTC')::date, {_SLOT},
+               width_bucket(greatest(0, extract(epoch FROM r.end_date - r.start_date)), {_BUCKET_BOUNDS}), count(*)
+        FROM {_ENDED_RENTALS}
+        GROUP BY 1, 2, 3
+        """,
+    ),
+)
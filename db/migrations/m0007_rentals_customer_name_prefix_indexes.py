@@ -0,0 +1,15 @@
+from db.migrations.migration import Migration
+
+# The customer name filter is a range on lower(customer_name) COLLATE "C" instead of LIKE 'prefix%': with a bound
+# parameter, the generic plans used for cached prepared statements cannot turn LIKE into index bounds, while a
+# range on a "C"-collated key can. The text_pattern_ops indexes only served LIKE, so they are replaced.
+MIGRATION = Migration(
+    version=7,
+    description="index customer name prefixes for range scans",
+    statements=(
+        'CREATE INDEX IF NOT EXISTS ix_rentals_customer_name_prefix ON rentals ((lower(customer_name) COLLATE "C"))',
+        'CREATE INDEX IF NOT EXISTS ix_rentals_archive_customer_name_prefix ON rentals_archive ((lower(customer_name) COLLATE "C"))',
+        "DROP INDEX IF EXISTS ix_rentals_customer_name_lower",
+        "DROP INDEX IF EXISTS ix_rentals_archive_customer_name_lower",
+    ),
+)
@@ -0,0 +1,12 @@
+from db.migrations.migration import Migration
+
+# The archiver takes ended rentals in (end_date, id) order so batches are deterministic when many rentals share an
+# end_date; adding id to the index keeps that an ordered index scan instead of a sort of every matching row.
+MIGRATION = Migration(
+    version=8,
+    description="order archivable rentals by end date and id",
+    statements=(
+        "CREATE INDEX IF NOT EXISTS ix_rentals_end_date_id ON rentals (end_date, id) WHERE end_date IS NOT NULL",
+        "DROP INDEX IF EXISTS ix_rentals_end_date",
+    ),
+)
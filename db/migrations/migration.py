@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    statements: Tuple[str, ...]
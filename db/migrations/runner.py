@@ -0,0 +1,58 @@
+from typing import Sequence
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from common.interfaces.logger_interface import ILogger
+from db.migrations import m0001_baseline, m0002_rentals_car_id_indexes, m0003_rentals_archive, m0004_cars_search_indexes, m0005_reservations, m0006_rental_usage_rollups, m0007_rentals_customer_name_prefix_indexes, m0008_rentals_end_date_id_index
+from db.migrations.migration import Migration
+
+MIGRATIONS: Sequence[Migration] = (
+    m0001_baseline.MIGRATION,
+    m0002_rentals_car_id_indexes.MIGRATION,
+    m0003_rentals_archive.MIGRATION,
+    m0004_cars_search_indexes.MIGRATION,
+    m0005_reservations.MIGRATION,
+    m0006_rental_usage_rollups.MIGRATION,
+    m0007_rentals_customer_name_prefix_indexes.MIGRATION,
+    m0008_rentals_end_date_id_index.MIGRATION,
+)
+
+_CREATE_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    description VARCHAR NOT NULL,
+    applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+)
+"""
+
+async def current_version(conn: AsyncConnection) -> int:
+    try:
+        return (await conn.execute(text("SELECT coalesce(max(version), 0) FROM schema_migrations"))).scalar_one()
+    except ProgrammingError:
+        # The version table does not exist yet, so nothing has been applied.
+        return 0
+
+async def run_migrations(engine: AsyncEngine, logger: ILogger, migrations: Sequence[Migration] = MIGRATIONS) -> None:
+    head = migrations[-1].version
+
+    # Normal startups stop after this single query.
+    async with engine.connect() as conn:
+        if await current_version(conn) >= head:
+            return
+
+    # Every API process may get here at once; the lock lets one migrate while the rest wait, re-read the
+    # version and find nothing left to do. Postgres DDL is transactional, so a failed run leaves no trace.
+    async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('drivenow_schema_migrations'))"))
+        await conn.execute(text(_CREATE_VERSION_TABLE))
+        current = await current_version(conn)
+        for migration in migrations:
+            if migration.version <= current:
+                continue
+            logger.info("Applying database migration %d: %s", migration.version, migration.description)
+            for statement in migration.statements:
+                await conn.exec_driver_sql(statement)
+            await conn.execute(
+                text("INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"),
+                {"version": migration.version, "description": migration.description},
+            )
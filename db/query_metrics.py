@@ -0,0 +1,100 @@
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from common.interfaces.logger_interface import ILogger
+
+UNLABELLED_OPERATION = "other"
+
+DB_QUERY_DURATION = Histogram('drivenow_db_query_duration_seconds', 'Duration of database statements, labelled by the repository method that issued them', ['operation'], buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5))
+
+_current_operation: ContextVar[str] = ContextVar("db_operation", default=UNLABELLED_OPERATION)
+_request_stats: ContextVar[Optional["QueryStats"]] = ContextVar("db_request_stats", default=None)
+
+RepositoryClass = TypeVar("RepositoryClass", bound=type)
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    seconds: float = 0.0
+
+def track_queries() -> QueryStats:
+    # Statements issued later in the same context (the request's task and its copies) add to this object.
+    stats = QueryStats()
+    _request_stats.set(stats)
+    return stats
+
+def _label_coroutine(method: Callable[..., Any], label: str) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _current_operation.set(label)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _current_operation.reset(token)
+    return wrapper
+
+def _label_async_generator(method: Callable[..., Any], label: str) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # The label is only set while the generator runs, not while the caller handles each item.
+        iterator = method(*args, **kwargs).__aiter__()
+        while True:
+            token = _current_operation.set(label)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _current_operation.reset(token)
+            yield item
+    return wrapper
+
+def instrument_queries(cls: RepositoryClass) -> RepositoryClass:
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        label = f"{cls.__name__}.{name}"
+        if inspect.isasyncgenfunction(method):
+            setattr(cls, name, _label_async_generator(method, label))
+        elif inspect.iscoroutinefunction(method):
+            setattr(cls, name, _label_coroutine(method, label))
+    return cls
+
+def redact_parameters(parameters: Any, executemany: bool) -> str:
+    # Values may be customer names or other personal data; their types are enough to tell statements apart.
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    return "(" + ", ".join(type(value).__name__ for value in parameters or ()) + ")"
+
+def install_query_hooks(engine: Engine, logger: ILogger, slow_query_seconds: float) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        operation = _current_operation.get()
+        DB_QUERY_DURATION.labels(operation=operation).observe(elapsed)
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+        if elapsed >= slow_query_seconds:
+            logger.warning("Slow query in %s took %.1fms: %s parameters=%s", operation, elapsed * 1000, " ".join(statement.split()), redact_parameters(parameters, executemany))
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context: Any) -> None:
+        # A failed statement never reaches after_cursor_execute, so drop its start time here.
+        if context.connection is not None and context.connection.info.get("query_start"):
+            context.connection.info["query_start"].pop()
@@ -0,0 +1,27 @@
+from sqlalchemy import String, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from .database import Base
+from datetime import datetime
+import uuid
+
+class RentalArchive(Base):
+    __tablename__ = "rentals_archive"
+
+    # Ended rentals moved out of the hot rentals table, partitioned by month of start_date. The partition key
+    # must be part of the primary key.
+    id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    start_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    car_id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    customer_name: Mapped[str] = mapped_column(String, nullable=False)
+    end_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index('ix_rentals_archive_start_date_id', 'start_date', 'id'),
+        Index('ix_rentals_archive_car_id_start_date_id', 'car_id', 'start_date', 'id'),
+        {'postgresql_partition_by': 'RANGE (start_date)'},
+    )
+
+Index('ix_rentals_archive_customer_name_prefix', func.lower(RentalArchive.customer_name).collate('C')).ddl_if(dialect="postgresql")
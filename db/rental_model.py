@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey, DateTime, Index
+from sqlalchemy import String, ForeignKey, DateTime, Index, func, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from .database import Base
@@ -9,8 +9,8 @@ import uuid
 class Rental(Base):
     __tablename__ = "rentals"
 
-    id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
-    car_id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("cars.id"), nullable=False, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    car_id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("cars.id"), nullable=False)
     customer_name: Mapped[str] = mapped_column(String, nullable=False)
     start_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     end_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -20,6 +20,11 @@ class Rental(Base):
     car = relationship("Car", back_populates="rentals")
     
     __table_args__ = (
-        Index('ix_rentals_car_id_end_date', 'car_id', 'end_date'),
-        Index('ix_rentals_car_id_active', 'car_id'),
+        Index('ux_rentals_car_id_active', 'car_id', unique=True, postgresql_where=text('end_date IS NULL')),
+        Index('ix_rentals_start_date_id', 'start_date', 'id'),
+        Index('ix_rentals_active_start_date_id', 'start_date', 'id', postgresql_where=text('end_date IS NULL')),
+        Index('ix_rentals_car_id_start_date_id', 'car_id', 'start_date', 'id'),
+        Index('ix_rentals_end_date_id', 'end_date', 'id', postgresql_where=text('end_date IS NOT NULL')),
     )
+
+Index('ix_rentals_customer_name_prefix', func.lower(Rental.customer_name).collate('C')).ddl_if(dialect="postgresql")
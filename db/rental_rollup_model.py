@@ -0,0 +1,37 @@
+from sqlalchemy import Date, DateTime, Float, Integer, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from .database import Base
+from datetime import date, datetime
+import uuid
+
+# Fleet-wide rows are split into this many slots by car so that rentals ending at the same time do not all
+# queue on one row lock; readers sum over the slots. Must stay a power of two (slot = hashtext(car_id) & (N - 1)).
+ROLLUP_SLOTS = 8
+
+class RentalUsageHourly(Base):
+    __tablename__ = "rental_usage_hourly"
+
+    # Rented seconds falling inside each UTC hour, and the rentals that started in it, for ended rentals.
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    rented_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    rentals_started: Mapped[int] = mapped_column(Integer, nullable=False)
+
+class RentalUsageDailyByCar(Base):
+    __tablename__ = "rental_usage_daily_by_car"
+
+    # Rented seconds of each car per UTC day; a rental is counted once, on the day it ended.
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    car_id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    rented_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    rentals: Mapped[int] = mapped_column(Integer, nullable=False)
+
+class RentalDurationsDaily(Base):
+    __tablename__ = "rental_durations_daily"
+
+    # Histogram of rental durations per UTC day the rentals ended (buckets in DURATION_BUCKET_BOUNDS_SECONDS).
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    bucket: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    rentals: Mapped[int] = mapped_column(Integer, nullable=False)
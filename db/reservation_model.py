@@ -0,0 +1,23 @@
+from sqlalchemy import String, ForeignKey, DateTime, CheckConstraint, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, TSTZRANGE, ExcludeConstraint, Range
+from .database import Base
+from datetime import datetime, timezone
+import uuid
+
+class Reservation(Base):
+    __tablename__ = "reservations"
+
+    id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    car_id: Mapped[uuid.UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey("cars.id"), nullable=False)
+    customer_name: Mapped[str] = mapped_column(String, nullable=False)
+    # Half-open [start, end) window, so back-to-back bookings do not overlap.
+    period: Mapped[Range[datetime]] = mapped_column(TSTZRANGE, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    __table_args__ = (
+        # The GiST index behind the constraint also answers "does this car have a booking overlapping T1..T2".
+        ExcludeConstraint(('car_id', '='), ('period', '&&'), name='ex_reservations_car_period', using='gist'),
+        CheckConstraint('NOT isempty(period) AND NOT lower_inf(period) AND NOT upper_inf(period)', name='ck_reservations_period_bounded'),
+        Index('ix_reservations_period', 'period', postgresql_using='gist'),
+    )
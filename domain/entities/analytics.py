@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+# Lower bounds of the rental duration histogram buckets, in seconds: 0, 15m, 30m, 1h, 2h, 4h, 8h, 12h, 1d, 2d, 4d,
+# 1w, 2w, 30d. Bucket i (1-based, as returned by Postgres width_bucket) holds durations in [bounds[i-1], bounds[i]).
+DURATION_BUCKET_BOUNDS_SECONDS: Tuple[int, ...] = (0, 900, 1800, 3600, 7200, 14400, 28800, 43200, 86400, 172800, 345600, 604800, 1209600, 2592000)
+
+@dataclass(slots=True)
+class CarUtilization:
+    car_id: UUID
+    model: str
+    rented_seconds: float
+    rentals: int
+    utilization: float
+
+@dataclass(slots=True)
+class ModelUtilization:
+    model: str
+    cars: int
+    rented_seconds: float
+    rentals: int
+    utilization: float
+
+@dataclass(slots=True)
+class DurationBucket:
+    lower_seconds: int
+    upper_seconds: Optional[int]
+    rentals: int
+
+@dataclass(slots=True)
+class RentalDurationStats:
+    rentals: int
+    p50_seconds: Optional[float] = None
+    p90_seconds: Optional[float] = None
+    p99_seconds: Optional[float] = None
+    buckets: List[DurationBucket] = field(default_factory=list)
+
+@dataclass(slots=True)
+class HourlyActivity:
+    hour_of_day: int
+    rentals_started: int
+    average_cars_in_use: float
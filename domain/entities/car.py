@@ -9,7 +9,7 @@ class CarStatus(enum.Enum):
     IN_USE = "in_use"
     MAINTENANCE = "under_maintenance"
 
-@dataclass
+@dataclass(slots=True)
 class CarEntity:
     model: str
     year: int
@@ -17,3 +17,17 @@ class CarEntity:
     status: CarStatus = CarStatus.AVAILABLE
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+@dataclass
+class CarFilter:
+    status: Optional[CarStatus] = None
+    model_prefix: Optional[str] = None
+    min_year: Optional[int] = None
+    max_year: Optional[int] = None
+
+@dataclass
+class CarStatusTransition:
+    car_id: UUID
+    previous_status: CarStatus
+    rented: bool
+    updated: bool
@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import FrozenSet
+
+@dataclass(frozen=True)
+class FleetSnapshot:
+    available_cars: int
+    active_rentals: int
+    xmin: int
+    xmax: int
+    xip: FrozenSet[int] = field(default_factory=frozenset)
+
+    def includes_transaction(self, txid: int) -> bool:
+        # Same visibility rule as pg_visible_in_snapshot(): committed before xmin, or below xmax and not in progress.
+        if txid < self.xmin:
+            return True
+        if txid >= self.xmax:
+            return False
+        return txid not in self.xip
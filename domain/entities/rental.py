@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-@dataclass
+@dataclass(slots=True)
 class RentalEntity:
     car_id: UUID
     customer_name: str
@@ -12,3 +12,12 @@ class RentalEntity:
     end_date: Optional[datetime] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+@dataclass
+class RentalFilter:
+    active: Optional[bool] = None
+    car_id: Optional[UUID] = None
+    customer_name: Optional[str] = None
+    from_time: Optional[datetime] = None
+    to_time: Optional[datetime] = None
+    include_archived: bool = False
@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from uuid import UUID, uuid4
+
+@dataclass(slots=True)
+class ReservationEntity:
+    car_id: UUID
+    customer_name: str
+    start_time: datetime
+    end_time: datetime
+    id: UUID = field(default_factory=uuid4)
+    created_at: Optional[datetime] = None
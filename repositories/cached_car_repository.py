@@ -0,0 +1,63 @@
+from typing import AsyncIterator, List, Optional, Set, Tuple
+from uuid import UUID
+from datetime import datetime
+from domain.entities.car import CarEntity, CarFilter, CarStatus, CarStatusTransition
+from repositories.interfaces.car_repository_interface import ICarRepository
+from repositories.interfaces.car_cache_interface import ICarCache
+
+class CachedCarRepository(ICarRepository):
+    def __init__(self, repository: ICarRepository, cache: ICarCache) -> None:
+        self.repository = repository
+        self.cache = cache
+        self._written_ids: Set[UUID] = set()
+
+    async def get_all(self, status: Optional[CarStatus] = None) -> List[CarEntity]:
+        return await self.repository.get_all(status)
+
+    async def get_page(self, status: Optional[CarStatus], limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[CarEntity]:
+        return await self.repository.get_page(status, limit, after)
+
+    async def search(self, filters: CarFilter, limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[CarEntity]:
+        return await self.repository.search(filters, limit, after)
+
+    def stream_all(self, status: Optional[CarStatus] = None) -> AsyncIterator[CarEntity]:
+        return self.repository.stream_all(status)
+
+    async def get_by_id(self, car_id: UUID, for_update: bool = False) -> Optional[CarEntity]:
+        # Locked reads must see the current row, and cars written in this session are not committed yet.
+        if for_update or car_id in self._written_ids:
+            return await self.repository.get_by_id(car_id, for_update=for_update)
+
+        car = self.cache.get(car_id)
+        if car is not None:
+            return car
+
+        generation = self.cache.generation()
+        car = await self.repository.get_by_id(car_id)
+        if car is not None:
+            self.cache.put(car, generation)
+        return car
+
+    async def create(self, model: str, year: int) -> CarEntity:
+        car = await self.repository.create(model, year)
+        self._written_ids.add(car.id)
+        return car
+
+    async def create_many(self, cars: List[Tuple[str, int]]) -> List[CarEntity]:
+        created = await self.repository.create_many(cars)
+        self._written_ids.update(car.id for car in created)
+        return created
+
+    async def update(self, car: CarEntity) -> CarEntity:
+        self._mark_written([car.id])
+        return await self.repository.update(car)
+
+    async def update_status_many(self, new_status: CarStatus, car_ids: Optional[List[UUID]] = None, current_status: Optional[CarStatus] = None) -> List[CarStatusTransition]:
+        transitions = await self.repository.update_status_many(new_status, car_ids=car_ids, current_status=current_status)
+        self._mark_written([transition.car_id for transition in transitions if transition.updated])
+        return transitions
+
+    def _mark_written(self, car_ids: List[UUID]) -> None:
+        # Other processes (and this one, once committed) are invalidated by the cars_changed notification.
+        self._written_ids.update(car_ids)
+        self.cache.invalidate(car_ids)
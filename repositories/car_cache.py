@@ -0,0 +1,66 @@
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable, Iterable, Optional, OrderedDict as OrderedDictType, Tuple
+from uuid import UUID
+from prometheus_client import Counter
+from domain.entities.car import CarEntity
+from repositories.interfaces.car_cache_interface import ICarCache
+from common.config import settings
+
+CAR_CACHE_HITS = Counter('drivenow_car_cache_hits', 'Number of car lookups served from the in-process car cache')
+CAR_CACHE_MISSES = Counter('drivenow_car_cache_misses', 'Number of car lookups that fell through to the database')
+CAR_CACHE_EVICTIONS = Counter('drivenow_car_cache_evictions', 'Number of cached cars dropped before being invalidated', ['reason'])
+CAR_CACHE_INVALIDATIONS = Counter('drivenow_car_cache_invalidations', 'Number of cached cars dropped because the car was written')
+
+class CarCache(ICarCache):
+    def __init__(self, max_size: int = settings.CAR_CACHE_MAX_SIZE, ttl_seconds: float = settings.CAR_CACHE_TTL_SECONDS, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: OrderedDictType[UUID, Tuple[float, CarEntity]] = OrderedDict()
+        self._generation = 0
+
+    def get(self, car_id: UUID) -> Optional[CarEntity]:
+        entry = self._entries.get(car_id)
+        if entry is None:
+            CAR_CACHE_MISSES.inc()
+            return None
+
+        expires_at, car = entry
+        if expires_at <= self.clock():
+            del self._entries[car_id]
+            CAR_CACHE_EVICTIONS.labels(reason="expired").inc()
+            CAR_CACHE_MISSES.inc()
+            return None
+
+        self._entries.move_to_end(car_id)
+        CAR_CACHE_HITS.inc()
+        # Callers may mutate the entity they get back (update_car does), so never hand out the cached instance.
+        return replace(car)
+
+    def generation(self) -> int:
+        return self._generation
+
+    def put(self, car: CarEntity, generation: int) -> None:
+        # A row read before an invalidation landed may already be stale, so it is not cached.
+        if self.max_size <= 0 or generation != self._generation:
+            return
+
+        self._entries[car.id] = (self.clock() + self.ttl_seconds, replace(car))
+        self._entries.move_to_end(car.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            CAR_CACHE_EVICTIONS.labels(reason="size").inc()
+
+    def invalidate(self, car_ids: Iterable[UUID]) -> None:
+        self._generation += 1
+        for car_id in car_ids:
+            if self._entries.pop(car_id, None) is not None:
+                CAR_CACHE_INVALIDATIONS.inc()
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+car_cache = CarCache()
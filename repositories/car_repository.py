@@ -1,73 +1,186 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
+from sqlalchemy import DateTime, bindparam, exists, func, insert, literal, not_, or_, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError
 from db.car_model import Car as CarModel
-from domain.entities.car import CarEntity, CarStatus
+from db.rental_model import Rental as RentalModel
+from domain.entities.car import CarEntity, CarFilter, CarStatus, CarStatusTransition
 from datetime import datetime, timezone
 
 from repositories.interfaces.car_repository_interface import ICarRepository
 from common.exceptions import DatabaseException
+from db.query_metrics import instrument_queries
 
-def _to_entity(model: CarModel) -> CarEntity:
-    return CarEntity(
-        id=model.id,
-        model=model.model,
-        year=model.year,
-        status=model.status,
-        created_at=model.created_at,
-        updated_at=model.updated_at
-    )
+STREAM_BATCH_SIZE = 500
 
+_cars = CarModel.__table__
+
+# Reads are plain Core selects: no ORM instances or identity-map bookkeeping, and the column order matches
+# CarEntity's fields so each row maps positionally. Fixed statements are built once, so every call sends the
+# same SQL text and hits asyncpg's prepared-statement cache.
+CAR_COLUMNS = (_cars.c.model, _cars.c.year, _cars.c.id, _cars.c.status, _cars.c.created_at, _cars.c.updated_at)
+_SELECT_CARS = select(*CAR_COLUMNS)
+_SELECT_CAR_BY_ID = _SELECT_CARS.where(_cars.c.id == bindparam("car_id"))
+_SELECT_CAR_BY_ID_FOR_UPDATE = _SELECT_CAR_BY_ID.with_for_update()
+
+# Matches the expression of the search indexes; "C" collation orders by code point, so a prefix is a plain range.
+_MODEL_SEARCH_KEY = func.lower(_cars.c.model).collate("C")
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    # The smallest string that sorts after every string starting with the prefix.
+    if ord(prefix[-1]) == 0x10FFFF:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+@instrument_queries
 class CarRepository(ICarRepository):
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def get_all(self, status: Optional[CarStatus] = None) -> List[CarEntity]:
         try:
-            query = select(CarModel)
+            query = _SELECT_CARS
             if status:
-                query = query.filter(CarModel.status == status)
+                query = query.where(_cars.c.status == status)
             result = await self.db.execute(query)
-            return [_to_entity(car) for car in result.scalars().all()]
+            return [CarEntity(*row) for row in result]
         except SQLAlchemyError as e:
             raise DatabaseException(f"Error retrieving cars: {e}", original_exception=e)
 
-    async def get_by_id(self, car_id: UUID) -> Optional[CarEntity]:
+    async def get_page(self, status: Optional[CarStatus], limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[CarEntity]:
         try:
-            query = select(CarModel).filter(CarModel.id == car_id)
+            query = _SELECT_CARS.order_by(_cars.c.created_at, _cars.c.id).limit(limit)
+            if status:
+                query = query.where(_cars.c.status == status)
+            if after:
+                # Row-value comparison lets Postgres seek straight into the (created_at, id) index.
+                query = query.where(tuple_(_cars.c.created_at, _cars.c.id) > tuple_(*after))
             result = await self.db.execute(query)
-            model = result.scalars().first()
-            return _to_entity(model) if model else None
+            return [CarEntity(*row) for row in result]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error retrieving cars page: {e}", original_exception=e)
+
+    async def search(self, filters: CarFilter, limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[CarEntity]:
+        try:
+            # The filters are served by the covering search indexes (status, model, year / status, year), so
+            # matching cars are read without visiting the heap and only they are sorted for the page.
+            query = _SELECT_CARS.order_by(_cars.c.created_at, _cars.c.id).limit(limit)
+            if filters.status:
+                query = query.where(_cars.c.status == filters.status)
+            if filters.model_prefix:
+                # A range rather than LIKE, so the index bounds hold in generic plans with a bound parameter.
+                prefix = filters.model_prefix.lower()
+                query = query.where(_MODEL_SEARCH_KEY >= prefix)
+                upper_bound = prefix_upper_bound(prefix)
+                if upper_bound is not None:
+                    query = query.where(_MODEL_SEARCH_KEY < upper_bound)
+            if filters.min_year is not None:
+                query = query.where(_cars.c.year >= filters.min_year)
+            if filters.max_year is not None:
+                query = query.where(_cars.c.year <= filters.max_year)
+            if after:
+                query = query.where(tuple_(_cars.c.created_at, _cars.c.id) > tuple_(*after))
+            result = await self.db.execute(query)
+            return [CarEntity(*row) for row in result]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error searching cars: {e}", original_exception=e)
+
+    async def stream_all(self, status: Optional[CarStatus] = None) -> AsyncIterator[CarEntity]:
+        try:
+            query = _SELECT_CARS.order_by(_cars.c.created_at, _cars.c.id)
+            if status:
+                query = query.where(_cars.c.status == status)
+            result = await self.db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+            async for row in result:
+                yield CarEntity(*row)
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error streaming cars: {e}", original_exception=e)
+
+    async def get_by_id(self, car_id: UUID, for_update: bool = False) -> Optional[CarEntity]:
+        try:
+            query = _SELECT_CAR_BY_ID_FOR_UPDATE if for_update else _SELECT_CAR_BY_ID
+            row = (await self.db.execute(query, {"car_id": car_id})).first()
+            return CarEntity(*row) if row else None
         except SQLAlchemyError as e:
             raise DatabaseException(f"Error retrieving car by ID {car_id}: {e}", original_exception=e)
 
     async def create(self, model: str, year: int) -> CarEntity:
         try:
-            car_model = CarModel(model=model, year=year, status=CarStatus.AVAILABLE)
-            self.db.add(car_model)
-            await self.db.commit()
-            await self.db.refresh(car_model)
-            return _to_entity(car_model)
+            now = datetime.now(timezone.utc)
+            car = CarEntity(model=model, year=year, status=CarStatus.AVAILABLE, created_at=now, updated_at=now)
+            await self.db.execute(insert(_cars).values(id=car.id, model=car.model, year=car.year, status=car.status, created_at=now, updated_at=now))
+            return car
         except SQLAlchemyError as e:
             await self.db.rollback()
             raise DatabaseException(f"Error creating car: {e}", original_exception=e)
 
+    async def create_many(self, cars: List[Tuple[str, int]]) -> List[CarEntity]:
+        try:
+            # Values are generated here so one multi-row INSERT is enough, with no RETURNING or refresh.
+            now = datetime.now(timezone.utc)
+            entities = [CarEntity(model=model, year=year, status=CarStatus.AVAILABLE, created_at=now, updated_at=now) for model, year in cars]
+            rows = [{"id": car.id, "model": car.model, "year": car.year, "status": car.status, "created_at": car.created_at, "updated_at": car.updated_at} for car in entities]
+            await self.db.execute(insert(_cars).values(rows))
+            return entities
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseException(f"Error creating {len(cars)} cars: {e}", original_exception=e)
+
     async def update(self, car: CarEntity) -> CarEntity:
         try:
             car.updated_at = datetime.now(timezone.utc)
-            db_car = CarModel(
-                id=car.id,
-                model=car.model,
-                year=car.year,
-                status=car.status,
-                created_at=car.created_at,
-                updated_at=car.updated_at
+            query = (
+                update(_cars)
+                .where(_cars.c.id == car.id)
+                .values(model=car.model, year=car.year, status=car.status, updated_at=car.updated_at)
+                .returning(*CAR_COLUMNS)
             )
-            db_car = await self.db.merge(db_car)
-            await self.db.commit()
-            return _to_entity(db_car)
+            row = (await self.db.execute(query)).one()
+            return CarEntity(*row)
         except SQLAlchemyError as e:
             await self.db.rollback()
             raise DatabaseException(f"Error updating car {car.id}: {e}", original_exception=e)
+
+    async def update_status_many(self, new_status: CarStatus, car_ids: Optional[List[UUID]] = None, current_status: Optional[CarStatus] = None) -> List[CarStatusTransition]:
+        try:
+            cars = CarModel.__table__
+            rentals = RentalModel.__table__
+            now = literal(datetime.now(timezone.utc), DateTime(timezone=True))
+
+            # Targets are locked first so a concurrent rental either commits before us (and the re-read
+            # row is IN_USE) or waits for us; an IN_USE car or an open rental both count as rented.
+            active_rental = exists().where(rentals.c.car_id == cars.c.id, rentals.c.end_date.is_(None))
+            # Explicit ids are all returned, so the caller can tell a car whose status does not match
+            # current_status (left unchanged) from an id that does not exist.
+            targets = select(cars.c.id, cars.c.status, or_(cars.c.status == CarStatus.IN_USE, active_rental).label("rented"))
+            if car_ids is not None:
+                targets = targets.where(cars.c.id.in_(car_ids))
+            elif current_status is not None:
+                targets = targets.where(cars.c.status == current_status)
+            targets = targets.with_for_update(of=cars).cte("targets")
+
+            change_conditions = [cars.c.id == targets.c.id, not_(targets.c.rented), targets.c.status != new_status]
+            if current_status is not None:
+                change_conditions.append(targets.c.status == current_status)
+            changed = (
+                update(cars)
+                .where(*change_conditions)
+                .values(status=new_status, updated_at=now)
+                .returning(cars.c.id)
+                .cte("changed")
+            )
+            query = (
+                select(targets.c.id, targets.c.status, targets.c.rented, changed.c.id.is_not(None).label("updated"))
+                .select_from(targets.outerjoin(changed, changed.c.id == targets.c.id))
+            )
+
+            result = await self.db.execute(query)
+            return [
+                CarStatusTransition(car_id=row.id, previous_status=row.status, rented=row.rented, updated=row.updated)
+                for row in result
+            ]
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseException(f"Error updating status of cars to {new_status.value}: {e}", original_exception=e)
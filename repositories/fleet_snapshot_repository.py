@@ -0,0 +1,34 @@
+from typing import FrozenSet, Tuple
+from sqlalchemy import String, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from db.car_model import Car as CarModel
+from db.rental_model import Rental as RentalModel
+from domain.entities.car import CarStatus
+from domain.entities.fleet_snapshot import FleetSnapshot
+
+from repositories.interfaces.fleet_snapshot_repository_interface import IFleetSnapshotRepository
+from common.exceptions import DatabaseException
+
+def _parse_snapshot(snapshot: str) -> Tuple[int, int, FrozenSet[int]]:
+    # pg_snapshot text form is "xmin:xmax:xip1,xip2,..." with an empty in-progress list when nothing is running.
+    xmin, xmax, xip = snapshot.split(":")
+    return int(xmin), int(xmax), frozenset(int(txid) for txid in xip.split(",") if txid)
+
+class FleetSnapshotRepository(IFleetSnapshotRepository):
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_snapshot(self) -> FleetSnapshot:
+        try:
+            # One statement runs under one MVCC snapshot, so both counts and pg_current_snapshot() agree.
+            query = select(
+                select(func.count()).select_from(CarModel).where(CarModel.status == CarStatus.AVAILABLE).scalar_subquery(),
+                select(func.count()).select_from(RentalModel).where(RentalModel.end_date.is_(None)).scalar_subquery(),
+                cast(func.pg_current_snapshot(), String),
+            )
+            available_cars, active_rentals, snapshot = (await self.db.execute(query)).one()
+            xmin, xmax, xip = _parse_snapshot(snapshot)
+            return FleetSnapshot(available_cars=available_cars, active_rentals=active_rentals, xmin=xmin, xmax=xmax, xip=xip)
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error reading fleet snapshot: {e}", original_exception=e)
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from uuid import UUID
+from domain.entities.car import CarEntity
+
+class ICarCache(ABC):
+    @abstractmethod
+    def get(self, car_id: UUID) -> Optional[CarEntity]:
+        pass
+
+    @abstractmethod
+    def generation(self) -> int:
+        pass
+
+    @abstractmethod
+    def put(self, car: CarEntity, generation: int) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self, car_ids: Iterable[UUID]) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
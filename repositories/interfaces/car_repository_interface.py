@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
-from domain.entities.car import CarEntity, CarStatus
+from datetime import datetime
+from domain.entities.car import CarEntity, CarFilter, CarStatus, CarStatusTransition
 
 class ICarRepository(ABC):
     @abstractmethod
@@ -9,13 +10,33 @@ class ICarRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_id(self, car_id: UUID) -> Optional[CarEntity]:
+    async def get_page(self, status: Optional[CarStatus], limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[CarEntity]:
+        pass
+
+    @abstractmethod
+    async def search(self, filters: CarFilter, limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[CarEntity]:
+        pass
+
+    @abstractmethod
+    def stream_all(self, status: Optional[CarStatus] = None) -> AsyncIterator[CarEntity]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, car_id: UUID, for_update: bool = False) -> Optional[CarEntity]:
         pass
 
     @abstractmethod
     async def create(self, model: str, year: int) -> CarEntity:
         pass
 
+    @abstractmethod
+    async def create_many(self, cars: List[Tuple[str, int]]) -> List[CarEntity]:
+        pass
+
     @abstractmethod
     async def update(self, car: CarEntity) -> CarEntity:
         pass
+
+    @abstractmethod
+    async def update_status_many(self, new_status: CarStatus, car_ids: Optional[List[UUID]] = None, current_status: Optional[CarStatus] = None) -> List[CarStatusTransition]:
+        pass
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+from domain.entities.fleet_snapshot import FleetSnapshot
+
+class IFleetSnapshotRepository(ABC):
+    @abstractmethod
+    async def get_snapshot(self) -> FleetSnapshot:
+        pass
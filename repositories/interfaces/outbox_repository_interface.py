@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+from common.messaging.message_schema import MessageEvent
+
+class IOutboxRepository(ABC):
+    @abstractmethod
+    async def add(self, event_type: str, payload: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    async def claim_batch(self, limit: int) -> List[Tuple[int, MessageEvent]]:
+        pass
+
+    @abstractmethod
+    async def delete(self, event_ids: List[int]) -> None:
+        pass
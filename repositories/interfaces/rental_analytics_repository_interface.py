@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+from datetime import date
+from domain.entities.analytics import CarUtilization, HourlyActivity, ModelUtilization
+
+class IRentalAnalyticsRepository(ABC):
+    @abstractmethod
+    async def get_car_utilization(self, from_day: date, to_day: date, limit: int) -> List[CarUtilization]:
+        pass
+
+    @abstractmethod
+    async def get_model_utilization(self, from_day: date, to_day: date) -> List[ModelUtilization]:
+        pass
+
+    @abstractmethod
+    async def get_duration_histogram(self, from_day: date, to_day: date) -> Dict[int, int]:
+        pass
+
+    @abstractmethod
+    async def get_hourly_activity(self, from_day: date, to_day: date) -> List[HourlyActivity]:
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import List
+
+class IRentalArchiveRepository(ABC):
+    @abstractmethod
+    async def archivable_months(self, ended_before: datetime, limit: int) -> List[date]:
+        pass
+
+    @abstractmethod
+    async def create_partition(self, month: date) -> None:
+        pass
+
+    @abstractmethod
+    async def archive_ended_before(self, ended_before: datetime, limit: int) -> int:
+        pass
@@ -1,19 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from domain.entities.rental import RentalEntity
+from datetime import datetime
+from domain.entities.car import CarEntity
+from domain.entities.rental import RentalEntity, RentalFilter
 
 class IRentalRepository(ABC):
     @abstractmethod
-    async def get_all(self) -> List[RentalEntity]:
+    async def get_page(self, filters: RentalFilter, limit: int, before: Optional[Tuple[datetime, UUID]] = None) -> List[RentalEntity]:
         pass
 
     @abstractmethod
-    async def create(self, car_id: UUID, customer_name: str) -> RentalEntity:
+    async def start_rental(self, car_id: UUID, customer_name: str) -> Tuple[Optional[CarEntity], Optional[RentalEntity]]:
         pass
 
     @abstractmethod
-    async def end_rental(self, rental: RentalEntity) -> RentalEntity:
+    async def end_active_rental(self, car_id: UUID) -> Tuple[Optional[CarEntity], Optional[RentalEntity]]:
         pass
 
     @abstractmethod
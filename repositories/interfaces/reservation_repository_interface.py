@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+from datetime import datetime
+from domain.entities.car import CarEntity
+from domain.entities.reservation import ReservationEntity
+
+class IReservationRepository(ABC):
+    @abstractmethod
+    async def create(self, car_id: UUID, customer_name: str, start_time: datetime, end_time: datetime) -> Tuple[bool, Optional[ReservationEntity]]:
+        pass
+
+    @abstractmethod
+    async def cancel(self, reservation_id: UUID) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_free_cars(self, start_time: datetime, end_time: datetime, limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[CarEntity]:
+        pass
@@ -0,0 +1,6 @@
+from abc import ABC, abstractmethod
+
+class IUnitOfWork(ABC):
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
@@ -0,0 +1,40 @@
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from db.outbox_model import OutboxEvent as OutboxEventModel
+from common.messaging.message_schema import MessageEvent
+
+from repositories.interfaces.outbox_repository_interface import IOutboxRepository
+from common.exceptions import DatabaseException
+
+class OutboxRepository(IOutboxRepository):
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def add(self, event_type: str, payload: Dict[str, Any]) -> None:
+        # Staged only: the row is flushed by the caller's commit, together with the change it describes.
+        self.db.add(OutboxEventModel(event_type=event_type, payload=payload))
+
+    async def claim_batch(self, limit: int) -> List[Tuple[int, MessageEvent]]:
+        try:
+            query = (
+                select(OutboxEventModel.id, OutboxEventModel.event_type, OutboxEventModel.payload, OutboxEventModel.created_at, OutboxEventModel.txid)
+                .order_by(OutboxEventModel.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            result = await self.db.execute(query)
+            return [
+                (row.id, MessageEvent(event_type=row.event_type, payload=row.payload, occurred_at=row.created_at, sequence=row.id, txid=row.txid))
+                for row in result
+            ]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error claiming outbox events: {e}", original_exception=e)
+
+    async def delete(self, event_ids: List[int]) -> None:
+        try:
+            await self.db.execute(delete(OutboxEventModel).where(OutboxEventModel.id.in_(event_ids)))
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseException(f"Error deleting relayed outbox events: {e}", original_exception=e)
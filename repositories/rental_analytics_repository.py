@@ -0,0 +1,151 @@
+from typing import Dict, List, Tuple
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy import CTE, ColumnElement, Date, Integer, Select, String, Table, case, cast, func, literal_column, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import array, insert as pg_insert
+from db.car_model import Car as CarModel
+from db.rental_rollup_model import ROLLUP_SLOTS, RentalDurationsDaily, RentalUsageDailyByCar, RentalUsageHourly
+from domain.entities.analytics import DURATION_BUCKET_BOUNDS_SECONDS, CarUtilization, HourlyActivity, ModelUtilization
+
+from repositories.interfaces.rental_analytics_repository_interface import IRentalAnalyticsRepository
+from common.exceptions import DatabaseException
+from db.query_metrics import instrument_queries
+
+_cars = CarModel.__table__
+_hourly = RentalUsageHourly.__table__
+_daily_by_car = RentalUsageDailyByCar.__table__
+_durations = RentalDurationsDaily.__table__
+
+_ONE_HOUR = literal_column("interval '1 hour'")
+_ONE_DAY = literal_column("interval '1 day'")
+
+def _seconds(interval: ColumnElement) -> ColumnElement:
+    return func.extract("epoch", interval)
+
+def _overlap_seconds(ended: CTE, period_start: ColumnElement, period_length: ColumnElement) -> ColumnElement:
+    return func.greatest(0, _seconds(func.least(ended.c.end_date, period_start + period_length) - func.greatest(ended.c.start_date, period_start)))
+
+def _utc_date(timestamp: ColumnElement) -> ColumnElement:
+    return cast(func.timezone("UTC", timestamp), Date)
+
+def _upsert_adding(table: Table, rows: Select, columns: List[str], keys: List[str], counters: List[str]) -> CTE:
+    statement = pg_insert(table).from_select(columns, rows)
+    return statement.on_conflict_do_update(
+        index_elements=keys,
+        set_={counter: table.c[counter] + statement.excluded[counter] for counter in counters},
+    ).returning(*(table.c[key] for key in keys)).cte(f"{table.name}_rollup")
+
+def rollup_ended_rental(ended: CTE) -> Tuple[CTE, ...]:
+    # Adds a rental that was just closed (at most one row of `ended`) to the usage rollups, as CTEs of the statement
+    # that closes it: the rental is split into the UTC hours and days it covers with generate_series.
+    slot = func.hashtext(cast(ended.c.car_id, String)).op("&")(ROLLUP_SLOTS - 1)
+
+    start_hour = func.date_trunc("hour", ended.c.start_date, "UTC")
+    hour = func.generate_series(start_hour, ended.c.end_date, _ONE_HOUR).column_valued("usage_hour")
+    hours = (
+        select(hour, slot, _overlap_seconds(ended, hour, _ONE_HOUR), case((hour == start_hour, 1), else_=0))
+        .select_from(ended)
+        .where(or_(hour < ended.c.end_date, hour == start_hour))
+    )
+
+    end_day = func.date_trunc("day", ended.c.end_date, "UTC")
+    day = func.generate_series(func.date_trunc("day", ended.c.start_date, "UTC"), ended.c.end_date, _ONE_DAY).column_valued("usage_day")
+    days = (
+        select(_utc_date(day), ended.c.car_id, _overlap_seconds(ended, day, _ONE_DAY), case((day == end_day, 1), else_=0))
+        .select_from(ended)
+        .where(or_(day < ended.c.end_date, day == end_day))
+    )
+
+    # Start and end are stamped by different hosts' clocks, so a very short rental can come out negative.
+    duration = func.greatest(0, _seconds(ended.c.end_date - ended.c.start_date))
+    bucket = func.width_bucket(duration, array(DURATION_BUCKET_BOUNDS_SECONDS))
+    durations = select(_utc_date(ended.c.end_date), slot, bucket, 1).select_from(ended)
+
+    return (
+        _upsert_adding(_hourly, hours, ["hour", "slot", "rented_seconds", "rentals_started"], ["hour", "slot"], ["rented_seconds", "rentals_started"]),
+        _upsert_adding(_daily_by_car, days, ["day", "car_id", "rented_seconds", "rentals"], ["day", "car_id"], ["rented_seconds", "rentals"]),
+        _upsert_adding(_durations, durations, ["day", "slot", "bucket", "rentals"], ["day", "slot", "bucket"], ["rentals"]),
+    )
+
+def _window_seconds(from_day: date, to_day: date) -> float:
+    return ((to_day - from_day).days + 1) * 86400.0
+
+@instrument_queries
+class RentalAnalyticsRepository(IRentalAnalyticsRepository):
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_car_utilization(self, from_day: date, to_day: date, limit: int) -> List[CarUtilization]:
+        try:
+            # A primary-key range scan over the window's days; only the top `limit` cars are joined to cars.
+            rented_seconds = func.sum(_daily_by_car.c.rented_seconds)
+            usage = (
+                select(_daily_by_car.c.car_id, rented_seconds.label("rented_seconds"), func.sum(_daily_by_car.c.rentals).label("rentals"))
+                .where(_daily_by_car.c.day.between(from_day, to_day))
+                .group_by(_daily_by_car.c.car_id)
+                .order_by(rented_seconds.desc(), _daily_by_car.c.car_id)
+                .limit(limit)
+                .subquery()
+            )
+            query = (
+                select(usage.c.car_id, _cars.c.model, usage.c.rented_seconds, usage.c.rentals, usage.c.rented_seconds / _window_seconds(from_day, to_day))
+                .select_from(usage.join(_cars, _cars.c.id == usage.c.car_id))
+                .order_by(usage.c.rented_seconds.desc(), usage.c.car_id)
+            )
+            result = await self.db.execute(query)
+            return [CarUtilization(*row) for row in result]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error retrieving car utilization: {e}", original_exception=e)
+
+    async def get_model_utilization(self, from_day: date, to_day: date) -> List[ModelUtilization]:
+        try:
+            # Every registered car of a model counts towards its capacity, including cars that were never rented.
+            usage = (
+                select(_daily_by_car.c.car_id, func.sum(_daily_by_car.c.rented_seconds).label("rented_seconds"), func.sum(_daily_by_car.c.rentals).label("rentals"))
+                .where(_daily_by_car.c.day.between(from_day, to_day))
+                .group_by(_daily_by_car.c.car_id)
+                .subquery()
+            )
+            rented_seconds = func.coalesce(func.sum(usage.c.rented_seconds), 0.0)
+            cars = func.count()
+            query = (
+                select(_cars.c.model, cars, rented_seconds, cast(func.coalesce(func.sum(usage.c.rentals), 0), Integer), rented_seconds / (cars * _window_seconds(from_day, to_day)))
+                .select_from(_cars.outerjoin(usage, usage.c.car_id == _cars.c.id))
+                .group_by(_cars.c.model)
+                .order_by(rented_seconds.desc(), _cars.c.model)
+            )
+            result = await self.db.execute(query)
+            return [ModelUtilization(*row) for row in result]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error retrieving model utilization: {e}", original_exception=e)
+
+    async def get_duration_histogram(self, from_day: date, to_day: date) -> Dict[int, int]:
+        try:
+            query = (
+                select(_durations.c.bucket, func.sum(_durations.c.rentals))
+                .where(_durations.c.day.between(from_day, to_day))
+                .group_by(_durations.c.bucket)
+            )
+            result = await self.db.execute(query)
+            return {bucket: int(rentals) for bucket, rentals in result}
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error retrieving rental durations: {e}", original_exception=e)
+
+    async def get_hourly_activity(self, from_day: date, to_day: date) -> List[HourlyActivity]:
+        try:
+            window_start = datetime.combine(from_day, time.min, tzinfo=timezone.utc)
+            window_end = datetime.combine(to_day + timedelta(days=1), time.min, tzinfo=timezone.utc)
+            days = (to_day - from_day).days + 1
+            hour_of_day = cast(func.extract("hour", func.timezone("UTC", _hourly.c.hour)), Integer)
+            query = (
+                select(hour_of_day, func.sum(_hourly.c.rentals_started), func.sum(_hourly.c.rented_seconds) / (3600.0 * days))
+                .where(_hourly.c.hour >= window_start, _hourly.c.hour < window_end)
+                .group_by(hour_of_day)
+                .order_by(hour_of_day)
+            )
+            result = await self.db.execute(query)
+            return [HourlyActivity(hour, int(started), average) for hour, started, average in result]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error retrieving hourly rental activity: {e}", original_exception=e)
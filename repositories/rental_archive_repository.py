@@ -0,0 +1,75 @@
+from datetime import date, datetime, timezone
+from typing import List
+from sqlalchemy import Select, delete, func, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.exc import SQLAlchemyError
+from db.rental_model import Rental as RentalModel
+from db.rental_archive_model import RentalArchive as RentalArchiveModel
+
+from repositories.interfaces.rental_archive_repository_interface import IRentalArchiveRepository
+from repositories.rental_repository import ARCHIVED_RENTAL_COLUMNS, RENTAL_COLUMNS
+from common.exceptions import DatabaseException
+from db.query_metrics import instrument_queries
+
+_rentals = RentalModel.__table__
+_archive = RentalArchiveModel.__table__
+
+def partition_name(month: date) -> str:
+    return f"{_archive.name}_p{month.year:04d}_{month.month:02d}"
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+def _archivable(ended_before: datetime, limit: int) -> Select:
+    # Oldest first through ix_rentals_end_date_id, with id breaking ties so batches are deterministic. Rows another
+    # archiver has locked are left to it, and rows this transaction already locked are returned again, so both calls
+    # in a batch see the same rentals.
+    return (
+        select(_rentals.c.id)
+        .where(_rentals.c.end_date < ended_before)
+        .order_by(_rentals.c.end_date, _rentals.c.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+@instrument_queries
+class RentalArchiveRepository(IRentalArchiveRepository):
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def archivable_months(self, ended_before: datetime, limit: int) -> List[date]:
+        try:
+            batch = _archivable(ended_before, limit).add_columns(_rentals.c.start_date).subquery()
+            month = func.date_trunc("month", batch.c.start_date, "UTC")
+            result = await self.db.execute(select(month).distinct())
+            return [value.date() for value in result.scalars()]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error finding rentals to archive: {e}", original_exception=e)
+
+    async def create_partition(self, month: date) -> None:
+        try:
+            start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+            end = datetime.combine(_next_month(month), datetime.min.time(), tzinfo=timezone.utc)
+            # Concurrent archivers would otherwise race on the catalog entry that IF NOT EXISTS checks.
+            await self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(partition_name(month)))))
+            # DDL cannot take bind parameters; the name and bounds are derived from a date, never from input.
+            await self.db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {_archive.name} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseException(f"Error creating archive partition for {month:%Y-%m}: {e}", original_exception=e)
+
+    async def archive_ended_before(self, ended_before: datetime, limit: int) -> int:
+        try:
+            # One statement: the DELETE's RETURNING feeds the INSERT, so a rental is never in both tables.
+            claimed = _archivable(ended_before, limit).scalar_subquery()
+            moved = delete(_rentals).where(_rentals.c.id.in_(claimed)).returning(*RENTAL_COLUMNS).cte("moved")
+            query = insert(_archive).from_select([column.name for column in ARCHIVED_RENTAL_COLUMNS], select(moved)).returning(_archive.c.id)
+            result = await self.db.execute(query)
+            return len(result.all())
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseException(f"Error archiving rentals ended before {ended_before}: {e}", original_exception=e)
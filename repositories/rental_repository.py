@@ -1,73 +1,182 @@
-from typing import List, Optional
-from uuid import UUID
-from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import ColumnCollection, DateTime, Select, Table, bindparam, Row, String, func, insert, literal, not_, or_, true, tuple_, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from db.car_model import Car as CarModel
 from db.rental_model import Rental as RentalModel
-from domain.entities.rental import RentalEntity
+from db.reservation_model import Reservation as ReservationModel
+from db.rental_archive_model import RentalArchive as RentalArchiveModel
+from domain.entities.car import CarEntity, CarStatus
+from domain.entities.rental import RentalEntity, RentalFilter
 
 from repositories.interfaces.rental_repository_interface import IRentalRepository
+from repositories.car_repository import prefix_upper_bound
+from repositories.reservation_repository import overlapping_reservation
+from repositories.rental_analytics_repository import rollup_ended_rental
 from common.exceptions import DatabaseException
+from common.config import settings
+from db.query_metrics import instrument_queries
 
-def _to_entity(model: RentalModel) -> RentalEntity:
-    return RentalEntity(
-        id=model.id,
-        car_id=model.car_id,
-        customer_name=model.customer_name,
-        start_date=model.start_date,
-        end_date=model.end_date,
-        created_at=model.created_at,
-        updated_at=model.updated_at
-    )
+_rentals = RentalModel.__table__
+_archive = RentalArchiveModel.__table__
+_reservations = ReservationModel.__table__
 
+# Column order matches RentalEntity's fields so read rows map positionally (see CAR_COLUMNS in the car repository).
+RENTAL_COLUMNS = (_rentals.c.car_id, _rentals.c.customer_name, _rentals.c.id, _rentals.c.start_date, _rentals.c.end_date, _rentals.c.created_at, _rentals.c.updated_at)
+_SELECT_RENTALS = select(*RENTAL_COLUMNS)
+_SELECT_ACTIVE_RENTAL_BY_CAR_ID = _SELECT_RENTALS.where(_rentals.c.car_id == bindparam("car_id"), _rentals.c.end_date.is_(None))
+ARCHIVED_RENTAL_COLUMNS = (_archive.c.car_id, _archive.c.customer_name, _archive.c.id, _archive.c.start_date, _archive.c.end_date, _archive.c.created_at, _archive.c.updated_at)
+
+def _row_values(row: Row, columns: ColumnCollection) -> Optional[Dict[str, Any]]:
+    # Outer-joined CTEs come back as all-NULL columns when their statement did not touch a row.
+    values = {column.name: row._mapping[column] for column in columns}
+    return values if values["id"] is not None else None
+
+def _filtered_page(table: Table, columns: Tuple, filters: RentalFilter, limit: int, before: Optional[Tuple[datetime, UUID]]) -> Select:
+    # Newest first; each filter maps onto one of the table's indexes (active partial index,
+    # car_id/start_date, start_date/id, lower(customer_name) COLLATE "C" index).
+    query = select(*columns).order_by(table.c.start_date.desc(), table.c.id.desc()).limit(limit)
+    if filters.active is True:
+        query = query.where(table.c.end_date.is_(None))
+    elif filters.active is False:
+        query = query.where(table.c.end_date.is_not(None))
+    if filters.car_id:
+        query = query.where(table.c.car_id == filters.car_id)
+    if filters.customer_name:
+        # A range rather than LIKE, so the index bounds hold in generic plans with a bound parameter.
+        prefix = filters.customer_name.lower()
+        name_key = func.lower(table.c.customer_name).collate("C")
+        query = query.where(name_key >= prefix)
+        upper_bound = prefix_upper_bound(prefix)
+        if upper_bound is not None:
+            query = query.where(name_key < upper_bound)
+    if filters.from_time:
+        query = query.where(or_(table.c.end_date.is_(None), table.c.end_date >= filters.from_time))
+    if filters.to_time:
+        query = query.where(table.c.start_date < filters.to_time)
+    if before:
+        # The plain start_date bound is implied by the row comparison but is what partition pruning can use.
+        query = query.where(table.c.start_date <= before[0], tuple_(table.c.start_date, table.c.id) < tuple_(*before))
+    return query
+
+@instrument_queries
 class RentalRepository(IRentalRepository):
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, reservation_buffer: timedelta = timedelta(hours=settings.RENTAL_RESERVATION_BUFFER_HOURS)) -> None:
         self.db = db
+        self.reservation_buffer = reservation_buffer
 
-    async def get_all(self) -> List[RentalEntity]:
+    async def get_page(self, filters: RentalFilter, limit: int, before: Optional[Tuple[datetime, UUID]] = None) -> List[RentalEntity]:
         try:
-            result = await self.db.execute(select(RentalModel))
-            return [_to_entity(rental_model) for rental_model in result.scalars().all()]
+            query = _filtered_page(_rentals, RENTAL_COLUMNS, filters, limit, before)
+            if filters.include_archived and filters.active is not True:
+                # Each branch stops after `limit` rows of its own index scan. Only to_time and the cursor bound
+                # start_date, so only they prune archive partitions; from_time filters end_date, and rental length
+                # is unbounded, so with from_time alone older partitions are still scanned until `limit` rows match.
+                archived = _filtered_page(_archive, ARCHIVED_RENTAL_COLUMNS, filters, limit, before)
+                combined = union_all(query, archived).subquery()
+                query = select(combined).order_by(combined.c.start_date.desc(), combined.c.id.desc()).limit(limit)
+            result = await self.db.execute(query)
+            return [RentalEntity(*row) for row in result]
         except SQLAlchemyError as e:
             raise DatabaseException(f"Error retrieving rentals: {e}", original_exception=e)
 
-    async def create(self, car_id: UUID, customer_name: str) -> RentalEntity:
+    async def start_rental(self, car_id: UUID, customer_name: str) -> Tuple[Optional[CarEntity], Optional[RentalEntity]]:
         try:
-            rental = RentalModel(car_id=car_id, customer_name=customer_name)
-            self.db.add(rental)
-            await self.db.commit()
-            await self.db.refresh(rental)
-            return _to_entity(rental)
+            cars = CarModel.__table__
+            rentals = RentalModel.__table__
+            started_at = datetime.now(timezone.utc)
+            now = literal(started_at, DateTime(timezone=True))
+
+            # Bookings lock the car row before inserting, so taking the same lock in its own statement first
+            # gives the claim below a snapshot that already contains any booking committed for this car.
+            await self.db.execute(select(cars.c.id).where(cars.c.id == car_id).with_for_update(key_share=True))
+
+            # One statement: every CTE sees the same snapshot, so current_car is the pre-update row
+            # while claimed_car only returns a row if this transaction won the AVAILABLE -> IN_USE flip.
+            # Rentals are open-ended, so a car booked by someone else within the buffer is not handed out.
+            upcoming_booking = overlapping_reservation(car_id, started_at, started_at + self.reservation_buffer).where(_reservations.c.customer_name != customer_name)
+            current_car = select(cars).where(cars.c.id == car_id).cte("current_car")
+            claimed_car = (
+                update(cars)
+                .where(cars.c.id == car_id, cars.c.status == CarStatus.AVAILABLE, not_(upcoming_booking))
+                .values(status=CarStatus.IN_USE, updated_at=now)
+                .returning(*cars.c)
+                .cte("claimed_car")
+            )
+            started_rental = (
+                insert(rentals)
+                .from_select(
+                    ["id", "car_id", "customer_name", "start_date", "created_at", "updated_at"],
+                    select(literal(uuid4(), PG_UUID(as_uuid=True)), claimed_car.c.id, literal(customer_name, String), now, now, now)
+                )
+                .returning(*rentals.c)
+                .cte("started_rental")
+            )
+            query = (
+                select(current_car, claimed_car, started_rental)
+                .select_from(current_car.outerjoin(claimed_car, true()).outerjoin(started_rental, true()))
+            )
+
+            row = (await self.db.execute(query)).first()
+            if row is None:
+                return None, None
+
+            claimed = _row_values(row, claimed_car.c)
+            started = _row_values(row, started_rental.c)
+            car = CarEntity(**(claimed or _row_values(row, current_car.c)))
+            return car, RentalEntity(**started) if started else None
         except SQLAlchemyError as e:
             await self.db.rollback()
-            raise DatabaseException(f"Error creating rental: {e}", original_exception=e)
+            raise DatabaseException(f"Error starting rental for car {car_id}: {e}", original_exception=e)
 
-    async def end_rental(self, rental: RentalEntity) -> RentalEntity:
+    async def end_active_rental(self, car_id: UUID) -> Tuple[Optional[CarEntity], Optional[RentalEntity]]:
         try:
-            rental.end_date = datetime.now(timezone.utc)
-            rental.updated_at = datetime.now(timezone.utc)
-            db_rental = RentalModel(
-                id=rental.id,
-                car_id=rental.car_id,
-                customer_name=rental.customer_name,
-                start_date=rental.start_date,
-                end_date=rental.end_date,
-                created_at=rental.created_at,
-                updated_at=rental.updated_at
+            cars = CarModel.__table__
+            rentals = RentalModel.__table__
+            now = literal(datetime.now(timezone.utc), DateTime(timezone=True))
+
+            # The (car_id, end_date IS NULL) predicate is served by ux_rentals_car_id_active; the car is
+            # released and the usage rollups are updated only when a rental was actually closed, all within one statement.
+            current_car = select(cars).where(cars.c.id == car_id).cte("current_car")
+            ended_rental = (
+                update(rentals)
+                .where(rentals.c.car_id == car_id, rentals.c.end_date.is_(None))
+                .values(end_date=now, updated_at=now)
+                .returning(*rentals.c)
+                .cte("ended_rental")
+            )
+            released_car = (
+                update(cars)
+                .where(cars.c.id == ended_rental.c.car_id)
+                .values(status=CarStatus.AVAILABLE, updated_at=now)
+                .returning(*cars.c)
+                .cte("released_car")
             )
-            db_rental = await self.db.merge(db_rental)
-            await self.db.commit()
-            return _to_entity(db_rental)
+            query = (
+                select(current_car, released_car, ended_rental)
+                .select_from(current_car.outerjoin(ended_rental, true()).outerjoin(released_car, true()))
+                .add_cte(*rollup_ended_rental(ended_rental))
+            )
+
+            row = (await self.db.execute(query)).first()
+            if row is None:
+                return None, None
+
+            released = _row_values(row, released_car.c)
+            ended = _row_values(row, ended_rental.c)
+            car = CarEntity(**(released or _row_values(row, current_car.c)))
+            return car, RentalEntity(**ended) if ended else None
         except SQLAlchemyError as e:
             await self.db.rollback()
-            raise DatabaseException(f"Error ending rental {rental.id}: {e}", original_exception=e)
+            raise DatabaseException(f"Error ending rental for car {car_id}: {e}", original_exception=e)
 
     async def get_active_rental_by_car_id(self, car_id: UUID) -> Optional[RentalEntity]:
         try:
-            query = select(RentalModel).filter(RentalModel.car_id == car_id, RentalModel.end_date == None)
-            result = await self.db.execute(query)
-            model = result.scalars().first()
-            return _to_entity(model) if model else None
+            row = (await self.db.execute(_SELECT_ACTIVE_RENTAL_BY_CAR_ID, {"car_id": car_id})).first()
+            return RentalEntity(*row) if row else None
         except SQLAlchemyError as e:
             raise DatabaseException(f"Error retrieving active rental for car {car_id}: {e}", original_exception=e)
@@ -0,0 +1,87 @@
+from typing import Any, List, Optional, Tuple
+from uuid import UUID, uuid4
+from datetime import datetime, timezone
+from sqlalchemy import DateTime, Exists, String, delete, exists, func, literal, not_, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert as pg_insert
+from db.car_model import Car as CarModel
+from db.reservation_model import Reservation as ReservationModel
+from domain.entities.car import CarEntity, CarStatus
+from domain.entities.reservation import ReservationEntity
+
+from repositories.interfaces.reservation_repository_interface import IReservationRepository
+from repositories.car_repository import CAR_COLUMNS
+from common.exceptions import DatabaseException
+from db.query_metrics import instrument_queries
+
+_cars = CarModel.__table__
+_reservations = ReservationModel.__table__
+
+def reservation_window(start_time: Any, end_time: Any) -> Any:
+    return func.tstzrange(start_time, end_time, "[)")
+
+def overlapping_reservation(car_id: Any, start_time: Any, end_time: Any) -> Exists:
+    # Probes the GiST index behind ex_reservations_car_period, so the cost does not grow with the bookings table.
+    return exists().where(_reservations.c.car_id == car_id, _reservations.c.period.op("&&")(reservation_window(start_time, end_time)))
+
+@instrument_queries
+class ReservationRepository(IReservationRepository):
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def create(self, car_id: UUID, customer_name: str, start_time: datetime, end_time: datetime) -> Tuple[bool, Optional[ReservationEntity]]:
+        try:
+            now = literal(datetime.now(timezone.utc), DateTime(timezone=True))
+            reservation_id = uuid4()
+
+            # Locking the car serializes this booking with a rental starting on the same car (see start_rental).
+            # A clash with another booking is left to the exclusion constraint: DO NOTHING turns it into no row.
+            car = select(_cars.c.id).where(_cars.c.id == car_id).with_for_update(key_share=True).cte("car")
+            booked = (
+                pg_insert(_reservations)
+                .from_select(
+                    ["id", "car_id", "customer_name", "period", "created_at"],
+                    select(literal(reservation_id, PG_UUID(as_uuid=True)), car.c.id, literal(customer_name, String), reservation_window(start_time, end_time), now)
+                )
+                .on_conflict_do_nothing()
+                .returning(_reservations.c.id, _reservations.c.created_at)
+                .cte("booked")
+            )
+            query = select(car.c.id, booked.c.created_at).select_from(car.outerjoin(booked, true()))
+
+            row = (await self.db.execute(query)).first()
+            if row is None:
+                return False, None
+            if row.created_at is None:
+                return True, None
+            return True, ReservationEntity(id=reservation_id, car_id=car_id, customer_name=customer_name, start_time=start_time, end_time=end_time, created_at=row.created_at)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseException(f"Error reserving car {car_id}: {e}", original_exception=e)
+
+    async def cancel(self, reservation_id: UUID) -> bool:
+        try:
+            result = await self.db.execute(delete(_reservations).where(_reservations.c.id == reservation_id).returning(_reservations.c.id))
+            return result.first() is not None
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseException(f"Error cancelling reservation {reservation_id}: {e}", original_exception=e)
+
+    async def get_free_cars(self, start_time: datetime, end_time: datetime, limit: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[CarEntity]:
+        try:
+            # Walks ix_cars_status_created_at_id in page order and drops cars with an overlapping booking, one
+            # index probe per candidate, so a page costs about `limit` probes however many bookings exist.
+            query = (
+                select(*CAR_COLUMNS)
+                .where(_cars.c.status == CarStatus.AVAILABLE, not_(overlapping_reservation(_cars.c.id, start_time, end_time)))
+                .order_by(_cars.c.created_at, _cars.c.id)
+                .limit(limit)
+            )
+            if after:
+                query = query.where(tuple_(_cars.c.created_at, _cars.c.id) > tuple_(*after))
+            result = await self.db.execute(query)
+            return [CarEntity(*row) for row in result]
+        except SQLAlchemyError as e:
+            raise DatabaseException(f"Error retrieving cars free between {start_time} and {end_time}: {e}", original_exception=e)
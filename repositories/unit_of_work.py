@@ -0,0 +1,16 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from repositories.interfaces.unit_of_work_interface import IUnitOfWork
+from common.exceptions import DatabaseException
+
+class UnitOfWork(IUnitOfWork):
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def commit(self) -> None:
+        try:
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise DatabaseException(f"Error committing transaction: {e}", original_exception=e)
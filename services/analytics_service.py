@@ -0,0 +1,68 @@
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+from domain.entities.analytics import DURATION_BUCKET_BOUNDS_SECONDS, CarUtilization, DurationBucket, HourlyActivity, ModelUtilization, RentalDurationStats
+from services.interfaces.analytics_service_interface import IAnalyticsService
+from repositories.interfaces.rental_analytics_repository_interface import IRentalAnalyticsRepository
+from common.exceptions import InputValidationException
+from common.interfaces.logger_interface import ILogger
+
+def _validate_window(from_day: date, to_day: date) -> None:
+    if from_day > to_day:
+        raise InputValidationException("from_date cannot be later than to_date")
+
+def _bucket_bounds(bucket: int) -> Tuple[int, Optional[int]]:
+    # width_bucket returns 0 below the first bound; durations are clamped at 0 when rolled up, but stay defensive.
+    bucket = max(bucket, 1)
+    upper = DURATION_BUCKET_BOUNDS_SECONDS[bucket] if bucket < len(DURATION_BUCKET_BOUNDS_SECONDS) else None
+    return DURATION_BUCKET_BOUNDS_SECONDS[bucket - 1], upper
+
+def estimate_percentile(histogram: Dict[int, int], fraction: float) -> Optional[float]:
+    # Linear interpolation inside the bucket holding the requested rank; the last bucket is open-ended,
+    # so ranks falling into it are reported as its lower bound.
+    total = sum(histogram.values())
+    if not total:
+        return None
+    rank = fraction * total
+    seen = 0
+    for bucket in sorted(histogram):
+        rentals = histogram[bucket]
+        if rentals and seen + rentals >= rank:
+            lower, upper = _bucket_bounds(bucket)
+            if upper is None:
+                return float(lower)
+            return lower + (upper - lower) * (rank - seen) / rentals
+        seen += rentals
+    return None
+
+class AnalyticsService(IAnalyticsService):
+    def __init__(self, logger: ILogger, repository: IRentalAnalyticsRepository) -> None:
+        self.logger = logger
+        self.repository = repository
+
+    async def get_car_utilization(self, from_day: date, to_day: date, limit: int) -> List[CarUtilization]:
+        _validate_window(from_day, to_day)
+        return await self.repository.get_car_utilization(from_day, to_day, limit)
+
+    async def get_model_utilization(self, from_day: date, to_day: date) -> List[ModelUtilization]:
+        _validate_window(from_day, to_day)
+        return await self.repository.get_model_utilization(from_day, to_day)
+
+    async def get_rental_durations(self, from_day: date, to_day: date) -> RentalDurationStats:
+        _validate_window(from_day, to_day)
+        histogram: Dict[int, int] = {}
+        for bucket, rentals in (await self.repository.get_duration_histogram(from_day, to_day)).items():
+            histogram[max(bucket, 1)] = histogram.get(max(bucket, 1), 0) + rentals
+        buckets = [DurationBucket(*_bucket_bounds(bucket), rentals=histogram[bucket]) for bucket in sorted(histogram)]
+        return RentalDurationStats(
+            rentals=sum(histogram.values()),
+            p50_seconds=estimate_percentile(histogram, 0.5),
+            p90_seconds=estimate_percentile(histogram, 0.9),
+            p99_seconds=estimate_percentile(histogram, 0.99),
+            buckets=buckets,
+        )
+
+    async def get_busiest_hours(self, from_day: date, to_day: date) -> List[HourlyActivity]:
+        _validate_window(from_day, to_day)
+        by_hour = {activity.hour_of_day: activity for activity in await self.repository.get_hourly_activity(from_day, to_day)}
+        hours = [by_hour.get(hour, HourlyActivity(hour_of_day=hour, rentals_started=0, average_cars_in_use=0.0)) for hour in range(24)]
+        return sorted(hours, key=lambda activity: (activity.average_cars_in_use, activity.rentals_started), reverse=True)
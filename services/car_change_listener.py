@@ -0,0 +1,66 @@
+import asyncio
+import asyncpg
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.engine import make_url
+from common.config import settings
+from common.interfaces.logger_interface import ILogger
+from db.car_change_notifications import CARS_CHANGED_CHANNEL
+from repositories.interfaces.car_cache_interface import ICarCache
+
+def _listen_dsn() -> str:
+    return make_url(settings.get_database_url()).set(drivername="postgresql").render_as_string(hide_password=False)
+
+class CarChangeListener:
+    def __init__(self, logger: ILogger, cache: ICarCache, dsn: Optional[str] = None, reconnect_delay_seconds: float = 2.0) -> None:
+        self.logger = logger
+        self.cache = cache
+        self.dsn = dsn or _listen_dsn()
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning("Car change listener disconnected, retrying in %ss: %s", self.reconnect_delay_seconds, e)
+
+            # Notifications sent while nobody was listening are lost, so nothing cached so far can be trusted.
+            self.cache.clear()
+            await asyncio.sleep(self.reconnect_delay_seconds)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        try:
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            await connection.add_listener(CARS_CHANGED_CHANNEL, self._on_notification)
+            self.cache.clear()
+            self.logger.info("Listening for car changes on channel %s", CARS_CHANGED_CHANNEL)
+            await closed.wait()
+        finally:
+            if not connection.is_closed():
+                await connection.close()
+
+    def _on_notification(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            self.cache.invalidate([UUID(payload)])
+        except ValueError:
+            self.logger.warning("Ignoring malformed car change notification: %s", payload)
@@ -1,64 +1,150 @@
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
-from domain.entities.car import CarEntity, CarStatus
+from domain.entities.car import CarEntity, CarFilter, CarStatus, CarStatusTransition
 from services.interfaces.car_service_interface import ICarService
 from repositories.interfaces.car_repository_interface import ICarRepository
+from repositories.interfaces.unit_of_work_interface import IUnitOfWork
 from common.exceptions import NotFoundException, InputValidationException
 from common.interfaces.logger_interface import ILogger
 from common.interfaces.message_publisher_interface import IMessagePublisher
+from common.pagination import encode_cursor, decode_cursor
 import common.messaging.messaging_constants as constants
 
 MIN_CAR_YEAR = 1950
 
 class CarService(ICarService):
-    def __init__(self, logger: ILogger, message_publisher: IMessagePublisher, repository: ICarRepository) -> None:
+    def __init__(self, logger: ILogger, message_publisher: IMessagePublisher, repository: ICarRepository, unit_of_work: IUnitOfWork) -> None:
         self.logger = logger
         self.message_publisher = message_publisher
         self.repository = repository
+        self.unit_of_work = unit_of_work
 
     async def get_all_cars(self, status: Optional[CarStatus] = None) -> List[CarEntity]:
         return await self.repository.get_all(status)
 
+    async def get_cars_page(self, status: Optional[CarStatus], limit: int, cursor: Optional[str] = None) -> Tuple[List[CarEntity], Optional[str]]:
+        after = decode_cursor(cursor) if cursor else None
+        cars = await self.repository.get_page(status=status, limit=limit + 1, after=after)
+        if len(cars) <= limit:
+            return cars, None
+
+        cars = cars[:limit]
+        return cars, encode_cursor(cars[-1].created_at, cars[-1].id)
+
+    async def search_cars(self, filters: CarFilter, limit: int, cursor: Optional[str] = None) -> Tuple[List[CarEntity], Optional[str]]:
+        if filters.min_year is not None and filters.max_year is not None and filters.min_year > filters.max_year:
+            raise InputValidationException("min_year cannot be greater than max_year")
+
+        after = decode_cursor(cursor) if cursor else None
+        cars = await self.repository.search(filters, limit=limit + 1, after=after)
+        if len(cars) <= limit:
+            return cars, None
+
+        cars = cars[:limit]
+        return cars, encode_cursor(cars[-1].created_at, cars[-1].id)
+
+    def stream_cars(self, status: Optional[CarStatus] = None) -> AsyncIterator[CarEntity]:
+        return self.repository.stream_all(status)
+
+    async def get_car(self, car_id: UUID) -> CarEntity:
+        car = await self.repository.get_by_id(car_id)
+        if not car:
+            raise NotFoundException(f"Car {car_id} not found")
+        return car
+
     async def create_car(self, model: str, year: int) -> CarEntity:
-        self.logger.info(f"Creating car: {model} ({year})")
-        if not model or not model.strip():
-            self.logger.error("Attempted to create car with empty model")
-            raise InputValidationException("Car model cannot be empty")
-        
-        if year < MIN_CAR_YEAR:
-            self.logger.error(f"Attempted to create car with year {year} < {MIN_CAR_YEAR}")
-            raise InputValidationException(f"Car year must be {MIN_CAR_YEAR} or later")
+        self.logger.info("Creating car: %s (%s)", model, year)
+        self._validate_new_car(model, year)
             
         created_car = await self.repository.create(model=model, year=year)
         await self.message_publisher.publish_event(constants.EVENT_CAR_CREATED_AVAILABLE, {})
-        self.logger.info(f"Car created successfully: {created_car.id}")
+        await self.unit_of_work.commit()
+        self.logger.info("Car created successfully: %s", created_car.id)
         return created_car
 
+    async def create_cars(self, cars: List[Tuple[str, int]]) -> Tuple[List[CarEntity], Dict[int, str]]:
+        self.logger.info("Creating %d cars in bulk", len(cars))
+        valid_cars: List[Tuple[str, int]] = []
+        failures: Dict[int, str] = {}
+        for index, (model, year) in enumerate(cars):
+            try:
+                self._validate_new_car(model, year)
+                valid_cars.append((model, year))
+            except InputValidationException as e:
+                failures[index] = str(e)
 
+        if not valid_cars:
+            return [], failures
+
+        created_cars = await self.repository.create_many(valid_cars)
+        await self.message_publisher.publish_event(constants.EVENT_CAR_CREATED_AVAILABLE, {"count": len(created_cars)})
+        await self.unit_of_work.commit()
+        self.logger.info("Bulk car creation finished: %d created, %d rejected", len(created_cars), len(failures))
+        return created_cars, failures
+
+    def _validate_new_car(self, model: str, year: int) -> None:
+        if not model or not model.strip():
+            self.logger.error("Attempted to create car with empty model")
+            raise InputValidationException("Car model cannot be empty")
+        
+        if year < MIN_CAR_YEAR:
+            self.logger.error("Attempted to create car with year %s < %s", year, MIN_CAR_YEAR)
+            raise InputValidationException(f"Car year must be {MIN_CAR_YEAR} or later")
 
     async def update_car(self, car_id: UUID, model: Optional[str] = None, year: Optional[int] = None, status: Optional[CarStatus] = None) -> Optional[CarEntity]:
-        self.logger.info(f"Updating car: {car_id}")
+        self.logger.info("Updating car: %s", car_id)
         if model is not None and not model.strip():
              self.logger.error("Attempted to update car with empty model")
              raise InputValidationException("Car model cannot be empty")
              
         if year is not None and year < MIN_CAR_YEAR:
-            self.logger.error(f"Attempted to update car with year {year} < {MIN_CAR_YEAR}")
+            self.logger.error("Attempted to update car with year %s < %s", year, MIN_CAR_YEAR)
             raise InputValidationException(f"Car year must be {MIN_CAR_YEAR} or later")
 
-        car = await self.repository.get_by_id(car_id)
+        # Read-modify-write: lock the current row rather than trusting a cached copy of its status.
+        car = await self.repository.get_by_id(car_id, for_update=True)
         if not car:
-            self.logger.error(f"Car {car_id} not found for update")
+            self.logger.error("Car %s not found for update", car_id)
             raise NotFoundException(f"Car {car_id} not found")
             
         old_status = car.status
         self._update_car_attributes(car, model, year, status)
         updated_car = await self.repository.update(car)
         await self._update_car_metrics_on_update(old_status, status)
+        await self.unit_of_work.commit()
 
-        self.logger.info(f"Car updated successfully: {updated_car.id}")
+        self.logger.info("Car updated successfully: %s", updated_car.id)
         return updated_car
 
+    async def update_cars_status(self, new_status: CarStatus, car_ids: Optional[List[UUID]] = None, current_status: Optional[CarStatus] = None) -> Tuple[List[CarStatusTransition], List[UUID]]:
+        self.logger.info("Moving cars to status %s (ids: %s, current status: %s)", new_status.value, len(car_ids) if car_ids is not None else "any", current_status.value if current_status else "any")
+        if car_ids is None and current_status is None:
+            self.logger.error("Attempted bulk status update without car ids or a status filter")
+            raise InputValidationException("Either car ids or a current status filter must be provided")
+
+        if new_status == CarStatus.IN_USE or current_status == CarStatus.IN_USE:
+            self.logger.error("Attempted bulk status update involving in-use cars")
+            raise InputValidationException("Cars are put in use and released only through rentals")
+
+        transitions = await self.repository.update_status_many(new_status, car_ids=car_ids, current_status=current_status)
+        found_ids = {transition.car_id for transition in transitions}
+        not_found = list(dict.fromkeys(car_id for car_id in car_ids or [] if car_id not in found_ids))
+
+        updated = [transition for transition in transitions if transition.updated]
+        if updated:
+            delta = self._availability_delta(updated, new_status)
+            if delta:
+                await self.message_publisher.publish_event(constants.EVENT_CARS_AVAILABILITY_CHANGED, {"delta": delta})
+            await self.unit_of_work.commit()
+
+        self.logger.info("Bulk status update finished: %d updated, %d rented, %d not found", len(updated), sum(t.rented for t in transitions), len(not_found))
+        return transitions, not_found
+
+    def _availability_delta(self, updated: List[CarStatusTransition], new_status: CarStatus) -> int:
+        if new_status == CarStatus.AVAILABLE:
+            return len(updated)
+        return -sum(1 for transition in updated if transition.previous_status == CarStatus.AVAILABLE)
+
     def _update_car_attributes(self, car: CarEntity, model: Optional[str], year: Optional[int], status: Optional[CarStatus]) -> None:
         if model:
             car.model = model
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import List
+from datetime import date
+from domain.entities.analytics import CarUtilization, HourlyActivity, ModelUtilization, RentalDurationStats
+
+class IAnalyticsService(ABC):
+    @abstractmethod
+    async def get_car_utilization(self, from_day: date, to_day: date, limit: int) -> List[CarUtilization]:
+        pass
+
+    @abstractmethod
+    async def get_model_utilization(self, from_day: date, to_day: date) -> List[ModelUtilization]:
+        pass
+
+    @abstractmethod
+    async def get_rental_durations(self, from_day: date, to_day: date) -> RentalDurationStats:
+        pass
+
+    @abstractmethod
+    async def get_busiest_hours(self, from_day: date, to_day: date) -> List[HourlyActivity]:
+        pass
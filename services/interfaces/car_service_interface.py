@@ -1,17 +1,41 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
-from domain.entities.car import CarEntity, CarStatus
+from domain.entities.car import CarEntity, CarFilter, CarStatus, CarStatusTransition
 
 class ICarService(ABC):
     @abstractmethod
     async def get_all_cars(self, status: Optional[CarStatus] = None) -> List[CarEntity]:
         pass
 
+    @abstractmethod
+    async def get_cars_page(self, status: Optional[CarStatus], limit: int, cursor: Optional[str] = None) -> Tuple[List[CarEntity], Optional[str]]:
+        pass
+
+    @abstractmethod
+    async def search_cars(self, filters: CarFilter, limit: int, cursor: Optional[str] = None) -> Tuple[List[CarEntity], Optional[str]]:
+        pass
+
+    @abstractmethod
+    def stream_cars(self, status: Optional[CarStatus] = None) -> AsyncIterator[CarEntity]:
+        pass
+
+    @abstractmethod
+    async def get_car(self, car_id: UUID) -> CarEntity:
+        pass
+
     @abstractmethod
     async def create_car(self, model: str, year: int) -> CarEntity:
         pass
 
+    @abstractmethod
+    async def create_cars(self, cars: List[Tuple[str, int]]) -> Tuple[List[CarEntity], Dict[int, str]]:
+        pass
+
     @abstractmethod
     async def update_car(self, car_id: UUID, model: Optional[str] = None, year: Optional[int] = None, status: Optional[CarStatus] = None) -> Optional[CarEntity]:
         pass
+
+    @abstractmethod
+    async def update_cars_status(self, new_status: CarStatus, car_ids: Optional[List[UUID]] = None, current_status: Optional[CarStatus] = None) -> Tuple[List[CarStatusTransition], List[UUID]]:
+        pass
@@ -3,7 +3,11 @@ from typing import Tuple
 
 class IMetricsService(ABC):
     @abstractmethod
-    def record_request_time(self, method: str, endpoint: str, execution_time_seconds: float) -> None:
+    def record_request_time(self, method: str, endpoint: str, status_code: int, execution_time_seconds: float) -> None:
+        pass
+
+    @abstractmethod
+    def record_request_queries(self, endpoint: str, queries: int, database_time_seconds: float) -> None:
         pass
 
     @abstractmethod
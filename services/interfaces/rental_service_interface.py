@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
-from domain.entities.rental import RentalEntity
+from domain.entities.rental import RentalEntity, RentalFilter
 
 class IRentalService(ABC):
     @abstractmethod
-    async def get_all_rentals(self) -> List[RentalEntity]:
+    async def get_rentals_page(self, filters: RentalFilter, limit: int, cursor: Optional[str] = None) -> Tuple[List[RentalEntity], Optional[str]]:
         pass
 
     @abstractmethod
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+from datetime import datetime
+from domain.entities.car import CarEntity
+from domain.entities.reservation import ReservationEntity
+
+class IReservationService(ABC):
+    @abstractmethod
+    async def create_reservation(self, car_id: UUID, customer_name: str, start_time: datetime, end_time: datetime) -> ReservationEntity:
+        pass
+
+    @abstractmethod
+    async def cancel_reservation(self, reservation_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    async def get_free_cars_page(self, start_time: datetime, end_time: datetime, limit: int, cursor: Optional[str] = None) -> Tuple[List[CarEntity], Optional[str]]:
+        pass
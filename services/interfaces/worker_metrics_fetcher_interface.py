@@ -0,0 +1,6 @@
+from abc import ABC, abstractmethod
+
+class IWorkerMetricsFetcher(ABC):
+    @abstractmethod
+    def get_payload(self) -> str:
+        pass
@@ -1,12 +1,19 @@
 from prometheus_client import Histogram, generate_latest, CONTENT_TYPE_LATEST
 from typing import Tuple
+from common.config import settings
 from services.interfaces.metrics_service_interface import IMetricsService
 
-HTTP_REQUEST_DURATION = Histogram('drivenow_http_request_duration_seconds', 'Histogram of HTTP request processing duration in seconds', ['method', 'endpoint'])
+HTTP_REQUEST_DURATION = Histogram('drivenow_http_request_duration_seconds', 'Histogram of HTTP request processing duration in seconds', ['method', 'endpoint', 'status_code'], buckets=settings.HTTP_LATENCY_BUCKETS)
+HTTP_REQUEST_DB_QUERIES = Histogram('drivenow_http_request_db_queries', 'Number of database round trips made while handling an HTTP request', ['endpoint'], buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100))
+HTTP_REQUEST_DB_DURATION = Histogram('drivenow_http_request_db_duration_seconds', 'Total time an HTTP request spent waiting on database statements', ['endpoint'], buckets=settings.HTTP_LATENCY_BUCKETS)
 
 class MetricsService(IMetricsService):
-    def record_request_time(self, method: str, endpoint: str, execution_time_seconds: float) -> None:
-        HTTP_REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(execution_time_seconds)
+    def record_request_time(self, method: str, endpoint: str, status_code: int, execution_time_seconds: float) -> None:
+        HTTP_REQUEST_DURATION.labels(method=method, endpoint=endpoint, status_code=str(status_code)).observe(execution_time_seconds)
+
+    def record_request_queries(self, endpoint: str, queries: int, database_time_seconds: float) -> None:
+        HTTP_REQUEST_DB_QUERIES.labels(endpoint=endpoint).observe(queries)
+        HTTP_REQUEST_DB_DURATION.labels(endpoint=endpoint).observe(database_time_seconds)
 
     def get_metrics_data(self) -> Tuple[bytes, str]:
         return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Optional
+from prometheus_client import Counter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from common.config import settings
+from common.interfaces.logger_interface import ILogger
+from common.messaging.rabbitmq_publisher import RabbitMQPublisher
+from repositories.outbox_repository import OutboxRepository
+
+OUTBOX_EVENTS_RELAYED = Counter('drivenow_outbox_events_relayed', 'Number of outbox events published to RabbitMQ and removed from the outbox')
+OUTBOX_RELAY_FAILURES = Counter('drivenow_outbox_relay_failures', 'Number of outbox relay batches that failed and will be retried')
+
+class OutboxRelay:
+    def __init__(self, logger: ILogger, publisher: RabbitMQPublisher, session_factory: async_sessionmaker[AsyncSession], batch_size: int = settings.OUTBOX_BATCH_SIZE, poll_interval_seconds: float = settings.OUTBOX_POLL_INTERVAL_SECONDS, max_backoff_seconds: float = settings.OUTBOX_MAX_BACKOFF_SECONDS) -> None:
+        self.logger = logger
+        self.publisher = publisher
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._consecutive_failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        self.logger.info("Outbox relay started")
+        while True:
+            try:
+                relayed = await self.relay_batch()
+                self._consecutive_failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                OUTBOX_RELAY_FAILURES.inc()
+                self._consecutive_failures += 1
+                delay = self.retry_delay()
+                self.logger.error("Outbox relay batch failed, retrying in %.1f seconds: %s", delay, e)
+                await asyncio.sleep(delay)
+                continue
+
+            # A full batch means more rows are probably waiting, so drain without sleeping.
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval_seconds)
+
+    def retry_delay(self) -> float:
+        # Doubles with every consecutive failure so a broker outage is not hammered at the poll rate.
+        return min(self.poll_interval_seconds * 2 ** self._consecutive_failures, self.max_backoff_seconds)
+
+    async def relay_batch(self) -> int:
+        async with self.session_factory() as session:
+            repository = OutboxRepository(session)
+            claimed = await repository.claim_batch(self.batch_size)
+            if not claimed:
+                return 0
+
+            await self.publisher.publish_batch([event for _, event in claimed])
+            await repository.delete([event_id for event_id, _ in claimed])
+            await session.commit()
+
+        OUTBOX_EVENTS_RELAYED.inc(len(claimed))
+        return len(claimed)
@@ -0,0 +1,70 @@
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Set
+from prometheus_client import Counter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from common.config import settings
+from common.interfaces.logger_interface import ILogger
+from repositories.rental_archive_repository import RentalArchiveRepository
+
+RENTALS_ARCHIVED = Counter('drivenow_rentals_archived', 'Number of ended rentals moved from the rentals table into rentals_archive')
+RENTAL_ARCHIVE_FAILURES = Counter('drivenow_rental_archive_failures', 'Number of rental archive batches that failed and will be retried')
+
+class RentalArchiver:
+    def __init__(self, logger: ILogger, session_factory: async_sessionmaker[AsyncSession], archive_after: timedelta = timedelta(days=settings.RENTAL_ARCHIVE_AFTER_DAYS), batch_size: int = settings.RENTAL_ARCHIVE_BATCH_SIZE, interval_seconds: float = settings.RENTAL_ARCHIVE_INTERVAL_SECONDS) -> None:
+        self.logger = logger
+        self.session_factory = session_factory
+        self.archive_after = archive_after
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self._known_partitions: Set[date] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        self.logger.info("Rental archiver started, archiving rentals ended more than %s ago", self.archive_after)
+        while True:
+            try:
+                archived = await self.archive_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                RENTAL_ARCHIVE_FAILURES.inc()
+                self.logger.error("Rental archive batch failed, will retry: %s", e)
+                archived = 0
+
+            # A full batch means a backlog (e.g. the first run on a large table), so keep going without sleeping.
+            if archived < self.batch_size:
+                await asyncio.sleep(self.interval_seconds)
+
+    async def archive_batch(self) -> int:
+        ended_before = datetime.now(timezone.utc) - self.archive_after
+        async with self.session_factory() as session:
+            repository = RentalArchiveRepository(session)
+            months = await repository.archivable_months(ended_before, self.batch_size)
+            if not months:
+                return 0
+
+            # Partitions only need creating the first time a month is archived by this process.
+            new_months = [month for month in months if month not in self._known_partitions]
+            for month in new_months:
+                await repository.create_partition(month)
+            archived = await repository.archive_ended_before(ended_before, self.batch_size)
+            await session.commit()
+
+        self._known_partitions.update(new_months)
+        RENTALS_ARCHIVED.inc(archived)
+        return archived
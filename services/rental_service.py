@@ -1,71 +1,75 @@
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
 from domain.entities.car import CarStatus
-from domain.entities.rental import RentalEntity
+from domain.entities.rental import RentalEntity, RentalFilter
 from services.interfaces.rental_service_interface import IRentalService
 from repositories.interfaces.rental_repository_interface import IRentalRepository
-from repositories.interfaces.car_repository_interface import ICarRepository
-from common.exceptions import NotFoundException, CarStatusUnavailableException, RentalAlreadyEndedException, InputValidationException
+from repositories.interfaces.unit_of_work_interface import IUnitOfWork
+from common.exceptions import NotFoundException, CarStatusUnavailableException, InputValidationException
 from common.interfaces.logger_interface import ILogger
 from common.interfaces.message_publisher_interface import IMessagePublisher
+from common.pagination import encode_cursor, decode_cursor
+from common.time_window import validate_time_window
 import common.messaging.messaging_constants as constants
 
 class RentalService(IRentalService):
-    def __init__(self, logger: ILogger, message_publisher: IMessagePublisher, rental_repository: IRentalRepository, car_repository: ICarRepository) -> None:
+    def __init__(self, logger: ILogger, message_publisher: IMessagePublisher, rental_repository: IRentalRepository, unit_of_work: IUnitOfWork) -> None:
         self.logger = logger
         self.message_publisher = message_publisher
         self.rental_repository = rental_repository
-        self.car_repository = car_repository
+        self.unit_of_work = unit_of_work
 
-    async def get_all_rentals(self) -> List[RentalEntity]:
-        return await self.rental_repository.get_all()
+    async def get_rentals_page(self, filters: RentalFilter, limit: int, cursor: Optional[str] = None) -> Tuple[List[RentalEntity], Optional[str]]:
+        validate_time_window(filters.from_time, filters.to_time, "from_time", "to_time")
+
+        before = decode_cursor(cursor) if cursor else None
+        rentals = await self.rental_repository.get_page(filters=filters, limit=limit + 1, before=before)
+        if len(rentals) <= limit:
+            return rentals, None
+
+        rentals = rentals[:limit]
+        return rentals, encode_cursor(rentals[-1].start_date, rentals[-1].id)
 
     async def create_rental(self, car_id: UUID, customer_name: str) -> RentalEntity:
-        self.logger.info(f"Creating rental for car {car_id} by {customer_name}")
+        self.logger.info("Creating rental for car %s by %s", car_id, customer_name)
         if not customer_name or not customer_name.strip():
             self.logger.error("Attempted to create rental with empty customer name")
             raise InputValidationException(message="Customer name cannot be empty")
 
-        car = await self.car_repository.get_by_id(car_id)
+        car, new_rental = await self.rental_repository.start_rental(car_id=car_id, customer_name=customer_name)
         if not car:
-            self.logger.error(f"Car {car_id} not found during rental creation")
+            self.logger.error("Car %s not found during rental creation", car_id)
             raise NotFoundException(f"Car {car_id} not found")
-        
-        if car.status != CarStatus.AVAILABLE:
-            self.logger.error(f"Car {car_id} is not available for rent (Status: {car.status})")
+
+        if not new_rental and car.status == CarStatus.AVAILABLE:
+            # The repository holds the car lock before claiming it, so an available car that was not
+            # claimed is one booked by another customer within the reservation buffer.
+            self.logger.error("Car %s is reserved by another customer", car_id)
+            raise CarStatusUnavailableException("Car is reserved by another customer")
+
+        if not new_rental:
+            self.logger.error("Car %s is not available for rent (Status: %s)", car_id, car.status)
             raise CarStatusUnavailableException("Car is not available for rent")
 
-        new_rental = await self.rental_repository.create(car_id=car_id, customer_name=customer_name)
-        car.status = CarStatus.IN_USE
-        await self.car_repository.update(car)
-        
         await self.message_publisher.publish_event(constants.EVENT_RENTAL_CREATED, {"car_id": str(car_id), "rental_id": str(new_rental.id)})
+        await self.unit_of_work.commit()
         
-        self.logger.info(f"Rental created successfully: {new_rental.id}")
+        self.logger.info("Rental created successfully: %s", new_rental.id)
         return new_rental
 
     async def end_rental_by_car_id(self, car_id: UUID) -> RentalEntity:
-        self.logger.info(f"Ending rental for car: {car_id}")
-        car = await self.car_repository.get_by_id(car_id)
+        self.logger.info("Ending rental for car: %s", car_id)
+        car, ended_rental = await self.rental_repository.end_active_rental(car_id)
         if not car:
-            self.logger.error(f"Car {car_id} not found during end rental")
+            self.logger.error("Car %s not found during end rental", car_id)
             raise NotFoundException(f"Car {car_id} not found")
 
-        active_rental = await self.rental_repository.get_active_rental_by_car_id(car_id)
-        if not active_rental:
-            self.logger.error(f"No active rental found for car {car_id}")
+        if not ended_rental:
+            self.logger.error("No active rental found for car %s", car_id)
             raise NotFoundException(f"No active rental found for car {car_id}")
 
-        if active_rental.end_date:
-            self.logger.error(f"Rental {active_rental.id} already ended")
-            raise RentalAlreadyEndedException("Rental already ended")
-
-        await self.rental_repository.end_rental(active_rental)
-        
-        car.status = CarStatus.AVAILABLE
-        await self.car_repository.update(car)
-        
-        await self.message_publisher.publish_event(constants.EVENT_RENTAL_ENDED, {"car_id": str(car_id), "rental_id": str(active_rental.id)})
+        await self.message_publisher.publish_event(constants.EVENT_RENTAL_ENDED, {"car_id": str(car_id), "rental_id": str(ended_rental.id)})
+        await self.unit_of_work.commit()
         
-        self.logger.info(f"Rental ended successfully: {active_rental.id} for car {car_id}")
-        return active_rental
+        self.logger.info("Rental ended successfully: %s for car %s", ended_rental.id, car_id)
+        return ended_rental
@@ -0,0 +1,60 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+from datetime import datetime, timezone
+from domain.entities.car import CarEntity
+from domain.entities.reservation import ReservationEntity
+from services.interfaces.reservation_service_interface import IReservationService
+from repositories.interfaces.reservation_repository_interface import IReservationRepository
+from repositories.interfaces.unit_of_work_interface import IUnitOfWork
+from common.exceptions import NotFoundException, InputValidationException, ReservationConflictException
+from common.interfaces.logger_interface import ILogger
+from common.pagination import encode_cursor, decode_cursor
+from common.time_window import validate_time_window
+
+class ReservationService(IReservationService):
+    def __init__(self, logger: ILogger, reservation_repository: IReservationRepository, unit_of_work: IUnitOfWork) -> None:
+        self.logger = logger
+        self.reservation_repository = reservation_repository
+        self.unit_of_work = unit_of_work
+
+    async def create_reservation(self, car_id: UUID, customer_name: str, start_time: datetime, end_time: datetime) -> ReservationEntity:
+        self.logger.info("Reserving car %s for %s between %s and %s", car_id, customer_name, start_time, end_time)
+        if not customer_name or not customer_name.strip():
+            self.logger.error("Attempted to create reservation with empty customer name")
+            raise InputValidationException("Customer name cannot be empty")
+        validate_time_window(start_time, end_time, "start_time", "end_time")
+        if end_time <= datetime.now(timezone.utc):
+            raise InputValidationException("Reservation must end in the future")
+
+        car_found, reservation = await self.reservation_repository.create(car_id, customer_name, start_time, end_time)
+        if not car_found:
+            self.logger.error("Car %s not found during reservation", car_id)
+            raise NotFoundException(f"Car {car_id} not found")
+
+        if not reservation:
+            self.logger.error("Car %s is already reserved between %s and %s", car_id, start_time, end_time)
+            raise ReservationConflictException("Car is already reserved for an overlapping period")
+
+        await self.unit_of_work.commit()
+
+        self.logger.info("Reservation created successfully: %s", reservation.id)
+        return reservation
+
+    async def cancel_reservation(self, reservation_id: UUID) -> None:
+        self.logger.info("Cancelling reservation: %s", reservation_id)
+        if not await self.reservation_repository.cancel(reservation_id):
+            self.logger.error("Reservation %s not found", reservation_id)
+            raise NotFoundException(f"Reservation {reservation_id} not found")
+
+        await self.unit_of_work.commit()
+
+    async def get_free_cars_page(self, start_time: datetime, end_time: datetime, limit: int, cursor: Optional[str] = None) -> Tuple[List[CarEntity], Optional[str]]:
+        validate_time_window(start_time, end_time, "start_time", "end_time")
+
+        after = decode_cursor(cursor) if cursor else None
+        cars = await self.reservation_repository.get_free_cars(start_time, end_time, limit=limit + 1, after=after)
+        if len(cars) <= limit:
+            return cars, None
+
+        cars = cars[:limit]
+        return cars, encode_cursor(cars[-1].created_at, cars[-1].id)
@@ -0,0 +1,67 @@
+import asyncio
+import time
+import httpx
+from typing import Optional
+from prometheus_client import Counter, Gauge, Histogram
+from common.config import settings
+from common.interfaces.logger_interface import ILogger
+from services.interfaces.worker_metrics_fetcher_interface import IWorkerMetricsFetcher
+
+WORKER_METRICS_FETCH_DURATION = Histogram('drivenow_worker_metrics_fetch_duration_seconds', 'Duration of background fetches of the metrics worker payload', ['outcome'])
+WORKER_METRICS_FETCH_FAILURES = Counter('drivenow_worker_metrics_fetch_failures', 'Number of background fetches of the metrics worker payload that failed')
+WORKER_METRICS_AGE = Gauge('drivenow_worker_metrics_age_seconds', 'Age of the metrics worker payload served by /metrics (-1 before the first successful fetch)')
+
+class WorkerMetricsFetcher(IWorkerMetricsFetcher):
+    def __init__(self, logger: ILogger, url: str = settings.WORKER_METRICS_URL, refresh_interval_seconds: float = settings.WORKER_METRICS_REFRESH_SECONDS, timeout_seconds: float = settings.WORKER_METRICS_TIMEOUT_SECONDS, client: Optional[httpx.AsyncClient] = None) -> None:
+        self.logger = logger
+        self.url = f"{url}/metrics"
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.client = client or httpx.AsyncClient(timeout=timeout_seconds)
+        self._payload = ""
+        self._fetched_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        WORKER_METRICS_AGE.set_function(self.age_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.client.aclose()
+
+    def get_payload(self) -> str:
+        # Scrapes never wait on the worker: they get the last good payload, whose age is exported alongside it.
+        return self._payload
+
+    def age_seconds(self) -> float:
+        if self._fetched_at is None:
+            return -1.0
+        return time.monotonic() - self._fetched_at
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval_seconds)
+
+    async def refresh(self) -> bool:
+        started = time.perf_counter()
+        try:
+            response = await self.client.get(self.url)
+            response.raise_for_status()
+        except Exception as e:
+            WORKER_METRICS_FETCH_DURATION.labels(outcome="error").observe(time.perf_counter() - started)
+            WORKER_METRICS_FETCH_FAILURES.inc()
+            self.logger.error("Failed to fetch worker metrics: %s", e)
+            return False
+
+        WORKER_METRICS_FETCH_DURATION.labels(outcome="success").observe(time.perf_counter() - started)
+        self._payload = response.text
+        self._fetched_at = time.monotonic()
+        return True
@@ -0,0 +1,152 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+from datetime import date
+from sqlalchemy.dialects import postgresql
+from domain.entities.analytics import DurationBucket, HourlyActivity
+from common.exceptions import InputValidationException
+from services.analytics_service import AnalyticsService, estimate_percentile
+from repositories.interfaces.rental_analytics_repository_interface import IRentalAnalyticsRepository
+from repositories.rental_repository import RentalRepository
+from db.migrations import m0006_rental_usage_rollups as rollup_migration
+from common.interfaces.logger_interface import ILogger
+
+@pytest.fixture
+def mock_analytics_repo() -> AsyncMock:
+    """Fixture for mocking the Rental Analytics Repository interface."""
+    return AsyncMock(spec=IRentalAnalyticsRepository)
+
+@pytest.fixture
+def analytics_service(mock_analytics_repo: AsyncMock) -> AnalyticsService:
+    """Fixture that provides an AnalyticsService instance injected with mocked dependencies."""
+    return AnalyticsService(logger=Mock(spec=ILogger), repository=mock_analytics_repo)
+
+def test_estimate_percentile_interpolates_within_bucket() -> None:
+    """
+    Estimate a percentile from the duration histogram.
+
+    Verifies that the rank is located in its bucket and interpolated linearly
+    between the bucket bounds, and that ranks in the open-ended last bucket
+    are reported as its lower bound.
+    """
+    # Setup: 10 rentals in [1h, 2h) and 10 in [30d, ...)
+    histogram = {4: 10, 14: 10}
+
+    # Act / Assert
+    assert estimate_percentile(histogram, 0.25) == pytest.approx(3600 + 3600 * 0.5)
+    assert estimate_percentile(histogram, 0.9) == 2592000
+    assert estimate_percentile({}, 0.5) is None
+
+@pytest.mark.asyncio
+async def test_get_rental_durations(analytics_service: AnalyticsService, mock_analytics_repo: AsyncMock) -> None:
+    """
+    Summarize rental durations from the rollup histogram.
+
+    Verifies that the buckets are returned with their bounds in order and that
+    the total and median are derived from them.
+    """
+    # Setup
+    mock_analytics_repo.get_duration_histogram.return_value = {3: 2, 1: 2}
+
+    # Act
+    stats = await analytics_service.get_rental_durations(date(2024, 1, 1), date(2024, 12, 31))
+
+    # Assert
+    assert stats.rentals == 4
+    assert stats.buckets == [DurationBucket(lower_seconds=0, upper_seconds=900, rentals=2), DurationBucket(lower_seconds=1800, upper_seconds=3600, rentals=2)]
+    assert stats.p50_seconds == 900
+    mock_analytics_repo.get_duration_histogram.assert_called_once_with(date(2024, 1, 1), date(2024, 12, 31))
+
+@pytest.mark.asyncio
+async def test_get_rental_durations_folds_bucket_zero_into_first(analytics_service: AnalyticsService, mock_analytics_repo: AsyncMock) -> None:
+    """
+    Report rentals below the first bucket bound as the shortest bucket.
+
+    Verifies that a bucket 0 row (a negative duration from clock skew) is merged
+    into [0, 15m) instead of being read as the open-ended last bucket.
+    """
+    # Setup
+    mock_analytics_repo.get_duration_histogram.return_value = {0: 1, 1: 2}
+
+    # Act
+    stats = await analytics_service.get_rental_durations(date(2024, 1, 1), date(2024, 1, 31))
+
+    # Assert
+    assert stats.buckets == [DurationBucket(lower_seconds=0, upper_seconds=900, rentals=3)]
+    assert stats.p99_seconds <= 900
+
+@pytest.mark.asyncio
+async def test_rollup_clamps_negative_durations() -> None:
+    """
+    Keep clock-skewed rentals inside the duration histogram.
+
+    Verifies that both the incremental rollup and the backfill clamp the
+    duration at zero before bucketing it, so width_bucket never yields bucket 0.
+    """
+    # Setup
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    session.execute.return_value.first.return_value = None
+
+    # Act
+    await RentalRepository(session).end_active_rental(uuid4())
+
+    # Assert
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.asyncpg.dialect()))
+    assert "width_bucket(greatest(" in sql
+    assert "width_bucket(greatest(0," in rollup_migration.MIGRATION.statements[-1]
+
+@pytest.mark.asyncio
+async def test_get_busiest_hours_ranks_every_hour(analytics_service: AnalyticsService, mock_analytics_repo: AsyncMock) -> None:
+    """
+    Rank the hours of the day by cars in use.
+
+    Verifies that hours without any rollup rows are reported as idle and that
+    the busiest hour comes first.
+    """
+    # Setup
+    mock_analytics_repo.get_hourly_activity.return_value = [HourlyActivity(8, 5, 1.5), HourlyActivity(17, 9, 3.25)]
+
+    # Act
+    hours = await analytics_service.get_busiest_hours(date(2024, 1, 1), date(2024, 1, 31))
+
+    # Assert
+    assert len(hours) == 24
+    assert [hour.hour_of_day for hour in hours[:2]] == [17, 8]
+    assert hours[-1].average_cars_in_use == 0.0
+
+@pytest.mark.asyncio
+async def test_analytics_rejects_inverted_window(analytics_service: AnalyticsService, mock_analytics_repo: AsyncMock) -> None:
+    """
+    Refuse a date window whose bounds are reversed.
+
+    Verifies that the window is rejected before the repository is queried.
+    """
+    # Act / Assert
+    with pytest.raises(InputValidationException) as exc_info:
+        await analytics_service.get_model_utilization(date(2024, 2, 1), date(2024, 1, 1))
+    assert "from_date cannot be later than to_date" in str(exc_info.value)
+    mock_analytics_repo.get_model_utilization.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_end_active_rental_updates_rollups_in_same_statement() -> None:
+    """
+    Maintain the usage rollups while ending a rental.
+
+    Verifies that closing a rental is still a single statement and that it
+    upserts into every rollup table, so the rollups cannot drift from rentals.
+    """
+    # Setup
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    session.execute.return_value.first.return_value = None
+
+    # Act
+    await RentalRepository(session).end_active_rental(uuid4())
+
+    # Assert
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.asyncpg.dialect()))
+    for table in ("rental_usage_hourly", "rental_usage_daily_by_car", "rental_durations_daily"):
+        assert f"INSERT INTO {table}" in sql
+    assert sql.count("ON CONFLICT") == 3
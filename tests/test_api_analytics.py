@@ -0,0 +1,77 @@
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import date
+from api.api import app
+from api.factories import get_db, analytics_service_factory
+from domain.entities.analytics import CarUtilization, DurationBucket, RentalDurationStats
+from common.exceptions import InputValidationException
+from services.interfaces.analytics_service_interface import IAnalyticsService
+
+mock_analytics_service: AsyncMock = AsyncMock(spec=IAnalyticsService)
+
+def override_get_db() -> None:
+    """Mock the DB dependency so no connection is attempted."""
+    pass
+
+def override_analytics_service_factory() -> AsyncMock:
+    """Mock the factory to return our controlled mocked service."""
+    return mock_analytics_service
+
+app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[analytics_service_factory] = override_analytics_service_factory
+
+client: TestClient = TestClient(app)
+
+def test_api_get_car_utilization() -> None:
+    """
+    API Endpoint: List the most used cars in a date window.
+
+    Ensures that the dates and limit are parsed and passed to the service and
+    that each car is serialized with its utilization.
+    """
+    # Setup
+    car_id = uuid4()
+    mock_analytics_service.get_car_utilization.return_value = [CarUtilization(car_id=car_id, model="Kia", rented_seconds=43200.0, rentals=3, utilization=0.5)]
+
+    # Act
+    response = client.get("/analytics/utilization/cars", params={"from_date": "2024-01-01", "to_date": "2024-01-01", "limit": 5})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == [{"car_id": str(car_id), "model": "Kia", "rented_seconds": 43200.0, "rentals": 3, "utilization": 0.5}]
+    mock_analytics_service.get_car_utilization.assert_called_once_with(date(2024, 1, 1), date(2024, 1, 1), 5)
+
+def test_api_get_rental_durations() -> None:
+    """
+    API Endpoint: Describe rental durations in a date window.
+
+    Ensures that the percentiles and histogram buckets are serialized,
+    including the open-ended last bucket.
+    """
+    # Setup
+    mock_analytics_service.get_rental_durations.return_value = RentalDurationStats(rentals=1, p50_seconds=2592000.0, p90_seconds=2592000.0, p99_seconds=2592000.0, buckets=[DurationBucket(lower_seconds=2592000, upper_seconds=None, rentals=1)])
+
+    # Act
+    response = client.get("/analytics/rental-durations", params={"from_date": "2024-01-01", "to_date": "2024-12-31"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["p50_seconds"] == 2592000.0
+    assert response.json()["buckets"] == [{"lower_seconds": 2592000, "upper_seconds": None, "rentals": 1}]
+
+def test_api_analytics_invalid_window() -> None:
+    """
+    API Endpoint: Reject a reversed date window.
+
+    Ensures that an InputValidationException from the service becomes a 400 response.
+    """
+    # Setup
+    mock_analytics_service.get_busiest_hours.side_effect = InputValidationException("from_date cannot be later than to_date")
+
+    # Act
+    response = client.get("/analytics/busiest-hours", params={"from_date": "2024-02-01", "to_date": "2024-01-01"})
+
+    # Assert
+    assert response.status_code == 400
+    mock_analytics_service.get_busiest_hours.side_effect = None
@@ -0,0 +1,190 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List
+from prometheus_client import REGISTRY
+from api.api import app
+from api.factories import get_db, car_service_factory
+from common.config import settings
+from domain.entities.car import CarEntity, CarFilter, CarStatus, CarStatusTransition
+from services.interfaces.car_service_interface import ICarService
+
+mock_car_service: AsyncMock = AsyncMock(spec=ICarService)
+
+def override_get_db() -> None:
+    """Mock the DB dependency so no connection is attempted."""
+    pass
+
+def override_car_service_factory() -> AsyncMock:
+    """Mock the factory to return our controlled mocked service."""
+    return mock_car_service
+
+app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[car_service_factory] = override_car_service_factory
+
+client: TestClient = TestClient(app)
+
+def _car(model: str = "Kia") -> CarEntity:
+    now = datetime.now(timezone.utc)
+    return CarEntity(id=uuid4(), model=model, year=2021, status=CarStatus.AVAILABLE, created_at=now, updated_at=now)
+
+async def _iterate(cars: List[CarEntity]) -> AsyncIterator[CarEntity]:
+    for car in cars:
+        yield car
+
+def test_api_get_cars_page_sets_next_cursor() -> None:
+    """
+    API Endpoint: Fetch one keyset page of cars.
+
+    Ensures that passing `limit` routes to the paginated service call and that the
+    cursor for the following page is exposed through the X-Next-Cursor header.
+    """
+    # Setup
+    cars = [_car(), _car()]
+    mock_car_service.get_cars_page.return_value = (cars, "next-page-cursor")
+
+    # Act
+    response = client.get("/cars", params={"limit": 2, "car_status": "available"})
+
+    # Assert
+    assert response.status_code == 200
+    assert [car["id"] for car in response.json()] == [str(car.id) for car in cars]
+    assert response.headers["X-Next-Cursor"] == "next-page-cursor"
+    mock_car_service.get_cars_page.assert_called_once_with(CarStatus.AVAILABLE, 2, None)
+
+def test_api_get_cars_stream_ndjson() -> None:
+    """
+    API Endpoint: Stream the fleet as newline-delimited JSON.
+
+    Ensures that `stream=true` returns one JSON document per line with the same
+    fields as the regular list response.
+    """
+    # Setup
+    cars = [_car("Kia"), _car("Mazda")]
+    mock_car_service.stream_cars.return_value = _iterate(cars)
+
+    # Act
+    response = client.get("/cars", params={"stream": "true"})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["model"] for line in lines] == ["Kia", "Mazda"]
+    assert lines[0]["status"] == "available"
+
+def test_api_update_cars_status_bulk() -> None:
+    """
+    API Endpoint: Move several cars to maintenance in one request.
+
+    Ensures that the per-car outcome returned by the service is split into the
+    updated, unchanged, rented and not-found lists of the response.
+    """
+    # Setup
+    updated, unchanged, rented, missing = uuid4(), uuid4(), uuid4(), uuid4()
+    mock_car_service.update_cars_status.return_value = ([
+        CarStatusTransition(car_id=updated, previous_status=CarStatus.AVAILABLE, rented=False, updated=True),
+        CarStatusTransition(car_id=unchanged, previous_status=CarStatus.MAINTENANCE, rented=False, updated=False),
+        CarStatusTransition(car_id=rented, previous_status=CarStatus.IN_USE, rented=True, updated=False),
+    ], [missing])
+
+    # Act
+    response = client.post("/cars/bulk/status", json={"status": "under_maintenance", "car_ids": [str(updated), str(unchanged), str(rented), str(missing)]})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {"updated": [str(updated)], "unchanged": [str(unchanged)], "rented": [str(rented)], "not_found": [str(missing)]}
+
+def test_api_metrics_use_route_template_labels() -> None:
+    """
+    API Middleware: Label request latency by route template.
+
+    Ensures that requests for different car ids share one series labelled with
+    the route template and status code, and that unknown paths are folded into a
+    single `unmatched` series instead of creating one series per path.
+    """
+    # Setup
+    mock_car_service.get_car.return_value = _car()
+    paths = [f"/cars/{uuid4()}", f"/cars/{uuid4()}", f"/no-such-path-{uuid4()}"]
+
+    # Act
+    for path in paths:
+        client.get(path)
+
+    # Assert
+    series = {sample.labels["endpoint"] for metric in REGISTRY.collect() if metric.name == "drivenow_http_request_duration_seconds" for sample in metric.samples}
+    assert "/cars/{car_id}" in series
+    assert "unmatched" in series
+    assert not series.intersection(paths)
+    assert REGISTRY.get_sample_value("drivenow_http_request_duration_seconds_count", {"method": "GET", "endpoint": "/cars/{car_id}", "status_code": "200"}) >= 2
+
+def test_api_fast_json_matches_response_model_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    API Endpoint: Serve car lists through the opt-in fast JSON path.
+
+    Ensures that the bytes produced by the fast path are identical to the
+    response-model path for UTC, offset and naive timestamps with and without
+    microseconds, non-ASCII text and every status, and that pagination headers
+    are kept.
+    """
+    # Setup
+    base = datetime(2024, 1, 1, 8, 30, tzinfo=timezone.utc)
+    cars = [
+        CarEntity(model="Škoda Fabia", year=2021, status=CarStatus.AVAILABLE, created_at=base, updated_at=base.replace(microsecond=450)),
+        CarEntity(model="Kia", year=2019, status=CarStatus.IN_USE, created_at=base.astimezone(timezone(timedelta(hours=5, minutes=30))), updated_at=base),
+        CarEntity(model="Mazda", year=2020, status=CarStatus.MAINTENANCE, created_at=datetime(2024, 1, 1, 8, 30, 0, 120000), updated_at=base),
+    ]
+    mock_car_service.get_cars_page.return_value = (cars, "next-page-cursor")
+
+    # Act
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+    default_response = client.get("/cars", params={"limit": 3})
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast_response = client.get("/cars", params={"limit": 3})
+
+    # Assert
+    assert fast_response.status_code == 200
+    assert fast_response.content == default_response.content
+    assert fast_response.headers["content-type"] == default_response.headers["content-type"]
+    assert fast_response.headers["X-Next-Cursor"] == "next-page-cursor"
+
+def test_api_search_cars() -> None:
+    """
+    API Endpoint: Search the fleet by status, model prefix and year range.
+
+    Ensures that the query parameters are translated into a CarFilter, that the
+    route is not mistaken for a car id, and that the next-page cursor is exposed
+    through the X-Next-Cursor header.
+    """
+    # Setup
+    cars = [_car("Kia Picanto")]
+    mock_car_service.search_cars.return_value = (cars, "next-page-cursor")
+
+    # Act
+    response = client.get("/cars/search", params={"car_status": "available", "model": "kia", "min_year": 2018, "max_year": 2022, "limit": 1})
+
+    # Assert
+    assert response.status_code == 200
+    assert [car["id"] for car in response.json()] == [str(cars[0].id)]
+    assert response.headers["X-Next-Cursor"] == "next-page-cursor"
+    mock_car_service.search_cars.assert_called_once_with(CarFilter(status=CarStatus.AVAILABLE, model_prefix="kia", min_year=2018, max_year=2022), 1, None)
+
+def test_api_create_cars_bulk_rejects_short_model() -> None:
+    """
+    API Endpoint: Reject a bulk create whose model name is too short.
+
+    Ensures that bulk items enforce the same minimum model length as the
+    single-car endpoint and that the service is never called.
+    """
+    # Setup
+    mock_car_service.create_cars.reset_mock()
+
+    # Act
+    response = client.post("/cars/bulk", json={"cars": [{"model": "Kia", "year": 2021}, {"model": "K", "year": 2021}]})
+
+    # Assert
+    assert response.status_code == 422
+    mock_car_service.create_cars.assert_not_called()
@@ -4,7 +4,7 @@ from uuid import uuid4
 from datetime import datetime, timezone
 from api.api import app
 from api.factories import get_db, rental_service_factory
-from domain.entities.rental import RentalEntity
+from domain.entities.rental import RentalEntity, RentalFilter
 from services.interfaces.rental_service_interface import IRentalService
 
 mock_rental_service: AsyncMock = AsyncMock(spec=IRentalService)
@@ -62,3 +62,46 @@ def test_api_create_rental_invalid_input() -> None:
     
     # Assert
     assert response.status_code == 422
+
+def test_api_get_rentals_with_filters() -> None:
+    """
+    API Endpoint: List rentals with server-side filters.
+
+    Ensures that the query parameters are translated into a RentalFilter, that the
+    page is serialized, and that the next-page cursor is exposed as a header.
+    """
+    # Setup
+    car_id = uuid4()
+    now = datetime.now(timezone.utc)
+    mock_rental = RentalEntity(id=uuid4(), car_id=car_id, customer_name="Moshe Binieli", start_date=now, created_at=now, updated_at=now)
+    mock_rental_service.get_rentals_page.return_value = ([mock_rental], "next-page-cursor")
+
+    # Act
+    response = client.get("/rentals", params={"active": "true", "car_id": str(car_id), "customer_name": "mos", "limit": 1})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()[0]["id"] == str(mock_rental.id)
+    assert response.headers["X-Next-Cursor"] == "next-page-cursor"
+    filters, limit, cursor = mock_rental_service.get_rentals_page.call_args.args
+    assert filters == RentalFilter(active=True, car_id=car_id, customer_name="mos")
+    assert (limit, cursor) == (1, None)
+
+def test_api_get_rentals_include_archived() -> None:
+    """
+    API Endpoint: List rentals including the archived history.
+
+    Ensures that `include_archived=true` is carried into the RentalFilter so the
+    repository also reads the archive table.
+    """
+    # Setup
+    mock_rental_service.get_rentals_page.return_value = ([], None)
+
+    # Act
+    response = client.get("/rentals", params={"active": "false", "include_archived": "true"})
+
+    # Assert
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+    filters, _, _ = mock_rental_service.get_rentals_page.call_args.args
+    assert filters == RentalFilter(active=False, include_archived=True)
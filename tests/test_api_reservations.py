@@ -0,0 +1,103 @@
+from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+from api.api import app
+from api.factories import get_db, reservation_service_factory
+from domain.entities.car import CarEntity
+from domain.entities.reservation import ReservationEntity
+from common.exceptions import ReservationConflictException
+from services.interfaces.reservation_service_interface import IReservationService
+
+mock_reservation_service: AsyncMock = AsyncMock(spec=IReservationService)
+
+def override_get_db() -> None:
+    """Mock the DB dependency so no connection is attempted."""
+    pass
+
+def override_reservation_service_factory() -> AsyncMock:
+    """Mock the factory to return our controlled mocked service."""
+    return mock_reservation_service
+
+app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[reservation_service_factory] = override_reservation_service_factory
+
+client: TestClient = TestClient(app)
+
+def test_api_create_reservation_success() -> None:
+    """
+    API Endpoint: Successfully book a car.
+
+    Ensures that a well-formed payload is passed to the service and the booking
+    comes back as a 201 response.
+    """
+    # Setup
+    car_id = uuid4()
+    start = datetime(2030, 1, 1, 9, tzinfo=timezone.utc)
+    end = start + timedelta(days=2)
+    mock_reservation_service.create_reservation.return_value = ReservationEntity(car_id=car_id, customer_name="Dana", start_time=start, end_time=end, created_at=datetime.now(timezone.utc))
+
+    # Act
+    payload = {"car_id": str(car_id), "customer_name": "Dana", "start_time": start.isoformat(), "end_time": end.isoformat()}
+    response = client.post("/reservations", json=payload)
+
+    # Assert
+    assert response.status_code == 201
+    assert response.json()["car_id"] == str(car_id)
+    mock_reservation_service.create_reservation.assert_called_with(car_id, "Dana", start, end)
+
+def test_api_create_reservation_conflict() -> None:
+    """
+    API Endpoint: Fail to book an overlapping window.
+
+    Ensures that a ReservationConflictException is translated into a 409 response.
+    """
+    # Setup
+    mock_reservation_service.create_reservation.side_effect = ReservationConflictException("Car is already reserved for an overlapping period")
+
+    # Act
+    payload = {"car_id": str(uuid4()), "customer_name": "Dana", "start_time": "2030-01-01T09:00:00Z", "end_time": "2030-01-02T09:00:00Z"}
+    response = client.post("/reservations", json=payload)
+
+    # Assert
+    assert response.status_code == 409
+    assert "already reserved" in response.json()["detail"]
+    mock_reservation_service.create_reservation.side_effect = None
+
+def test_api_get_free_cars() -> None:
+    """
+    API Endpoint: List cars free during a window.
+
+    Ensures that the route is not mistaken for a reservation id and that the
+    next-page cursor is exposed through the X-Next-Cursor header.
+    """
+    # Setup
+    now = datetime.now(timezone.utc)
+    cars = [CarEntity(id=uuid4(), model="Kia", year=2021, created_at=now, updated_at=now)]
+    mock_reservation_service.get_free_cars_page.return_value = (cars, "next-page-cursor")
+
+    # Act
+    response = client.get("/reservations/free-cars", params={"start_time": "2030-01-01T09:00:00Z", "end_time": "2030-01-02T09:00:00Z", "limit": 1})
+
+    # Assert
+    assert response.status_code == 200
+    assert [car["id"] for car in response.json()] == [str(cars[0].id)]
+    assert response.headers["X-Next-Cursor"] == "next-page-cursor"
+
+def test_api_cancel_reservation() -> None:
+    """
+    API Endpoint: Cancel a booking.
+
+    Ensures that a successful cancellation returns 204 with no body.
+    """
+    # Setup
+    reservation_id = uuid4()
+    mock_reservation_service.cancel_reservation.return_value = None
+
+    # Act
+    response = client.delete(f"/reservations/{reservation_id}")
+
+    # Assert
+    assert response.status_code == 204
+    assert response.content == b""
+    mock_reservation_service.cancel_reservation.assert_called_once_with(reservation_id)
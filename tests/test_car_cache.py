@@ -0,0 +1,147 @@
+import pytest
+from unittest.mock import AsyncMock
+from domain.entities.car import CarEntity, CarStatus
+from repositories.car_cache import CarCache
+from repositories.cached_car_repository import CachedCarRepository
+from repositories.interfaces.car_repository_interface import ICarRepository
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fixture providing a manually advanced monotonic clock."""
+    return FakeClock()
+
+@pytest.fixture
+def cache(clock: FakeClock) -> CarCache:
+    """Fixture that provides a small CarCache driven by the fake clock."""
+    return CarCache(max_size=2, ttl_seconds=10, clock=clock)
+
+@pytest.fixture
+def mock_car_repo() -> AsyncMock:
+    """Fixture for mocking the database-backed Car Repository."""
+    return AsyncMock(spec=ICarRepository)
+
+def test_cache_evicts_least_recently_used(cache: CarCache) -> None:
+    """
+    Evict the least recently used car once the cache is full.
+
+    Verifies that reading an entry refreshes its position so the untouched one
+    is dropped first.
+    """
+    # Setup
+    first, second, third = CarEntity(model="Kia", year=2021), CarEntity(model="Mazda", year=2020), CarEntity(model="Ford", year=2019)
+    cache.put(first, cache.generation())
+    cache.put(second, cache.generation())
+
+    # Act
+    cache.get(first.id)
+    cache.put(third, cache.generation())
+
+    # Assert
+    assert cache.get(first.id) == first
+    assert cache.get(second.id) is None
+    assert cache.get(third.id) == third
+
+def test_cache_expires_entries(cache: CarCache, clock: FakeClock) -> None:
+    """
+    Drop cached cars once their time to live has passed.
+
+    Verifies that an expired entry is reported as a miss.
+    """
+    # Setup
+    car = CarEntity(model="Kia", year=2021)
+    cache.put(car, cache.generation())
+
+    # Act
+    clock.now = 10
+
+    # Assert
+    assert cache.get(car.id) is None
+
+def test_cache_skips_reads_older_than_invalidation(cache: CarCache) -> None:
+    """
+    Refuse to cache a row read before an invalidation arrived.
+
+    Verifies that a lookup which raced a concurrent write cannot repopulate the
+    cache with the pre-write row.
+    """
+    # Setup
+    car = CarEntity(model="Kia", year=2021)
+    generation = cache.generation()
+
+    # Act
+    cache.invalidate([car.id])
+    cache.put(car, generation)
+
+    # Assert
+    assert cache.get(car.id) is None
+
+@pytest.mark.asyncio
+async def test_cached_repository_reads_through(cache: CarCache, mock_car_repo: AsyncMock) -> None:
+    """
+    Serve repeated lookups of the same car from the cache.
+
+    Verifies that only the first lookup reaches the database and that callers
+    receive copies they can mutate without corrupting the cached entry.
+    """
+    # Setup
+    car = CarEntity(model="Kia", year=2021)
+    mock_car_repo.get_by_id.return_value = car
+    repository = CachedCarRepository(mock_car_repo, cache)
+
+    # Act
+    first = await repository.get_by_id(car.id)
+    first.status = CarStatus.MAINTENANCE
+    second = await repository.get_by_id(car.id)
+
+    # Assert
+    mock_car_repo.get_by_id.assert_awaited_once_with(car.id)
+    assert second.status == CarStatus.AVAILABLE
+
+@pytest.mark.asyncio
+async def test_cached_repository_bypasses_cache_after_write(cache: CarCache, mock_car_repo: AsyncMock) -> None:
+    """
+    Never cache a car written by the current, uncommitted session.
+
+    Verifies that an update invalidates the cached entry and that later lookups
+    in the same session go to the database without populating the cache.
+    """
+    # Setup
+    car = CarEntity(model="Kia", year=2021)
+    cache.put(car, cache.generation())
+    mock_car_repo.update.return_value = car
+    mock_car_repo.get_by_id.return_value = car
+    repository = CachedCarRepository(mock_car_repo, cache)
+
+    # Act
+    await repository.update(car)
+    await repository.get_by_id(car.id)
+
+    # Assert
+    mock_car_repo.get_by_id.assert_awaited_once_with(car.id, for_update=False)
+    assert cache.get(car.id) is None
+
+@pytest.mark.asyncio
+async def test_cached_repository_locked_read_skips_cache(cache: CarCache, mock_car_repo: AsyncMock) -> None:
+    """
+    Read the current row when the caller asks for a lock.
+
+    Verifies that a for-update lookup ignores the cached copy.
+    """
+    # Setup
+    car = CarEntity(model="Kia", year=2021)
+    cache.put(car, cache.generation())
+    mock_car_repo.get_by_id.return_value = car
+    repository = CachedCarRepository(mock_car_repo, cache)
+
+    # Act
+    await repository.get_by_id(car.id, for_update=True)
+
+    # Assert
+    mock_car_repo.get_by_id.assert_awaited_once_with(car.id, for_update=True)
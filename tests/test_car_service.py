@@ -0,0 +1,299 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.dialects import postgresql
+from domain.entities.car import CarEntity, CarFilter, CarStatus, CarStatusTransition
+from common.exceptions import InputValidationException
+from common.pagination import decode_cursor, encode_cursor
+from services.car_service import CarService
+from repositories.car_repository import CarRepository
+from repositories.interfaces.car_repository_interface import ICarRepository
+from repositories.interfaces.unit_of_work_interface import IUnitOfWork
+from common.interfaces.message_publisher_interface import IMessagePublisher
+from common.interfaces.logger_interface import ILogger
+import common.messaging.messaging_constants as constants
+
+@pytest.fixture
+def mock_logger() -> Mock:
+    """Fixture for mocking the Logger interface."""
+    return Mock(spec=ILogger)
+
+@pytest.fixture
+def mock_message_publisher() -> Mock:
+    """Fixture for mocking the Message Publisher interface."""
+    return Mock(spec=IMessagePublisher)
+
+@pytest.fixture
+def mock_car_repo() -> AsyncMock:
+    """Fixture for mocking the Car Repository interface."""
+    return AsyncMock(spec=ICarRepository)
+
+@pytest.fixture
+def mock_unit_of_work() -> AsyncMock:
+    """Fixture for mocking the Unit of Work interface."""
+    return AsyncMock(spec=IUnitOfWork)
+
+@pytest.fixture
+def car_service(mock_logger: Mock, mock_message_publisher: Mock, mock_car_repo: AsyncMock, mock_unit_of_work: AsyncMock) -> CarService:
+    """Fixture that provides a CarService instance injected with mocked dependencies."""
+    return CarService(
+        logger=mock_logger,
+        message_publisher=mock_message_publisher,
+        repository=mock_car_repo,
+        unit_of_work=mock_unit_of_work
+    )
+
+def _cars(count: int) -> list[CarEntity]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [CarEntity(id=uuid4(), model="Kia", year=2021, created_at=start + timedelta(minutes=i)) for i in range(count)]
+
+@pytest.mark.asyncio
+async def test_get_cars_page_with_more_rows(car_service: CarService, mock_car_repo: AsyncMock) -> None:
+    """
+    Return a full page and a cursor pointing at its last car.
+
+    Verifies that the service over-fetches by one row to detect a following page
+    and encodes the keyset (created_at, id) of the last returned car.
+    """
+    # Setup
+    cars = _cars(3)
+    mock_car_repo.get_page.return_value = cars
+
+    # Act
+    page, next_cursor = await car_service.get_cars_page(CarStatus.AVAILABLE, limit=2)
+
+    # Assert
+    assert page == cars[:2]
+    assert decode_cursor(next_cursor) == (cars[1].created_at, cars[1].id)
+    mock_car_repo.get_page.assert_called_once_with(status=CarStatus.AVAILABLE, limit=3, after=None)
+
+@pytest.mark.asyncio
+async def test_get_cars_page_last_page(car_service: CarService, mock_car_repo: AsyncMock) -> None:
+    """
+    Return the last page without a cursor.
+
+    Verifies that the incoming cursor is decoded into the repository keyset and
+    that no next cursor is produced once fewer rows than requested come back.
+    """
+    # Setup
+    previous = _cars(1)[0]
+    cars = _cars(1)
+    mock_car_repo.get_page.return_value = cars
+    cursor = encode_cursor(previous.created_at, previous.id)
+
+    # Act
+    page, next_cursor = await car_service.get_cars_page(None, limit=2, cursor=cursor)
+
+    # Assert
+    assert page == cars
+    assert next_cursor is None
+    mock_car_repo.get_page.assert_called_once_with(status=None, limit=3, after=(previous.created_at, previous.id))
+
+@pytest.mark.asyncio
+async def test_get_cars_page_invalid_cursor(car_service: CarService, mock_car_repo: AsyncMock) -> None:
+    """
+    Reject a malformed pagination cursor.
+
+    Verifies that a cursor that cannot be decoded raises an InputValidationException
+    before the repository is queried.
+    """
+    # Act / Assert
+    with pytest.raises(InputValidationException) as exc_info:
+        await car_service.get_cars_page(None, limit=10, cursor="not-a-cursor")
+    assert "Invalid pagination cursor" in str(exc_info.value)
+    mock_car_repo.get_page.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_create_cars_reports_per_item_failures(car_service: CarService, mock_car_repo: AsyncMock, mock_message_publisher: Mock, mock_unit_of_work: AsyncMock) -> None:
+    """
+    Register a batch that mixes valid and invalid cars.
+
+    Verifies that invalid items are reported by index without aborting the batch,
+    that the valid ones are inserted with a single repository call, and that one
+    aggregated event carries the number of cars added to the available fleet.
+    """
+    # Setup
+    created = [CarEntity(model="Kia", year=2021), CarEntity(model="Mazda", year=2019)]
+    mock_car_repo.create_many.return_value = created
+
+    # Act
+    cars, failures = await car_service.create_cars([("Kia", 2021), ("  ", 2020), ("Mazda", 2019), ("Ford", 1940)])
+
+    # Assert
+    assert cars == created
+    assert failures == {1: "Car model cannot be empty", 3: "Car year must be 1950 or later"}
+    mock_car_repo.create_many.assert_called_once_with([("Kia", 2021), ("Mazda", 2019)])
+    mock_message_publisher.publish_event.assert_called_once_with(constants.EVENT_CAR_CREATED_AVAILABLE, {"count": 2})
+    mock_unit_of_work.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_create_cars_all_invalid(car_service: CarService, mock_car_repo: AsyncMock, mock_message_publisher: Mock, mock_unit_of_work: AsyncMock) -> None:
+    """
+    Register a batch where every car is invalid.
+
+    Verifies that nothing is written, published or committed.
+    """
+    # Act
+    cars, failures = await car_service.create_cars([("", 2020)])
+
+    # Assert
+    assert cars == []
+    assert list(failures) == [0]
+    mock_car_repo.create_many.assert_not_called()
+    mock_message_publisher.publish_event.assert_not_called()
+    mock_unit_of_work.commit.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_update_cars_status_to_maintenance(car_service: CarService, mock_car_repo: AsyncMock, mock_message_publisher: Mock, mock_unit_of_work: AsyncMock) -> None:
+    """
+    Send a set of cars to maintenance in one call.
+
+    Verifies that rented cars are left alone, unknown ids are reported, and a single
+    aggregated event removes only the previously available cars from the gauge.
+    """
+    # Setup
+    available, maintenance, rented, missing = uuid4(), uuid4(), uuid4(), uuid4()
+    moved = CarStatusTransition(car_id=available, previous_status=CarStatus.AVAILABLE, rented=False, updated=True)
+    unchanged = CarStatusTransition(car_id=maintenance, previous_status=CarStatus.MAINTENANCE, rented=False, updated=False)
+    refused = CarStatusTransition(car_id=rented, previous_status=CarStatus.IN_USE, rented=True, updated=False)
+    mock_car_repo.update_status_many.return_value = [moved, unchanged, refused]
+
+    # Act
+    transitions, not_found = await car_service.update_cars_status(CarStatus.MAINTENANCE, car_ids=[available, maintenance, rented, missing])
+
+    # Assert
+    assert transitions == [moved, unchanged, refused]
+    assert not_found == [missing]
+    mock_car_repo.update_status_many.assert_called_once_with(CarStatus.MAINTENANCE, car_ids=[available, maintenance, rented, missing], current_status=None)
+    mock_message_publisher.publish_event.assert_called_once_with(constants.EVENT_CARS_AVAILABILITY_CHANGED, {"delta": -1})
+    mock_unit_of_work.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_update_cars_status_return_to_service(car_service: CarService, mock_car_repo: AsyncMock, mock_message_publisher: Mock) -> None:
+    """
+    Return every car under maintenance to the available fleet.
+
+    Verifies that the status filter is passed to the repository and that the
+    aggregated event adds every moved car to the available gauge.
+    """
+    # Setup
+    mock_car_repo.update_status_many.return_value = [
+        CarStatusTransition(car_id=uuid4(), previous_status=CarStatus.MAINTENANCE, rented=False, updated=True) for _ in range(3)
+    ]
+
+    # Act
+    _, not_found = await car_service.update_cars_status(CarStatus.AVAILABLE, current_status=CarStatus.MAINTENANCE)
+
+    # Assert
+    assert not_found == []
+    mock_car_repo.update_status_many.assert_called_once_with(CarStatus.AVAILABLE, car_ids=None, current_status=CarStatus.MAINTENANCE)
+    mock_message_publisher.publish_event.assert_called_once_with(constants.EVENT_CARS_AVAILABILITY_CHANGED, {"delta": 3})
+
+@pytest.mark.asyncio
+async def test_update_cars_status_rejects_in_use(car_service: CarService, mock_car_repo: AsyncMock) -> None:
+    """
+    Refuse to move cars into use outside of a rental.
+
+    Verifies that an IN_USE target raises an InputValidationException before the
+    repository is called.
+    """
+    # Act / Assert
+    with pytest.raises(InputValidationException):
+        await car_service.update_cars_status(CarStatus.IN_USE, car_ids=[uuid4()])
+    mock_car_repo.update_status_many.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_update_cars_status_requires_target(car_service: CarService, mock_car_repo: AsyncMock) -> None:
+    """
+    Refuse a bulk status update that selects no cars.
+
+    Verifies that omitting both the car ids and the status filter is rejected
+    instead of silently updating the whole fleet.
+    """
+    # Act / Assert
+    with pytest.raises(InputValidationException) as exc_info:
+        await car_service.update_cars_status(CarStatus.MAINTENANCE)
+    assert "Either car ids or a current status filter" in str(exc_info.value)
+    mock_car_repo.update_status_many.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_search_cars_paginates(car_service: CarService, mock_car_repo: AsyncMock) -> None:
+    """
+    Search the fleet one page at a time.
+
+    Verifies that the filters are passed to the repository unchanged, that one
+    extra row is requested to detect a following page, and that the cursor
+    points at the last car returned.
+    """
+    # Setup
+    cars = _cars(3)
+    mock_car_repo.search.return_value = cars
+    filters = CarFilter(status=CarStatus.AVAILABLE, model_prefix="Ki", min_year=2018, max_year=2022)
+
+    # Act
+    page, next_cursor = await car_service.search_cars(filters, limit=2)
+
+    # Assert
+    assert page == cars[:2]
+    assert decode_cursor(next_cursor) == (cars[1].created_at, cars[1].id)
+    mock_car_repo.search.assert_called_once_with(filters, limit=3, after=None)
+
+@pytest.mark.asyncio
+async def test_search_cars_rejects_inverted_year_range(car_service: CarService, mock_car_repo: AsyncMock) -> None:
+    """
+    Refuse a year range whose bounds are reversed.
+
+    Verifies that the search is rejected before the repository is queried.
+    """
+    # Act / Assert
+    with pytest.raises(InputValidationException) as exc_info:
+        await car_service.search_cars(CarFilter(min_year=2022, max_year=2018), limit=10)
+    assert "min_year cannot be greater than max_year" in str(exc_info.value)
+    mock_car_repo.search.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_update_cars_status_reports_mismatched_status_as_unchanged(car_service: CarService, mock_car_repo: AsyncMock, mock_message_publisher: Mock) -> None:
+    """
+    Leave a listed car alone when its status does not match the filter.
+
+    Verifies that a car given by id whose status differs from the current
+    status filter is reported as unchanged rather than not found, and that
+    only ids the repository did not return are listed as not found.
+    """
+    # Setup
+    mismatched, missing = uuid4(), uuid4()
+    mock_car_repo.update_status_many.return_value = [
+        CarStatusTransition(car_id=mismatched, previous_status=CarStatus.AVAILABLE, rented=False, updated=False)
+    ]
+
+    # Act
+    transitions, not_found = await car_service.update_cars_status(CarStatus.AVAILABLE, car_ids=[mismatched, missing], current_status=CarStatus.MAINTENANCE)
+
+    # Assert
+    assert [transition.car_id for transition in transitions] == [mismatched]
+    assert not_found == [missing]
+    mock_message_publisher.publish_event.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_update_status_many_applies_status_filter_only_to_the_update() -> None:
+    """
+    Select explicitly listed cars by id alone.
+
+    Verifies that with both car ids and a current status the repository still
+    returns every listed car, applying the status filter only to the cars it
+    changes, so existing cars are never mistaken for missing ones.
+    """
+    # Setup
+    session = AsyncMock()
+    session.execute.return_value = []
+
+    # Act
+    await CarRepository(session).update_status_many(CarStatus.AVAILABLE, car_ids=[uuid4()], current_status=CarStatus.MAINTENANCE)
+
+    # Assert
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.asyncpg.dialect()))
+    targets, changed = sql.split("changed AS", 1)
+    assert "WHERE cars.id IN" in targets
+    assert "AND cars.status =" not in targets
+    assert "targets.status =" in changed
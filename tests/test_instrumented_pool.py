@@ -0,0 +1,38 @@
+import pytest
+from unittest.mock import Mock
+from prometheus_client import REGISTRY
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+from db.instrumented_pool import InstrumentedAsyncPool, observe_pool
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+@pytest.mark.asyncio
+async def test_pool_reports_checkouts_wait_time_and_timeouts() -> None:
+    """
+    Export the pool's checkout count, acquisition wait and timeouts.
+
+    Verifies that a held connection shows up in the checked-out gauge, that
+    every acquisition is timed, and that a request which cannot get a
+    connection within pool_timeout is counted before the error is raised.
+    """
+    # Setup
+    pool = InstrumentedAsyncPool(creator=Mock, pool_size=1, max_overflow=0, timeout=0.01)
+    observe_pool(pool, max_overflow=0)
+    waits_before = _sample("drivenow_db_pool_wait_seconds_count")
+    timeouts_before = _sample("drivenow_db_pool_timeouts_total")
+
+    # Act
+    connection = await greenlet_spawn(pool.connect)
+    checked_out = _sample("drivenow_db_pool_checked_out")
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(pool.connect)
+    await greenlet_spawn(connection.close)
+
+    # Assert
+    assert checked_out == 1
+    assert _sample("drivenow_db_pool_checked_out") == 0
+    assert _sample("drivenow_db_pool_capacity") == 1
+    assert _sample("drivenow_db_pool_wait_seconds_count") - waits_before == 2
+    assert _sample("drivenow_db_pool_timeouts_total") - timeouts_before == 1
@@ -0,0 +1,47 @@
+import logging
+import queue
+from prometheus_client import REGISTRY
+from common.logger import BoundedQueueHandler
+
+def _record(message: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord("drivenow", logging.INFO, __file__, 1, message, args, None)
+
+def test_queue_handler_defers_formatting() -> None:
+    """
+    Enqueue log records without formatting them on the calling thread.
+
+    Verifies that the message template and its arguments reach the queue as-is,
+    leaving the formatting to the listener thread.
+    """
+    # Setup
+    log_queue: queue.Queue = queue.Queue(maxsize=10)
+    handler = BoundedQueueHandler(log_queue)
+
+    # Act
+    handler.handle(_record("Car %s created", "abc"))
+
+    # Assert
+    record = log_queue.get_nowait()
+    assert record.msg == "Car %s created"
+    assert record.args == ("abc",)
+    assert record.getMessage() == "Car abc created"
+
+def test_queue_handler_drops_when_full() -> None:
+    """
+    Drop records instead of blocking when the queue is full.
+
+    Verifies that the overflowing record is counted and the queue keeps the
+    records that fit.
+    """
+    # Setup
+    log_queue: queue.Queue = queue.Queue(maxsize=1)
+    handler = BoundedQueueHandler(log_queue)
+    dropped_before = REGISTRY.get_sample_value("drivenow_log_records_dropped_total") or 0.0
+
+    # Act
+    handler.handle(_record("first"))
+    handler.handle(_record("second"))
+
+    # Assert
+    assert log_queue.qsize() == 1
+    assert REGISTRY.get_sample_value("drivenow_log_records_dropped_total") - dropped_before == 1
@@ -0,0 +1,290 @@
+import os
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess
+from common.messaging.message_schema import MessageEvent
+from domain.entities.fleet_snapshot import FleetSnapshot
+from common.config import settings
+from worker.metrics_worker import MetricsBatchConsumer, SnapshotEventFilter, aggregate_deltas, run_supervisor
+import common.messaging.messaging_constants as constants
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+# Run in a fresh interpreter, since prometheus_client only switches to multiprocess storage at import time.
+_MULTIPROCESS_GAUGE_SCRIPT = """
+import os, sys
+from worker.metrics_worker import ACTIVE_RENTALS_GAUGE, AVAILABLE_CARS_GAUGE, GaugeDeltas, apply_deltas
+if sys.argv[1] == "seed":
+    AVAILABLE_CARS_GAUGE.set(10)
+    ACTIVE_RENTALS_GAUGE.set(2)
+else:
+    apply_deltas(GaugeDeltas(available_cars=-int(sys.argv[1]), active_rentals=int(sys.argv[1])))
+print(os.getpid())
+"""
+
+def _run_in_multiprocess_mode(metrics_dir: Path, argument: str) -> int:
+    env = {**os.environ, "WORKER_PROCESSES": "2", "WORKER_METRICS_MULTIPROC_DIR": str(metrics_dir), "PROMETHEUS_MULTIPROC_DIR": str(metrics_dir)}
+    result = subprocess.run([sys.executable, "-c", _MULTIPROCESS_GAUGE_SCRIPT, argument], env=env, cwd=Path(__file__).resolve().parent.parent, capture_output=True, text=True, check=True)
+    return int(result.stdout.strip().splitlines()[-1])
+
+def _collected(metrics_dir: Path, name: str) -> float:
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=str(metrics_dir))
+    return registry.get_sample_value(name)
+
+def _message(event: MessageEvent) -> MagicMock:
+    message = MagicMock()
+    message.body = event.to_json().encode()
+    message.ack = AsyncMock()
+    message.nack = AsyncMock()
+    message.redelivered = False
+    return message
+
+def test_aggregate_deltas_nets_out_events() -> None:
+    """
+    Fold a batch of events into one change per gauge.
+
+    Verifies that opposite events cancel out and that unknown event types are
+    counted instead of affecting the gauges.
+    """
+    # Setup
+    events = [
+        MessageEvent(event_type=constants.EVENT_CAR_CREATED_AVAILABLE, payload={"count": 3}),
+        MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={}),
+        MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={}),
+        MessageEvent(event_type=constants.EVENT_RENTAL_ENDED, payload={}),
+        MessageEvent(event_type=constants.EVENT_CARS_AVAILABILITY_CHANGED, payload={"delta": -2}),
+        MessageEvent(event_type="car.painted", payload={}),
+    ]
+
+    # Act
+    deltas = aggregate_deltas(events)
+
+    # Assert
+    assert deltas.available_cars == 3 - 2 + 1 - 2
+    assert deltas.active_rentals == 1
+    assert dict(deltas.unknown_event_types) == {"car.painted": 1}
+
+@pytest.mark.asyncio
+async def test_process_batch_applies_and_acks_once() -> None:
+    """
+    Apply a batch of messages with a single acknowledgement.
+
+    Verifies that the gauges move by the aggregated deltas, malformed messages
+    are dropped, and only the last delivery is acked with multiple=True.
+    """
+    # Setup
+    consumer = MetricsBatchConsumer(batch_size=10, batch_timeout_seconds=0)
+    malformed = MagicMock(body=b"not json")
+    messages = [
+        _message(MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={})),
+        malformed,
+        _message(MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={})),
+    ]
+    available_before = _sample("drivenow_available_cars_total")
+    rentals_before = _sample("drivenow_active_rentals_total")
+
+    # Act
+    await consumer.process_batch(messages)
+
+    # Assert
+    assert _sample("drivenow_available_cars_total") - available_before == -2
+    assert _sample("drivenow_active_rentals_total") - rentals_before == 2
+    messages[-1].ack.assert_awaited_once_with(multiple=True)
+    messages[0].ack.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_process_batch_drops_event_with_invalid_delta() -> None:
+    """
+    Apply a batch containing one event with a non-integer delta.
+
+    Verifies that the bad event is counted as malformed and skipped while the
+    rest of the batch is still applied and acknowledged.
+    """
+    # Setup
+    consumer = MetricsBatchConsumer(batch_size=10, batch_timeout_seconds=0)
+    messages = [
+        _message(MessageEvent(event_type=constants.EVENT_CAR_CREATED_AVAILABLE, payload={"count": 3})),
+        _message(MessageEvent(event_type=constants.EVENT_CAR_CREATED_AVAILABLE, payload={"count": "3"})),
+        _message(MessageEvent(event_type=constants.EVENT_CARS_AVAILABILITY_CHANGED, payload={"delta": True})),
+        _message(MessageEvent(event_type=constants.EVENT_CARS_AVAILABILITY_CHANGED, payload={"delta": -1})),
+    ]
+    available_before = _sample("drivenow_available_cars_total")
+    malformed_before = _sample("drivenow_worker_malformed_messages_total")
+
+    # Act
+    await consumer.process_batch(messages)
+
+    # Assert
+    assert _sample("drivenow_available_cars_total") - available_before == 2
+    assert _sample("drivenow_worker_malformed_messages_total") - malformed_before == 2
+    messages[-1].ack.assert_awaited_once_with(multiple=True)
+    messages[-1].nack.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_process_batch_handles_naive_occurred_at() -> None:
+    """
+    Apply a batch whose event timestamp has no time zone.
+
+    Verifies that a naive `occurred_at` is read as UTC for the lag gauge instead
+    of failing the batch, so the batch is still acknowledged.
+    """
+    # Setup
+    consumer = MetricsBatchConsumer(batch_size=10, batch_timeout_seconds=0)
+    messages = [_message(MessageEvent(event_type=constants.EVENT_RENTAL_ENDED, payload={}, occurred_at=datetime(2024, 1, 1)))]
+
+    # Act
+    await consumer.process_batch(messages)
+
+    # Assert
+    messages[-1].ack.assert_awaited_once_with(multiple=True)
+    messages[-1].nack.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_process_batch_rejects_failed_batch() -> None:
+    """
+    Settle a batch that could not be applied.
+
+    Verifies that a failure while applying a batch nacks every delivery in it,
+    requeueing a fresh batch once and dropping it once it was redelivered, so
+    failed batches never pile up against the prefetch limit.
+    """
+    # Setup
+    consumer = MetricsBatchConsumer(batch_size=10, batch_timeout_seconds=0)
+    fresh = [_message(MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={})) for _ in range(2)]
+    redelivered = [_message(MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={})) for _ in range(2)]
+    redelivered[0].redelivered = True
+
+    # Act
+    with patch("worker.metrics_worker.apply_deltas", side_effect=RuntimeError("gauge failure")):
+        await consumer.process_batch(fresh)
+        await consumer.process_batch(redelivered)
+
+    # Assert
+    fresh[-1].nack.assert_awaited_once_with(multiple=True, requeue=True)
+    redelivered[-1].nack.assert_awaited_once_with(multiple=True, requeue=False)
+    fresh[-1].ack.assert_not_awaited()
+    redelivered[-1].ack.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_next_batch_stops_at_batch_size() -> None:
+    """
+    Cut a batch once it reaches the configured size.
+
+    Verifies that messages already waiting beyond the batch size are left for the
+    following batch.
+    """
+    # Setup
+    consumer = MetricsBatchConsumer(batch_size=2, batch_timeout_seconds=1)
+    messages = [_message(MessageEvent(event_type=constants.EVENT_RENTAL_ENDED, payload={})) for _ in range(3)]
+    for message in messages:
+        await consumer.on_message(message)
+
+    # Act
+    batch = await consumer._next_batch()
+
+    # Assert
+    assert batch == messages[:2]
+
+def test_snapshot_filter_skips_counted_and_duplicate_events() -> None:
+    """
+    Apply only events the startup snapshot has not already counted.
+
+    Verifies that events from transactions committed before the snapshot are
+    skipped, events from transactions still running at snapshot time are applied,
+    and a redelivered sequence number is applied only once.
+    """
+    # Setup
+    snapshot = FleetSnapshot(available_cars=5, active_rentals=2, xmin=100, xmax=110, xip=frozenset({105}))
+    event_filter = SnapshotEventFilter(snapshot, dedup_window=10)
+    committed_before = MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={}, sequence=1, txid=103)
+    in_progress = MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={}, sequence=2, txid=105)
+    after = MessageEvent(event_type=constants.EVENT_RENTAL_ENDED, payload={}, sequence=3, txid=110)
+
+    # Act
+    accepted = [event_filter.accept(event) for event in (committed_before, in_progress, after, after)]
+
+    # Assert
+    assert accepted == [False, True, True, False]
+
+def test_snapshot_filter_forgets_sequences_outside_window() -> None:
+    """
+    Bound the memory used for duplicate detection.
+
+    Verifies that only the most recent `dedup_window` sequence numbers are kept.
+    """
+    # Setup
+    event_filter = SnapshotEventFilter(FleetSnapshot(available_cars=0, active_rentals=0, xmin=1, xmax=1), dedup_window=2)
+    events = [MessageEvent(event_type=constants.EVENT_RENTAL_ENDED, payload={}, sequence=sequence, txid=10) for sequence in (1, 2, 3)]
+
+    # Act
+    for event in events:
+        event_filter.accept(event)
+
+    # Assert
+    assert event_filter.accept(events[0]) is True
+    assert event_filter.accept(events[2]) is False
+
+def test_multiprocess_gauges_sum_seed_and_consumer_deltas(tmp_path: Path) -> None:
+    """
+    Export one fleet gauge value across the supervisor and its consumers.
+
+    Verifies that the aggregated collector output is the supervisor's seed plus
+    the deltas applied by every consumer process, and that the deltas of a
+    consumer that exited still count after it is marked dead.
+    """
+    # Setup
+    _run_in_multiprocess_mode(tmp_path, "seed")
+    exited_consumer = _run_in_multiprocess_mode(tmp_path, "3")
+    _run_in_multiprocess_mode(tmp_path, "1")
+
+    # Act
+    multiprocess.mark_process_dead(exited_consumer, path=str(tmp_path))
+
+    # Assert
+    assert _collected(tmp_path, "drivenow_available_cars_total") == 10 - 3 - 1
+    assert _collected(tmp_path, "drivenow_active_rentals_total") == 2 + 3 + 1
+
+def test_supervisor_restarts_exited_consumer(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Keep the configured number of consumer processes running.
+
+    Verifies that the supervisor replaces a consumer that exited, marks the
+    exited process dead for the multiprocess collector, and terminates the
+    running consumers when it stops.
+    """
+    # Setup
+    monkeypatch.setattr(settings, "WORKER_METRICS_MULTIPROC_DIR", str(tmp_path))
+    snapshot = FleetSnapshot(available_cars=0, active_rentals=0, xmin=1, xmax=1)
+    running, exited, replacement = MagicMock(pid=111), MagicMock(pid=222, exitcode=1), MagicMock(pid=333)
+    running.is_alive.return_value = True
+    exited.is_alive.return_value = False
+    replacement.is_alive.return_value = True
+    context = MagicMock()
+    context.Process.side_effect = [running, exited, replacement]
+
+    def seed(coroutine):
+        coroutine.close()
+        return snapshot
+
+    # Act: the second supervision tick stops the loop.
+    with patch("worker.metrics_worker.asyncio.run", side_effect=seed), \
+         patch("worker.metrics_worker.start_http_server"), \
+         patch("worker.metrics_worker.signal.signal"), \
+         patch("worker.metrics_worker.multiprocess") as mock_multiprocess, \
+         patch("worker.metrics_worker.multiprocessing.get_context", return_value=context), \
+         patch("worker.metrics_worker.time.sleep", side_effect=[None, KeyboardInterrupt]):
+        with pytest.raises(KeyboardInterrupt):
+            run_supervisor(2)
+
+    # Assert
+    assert context.Process.call_count == 3
+    mock_multiprocess.mark_process_dead.assert_called_once_with(222)
+    replacement.start.assert_called_once()
+    running.terminate.assert_called_once()
+    replacement.terminate.assert_called_once()
@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock
+from common.interfaces.logger_interface import ILogger
+from db.migrations.migration import Migration
+from db.migrations.runner import MIGRATIONS, run_migrations
+
+MIGRATION_1 = Migration(version=1, description="first", statements=("CREATE TABLE one (id INTEGER)",))
+MIGRATION_2 = Migration(version=2, description="second", statements=("CREATE TABLE two (id INTEGER)", "DROP TABLE one"))
+
+def _engine(connect_version: int, locked_version: int) -> MagicMock:
+    # connect() serves the startup version check; begin() is the locked migration transaction.
+    check_connection = AsyncMock()
+    check_connection.execute.return_value.scalar_one = Mock(return_value=connect_version)
+    migrate_connection = AsyncMock()
+    migrate_connection.execute.return_value.scalar_one = Mock(return_value=locked_version)
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__.return_value = check_connection
+    engine.begin.return_value.__aenter__.return_value = migrate_connection
+    return engine
+
+@pytest.mark.asyncio
+async def test_run_migrations_at_head_only_checks_version() -> None:
+    """
+    Start quickly when the schema is already up to date.
+
+    Verifies that a database at the latest version is left alone after a single
+    version query, without taking the migration lock.
+    """
+    # Setup
+    engine = _engine(connect_version=2, locked_version=2)
+
+    # Act
+    await run_migrations(engine, Mock(spec=ILogger), [MIGRATION_1, MIGRATION_2])
+
+    # Assert
+    engine.connect.return_value.__aenter__.return_value.execute.assert_awaited_once()
+    engine.begin.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_run_migrations_applies_only_pending_versions() -> None:
+    """
+    Apply the migrations newer than the recorded version.
+
+    Verifies that the version is re-read under the lock, so a migration another
+    process already applied is skipped, and that each applied migration runs all
+    of its statements and is recorded.
+    """
+    # Setup
+    engine = _engine(connect_version=0, locked_version=1)
+    connection = engine.begin.return_value.__aenter__.return_value
+
+    # Act
+    await run_migrations(engine, Mock(spec=ILogger), [MIGRATION_1, MIGRATION_2])
+
+    # Assert
+    assert [call.args[0] for call in connection.exec_driver_sql.await_args_list] == list(MIGRATION_2.statements)
+    recorded = [call.args[1] for call in connection.execute.await_args_list if len(call.args) > 1]
+    assert recorded == [{"version": 2, "description": "second"}]
+
+def test_migration_versions_are_sequential() -> None:
+    """
+    Keep the migration list ordered and gap-free.
+
+    Verifies that versions start at 1 and increase by one, since the runner
+    compares them against the highest recorded version.
+    """
+    # Assert
+    assert [migration.version for migration in MIGRATIONS] == list(range(1, len(MIGRATIONS) + 1))
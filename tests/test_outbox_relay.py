@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from common.exceptions import MessagePublishException
+from common.interfaces.logger_interface import ILogger
+from common.messaging.message_schema import MessageEvent
+from common.messaging.rabbitmq_publisher import RabbitMQPublisher
+from services.outbox_relay import OutboxRelay
+import common.messaging.messaging_constants as constants
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """Fixture for mocking the AsyncSession used by a relay batch."""
+    return AsyncMock()
+
+@pytest.fixture
+def mock_publisher() -> AsyncMock:
+    """Fixture for mocking the pooled RabbitMQ publisher."""
+    return AsyncMock(spec=RabbitMQPublisher)
+
+@pytest.fixture
+def mock_outbox_repo() -> AsyncMock:
+    """Fixture for mocking the Outbox Repository bound to the relay session."""
+    return AsyncMock()
+
+@pytest.fixture
+def outbox_relay(mock_session: AsyncMock, mock_publisher: AsyncMock) -> OutboxRelay:
+    """Fixture that provides an OutboxRelay whose session factory yields the mocked session."""
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = mock_session
+    return OutboxRelay(Mock(spec=ILogger), mock_publisher, session_factory, batch_size=10, poll_interval_seconds=0)
+
+@pytest.mark.asyncio
+async def test_relay_batch_publishes_and_deletes(outbox_relay: OutboxRelay, mock_session: AsyncMock, mock_publisher: AsyncMock, mock_outbox_repo: AsyncMock) -> None:
+    """
+    Relay a claimed batch of outbox events.
+
+    Verifies that the events are published in one confirmed batch and only then
+    removed from the outbox in the same transaction that claimed them.
+    """
+    # Setup
+    events = [(1, MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={})), (2, MessageEvent(event_type=constants.EVENT_RENTAL_ENDED, payload={}))]
+    mock_outbox_repo.claim_batch.return_value = events
+
+    # Act
+    with patch("services.outbox_relay.OutboxRepository", return_value=mock_outbox_repo):
+        relayed = await outbox_relay.relay_batch()
+
+    # Assert
+    assert relayed == 2
+    mock_outbox_repo.claim_batch.assert_awaited_once_with(10)
+    mock_publisher.publish_batch.assert_awaited_once_with([event for _, event in events])
+    mock_outbox_repo.delete.assert_awaited_once_with([1, 2])
+    mock_session.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_relay_batch_keeps_events_when_publish_fails(outbox_relay: OutboxRelay, mock_session: AsyncMock, mock_publisher: AsyncMock, mock_outbox_repo: AsyncMock) -> None:
+    """
+    Keep outbox events when the broker does not confirm them.
+
+    Verifies that a failed publish neither deletes the rows nor commits, so the
+    events are retried on the next batch instead of being lost.
+    """
+    # Setup
+    mock_outbox_repo.claim_batch.return_value = [(1, MessageEvent(event_type=constants.EVENT_RENTAL_CREATED, payload={}))]
+    mock_publisher.publish_batch.side_effect = MessagePublishException("broker gone")
+
+    # Act / Assert
+    with patch("services.outbox_relay.OutboxRepository", return_value=mock_outbox_repo):
+        with pytest.raises(MessagePublishException):
+            await outbox_relay.relay_batch()
+    mock_outbox_repo.delete.assert_not_awaited()
+    mock_session.commit.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_relay_backs_off_while_broker_is_down(mock_publisher: AsyncMock) -> None:
+    """
+    Back off exponentially between failed relay batches.
+
+    Verifies that consecutive failures double the wait up to the cap, and that
+    a successful batch resets it to the regular poll interval.
+    """
+    # Setup
+    relay = OutboxRelay(Mock(spec=ILogger), mock_publisher, MagicMock(), batch_size=10, poll_interval_seconds=1, max_backoff_seconds=3)
+    outcomes = [MessagePublishException("broker gone")] * 3 + [0, MessagePublishException("broker gone")]
+    sleeps = []
+
+    async def record_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) == len(outcomes):
+            raise asyncio.CancelledError()
+
+    # Act
+    with patch.object(relay, "relay_batch", AsyncMock(side_effect=outcomes)), patch("services.outbox_relay.asyncio.sleep", side_effect=record_sleep):
+        with pytest.raises(asyncio.CancelledError):
+            await relay._run()
+
+    # Assert
+    assert sleeps == [2, 3, 3, 1, 2]
@@ -0,0 +1,96 @@
+import pytest
+from typing import AsyncIterator, List
+from unittest.mock import Mock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import Engine, create_engine, text
+from api.middleware.telemetry_middleware import TelemetryMiddleware
+from common.interfaces.logger_interface import ILogger
+from db.query_metrics import install_query_hooks, instrument_queries, track_queries
+from services.interfaces.metrics_service_interface import IMetricsService
+
+@pytest.fixture
+def mock_logger() -> Mock:
+    """Fixture for mocking the Logger interface."""
+    return Mock(spec=ILogger)
+
+@pytest.fixture
+def engine(mock_logger: Mock) -> Engine:
+    """Fixture that provides an in-memory SQLite engine with the query hooks installed and every statement treated as slow."""
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine, mock_logger, slow_query_seconds=0)
+    return engine
+
+@instrument_queries
+class SampleRepository:
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+    async def find_customer(self, name: str) -> int:
+        with self.engine.connect() as connection:
+            return connection.execute(text("SELECT length(:name)"), {"name": name}).scalar()
+
+    async def stream_numbers(self) -> AsyncIterator[int]:
+        with self.engine.connect() as connection:
+            for number in (1, 2):
+                yield connection.execute(text("SELECT :number"), {"number": number}).scalar()
+
+def _count(operation: str) -> float:
+    return REGISTRY.get_sample_value("drivenow_db_query_duration_seconds_count", {"operation": operation}) or 0.0
+
+@pytest.mark.asyncio
+async def test_queries_are_labelled_counted_and_logged_redacted(engine: Engine, mock_logger: Mock) -> None:
+    """
+    Time statements per repository method and log slow ones without their values.
+
+    Verifies that statements are labelled with the repository method that issued
+    them (including async generators), that they are added to the request's
+    query stats, and that the slow-query log shows parameter types only.
+    """
+    # Setup
+    repository = SampleRepository(engine)
+    stats = track_queries()
+    before = _count("SampleRepository.find_customer"), _count("SampleRepository.stream_numbers")
+
+    # Act
+    await repository.find_customer("Dana")
+    numbers: List[int] = [number async for number in repository.stream_numbers()]
+
+    # Assert
+    assert numbers == [1, 2]
+    assert _count("SampleRepository.find_customer") - before[0] == 1
+    assert _count("SampleRepository.stream_numbers") - before[1] == 2
+    assert stats.queries == 3
+    assert stats.seconds > 0
+    logged = [call.args for call in mock_logger.warning.call_args_list]
+    assert logged[0][1] == "SampleRepository.find_customer"
+    assert logged[0][-1] == "(str)"
+    assert not any("Dana" in str(arg) for args in logged for arg in args)
+
+def test_middleware_sets_db_debug_headers(engine: Engine) -> None:
+    """
+    Expose the request's database usage in debug response headers.
+
+    Verifies that X-DB-Queries and X-DB-Time report the statements issued while
+    handling the request and that the same numbers are recorded as metrics.
+    """
+    # Setup
+    metrics_service = Mock(spec=IMetricsService)
+    app = FastAPI()
+    app.add_middleware(TelemetryMiddleware, metrics_service=metrics_service, logger=Mock(spec=ILogger), db_debug_headers=True)
+
+    @app.get("/customers/{name}")
+    async def get_customer(name: str):
+        repository = SampleRepository(engine)
+        return {"found": bool(await repository.find_customer(name)), "again": bool(await repository.find_customer(name))}
+
+    # Act
+    response = TestClient(app).get("/customers/Dana")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["X-DB-Queries"] == "2"
+    assert response.headers["X-DB-Time"].endswith("ms")
+    endpoint, queries, _ = metrics_service.record_request_queries.call_args.args
+    assert (endpoint, queries) == ("/customers/{name}", 2)
@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from prometheus_client import REGISTRY
+from common.interfaces.logger_interface import ILogger
+from common.messaging.rabbitmq_publisher import RabbitMQPublisher
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+def _mock_connection() -> MagicMock:
+    channel = MagicMock()
+    channel.is_closed = False
+    channel.close = AsyncMock()
+    channel.declare_queue = AsyncMock()
+    channel.default_exchange.publish = AsyncMock()
+
+    connection = MagicMock()
+    connection.is_closed = False
+    connection.close = AsyncMock()
+    connection.channel = AsyncMock(return_value=channel)
+    return connection
+
+@pytest.fixture
+def mock_logger() -> Mock:
+    """Fixture for mocking the Logger interface."""
+    return Mock(spec=ILogger)
+
+@pytest.mark.asyncio
+async def test_publish_reuses_connection(mock_logger: Mock) -> None:
+    """
+    Publish several events through one publisher instance.
+
+    Verifies that the AMQP connection and queue declaration happen once, and that
+    the following publishes are counted as connection reuses.
+    """
+    # Setup
+    connection = _mock_connection()
+    publisher = RabbitMQPublisher(mock_logger)
+    opened_before = _sample("drivenow_rabbitmq_connections_opened_total")
+    reuses_before = _sample("drivenow_rabbitmq_connection_reuses_total")
+
+    # Act
+    with patch("common.messaging.rabbitmq_publisher.aio_pika.connect_robust", AsyncMock(return_value=connection)) as connect:
+        for _ in range(3):
+            await publisher.publish_event("rental.created", {})
+
+    # Assert
+    connect.assert_awaited_once()
+    channel = connection.channel.return_value
+    channel.declare_queue.assert_awaited_once()
+    assert channel.default_exchange.publish.await_count == 3
+    assert _sample("drivenow_rabbitmq_connections_opened_total") - opened_before == 1
+    assert _sample("drivenow_rabbitmq_connection_reuses_total") - reuses_before == 2
+    await publisher.close()
+
+@pytest.mark.asyncio
+async def test_publish_reconnects_after_failure(mock_logger: Mock) -> None:
+    """
+    Reconnect lazily after a failed publish.
+
+    Verifies that a broker error drops the pooled connection and that the next
+    publish opens a fresh one instead of reusing the broken channel.
+    """
+    # Setup
+    broken, healthy = _mock_connection(), _mock_connection()
+    broken.channel.return_value.default_exchange.publish.side_effect = ConnectionError("broker gone")
+    publisher = RabbitMQPublisher(mock_logger)
+
+    # Act
+    with patch("common.messaging.rabbitmq_publisher.aio_pika.connect_robust", AsyncMock(side_effect=[broken, healthy])) as connect:
+        await publisher.publish_event("rental.created", {})
+        await publisher.publish_event("rental.ended", {})
+
+    # Assert
+    assert connect.await_count == 2
+    broken.close.assert_awaited_once()
+    healthy.channel.return_value.default_exchange.publish.assert_awaited_once()
+    await publisher.close()
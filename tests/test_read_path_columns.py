@@ -0,0 +1,25 @@
+from dataclasses import fields
+from domain.entities.car import CarEntity
+from domain.entities.rental import RentalEntity
+from repositories.car_repository import CAR_COLUMNS
+from repositories.rental_repository import RENTAL_COLUMNS
+
+def test_car_columns_match_entity_fields() -> None:
+    """
+    Keep the car read columns aligned with CarEntity.
+
+    Verifies that the Core select returns exactly the entity's fields in
+    declaration order, since rows are mapped into CarEntity positionally.
+    """
+    # Assert
+    assert [column.name for column in CAR_COLUMNS] == [field.name for field in fields(CarEntity)]
+
+def test_rental_columns_match_entity_fields() -> None:
+    """
+    Keep the rental read columns aligned with RentalEntity.
+
+    Verifies that the Core select returns exactly the entity's fields in
+    declaration order, since rows are mapped into RentalEntity positionally.
+    """
+    # Assert
+    assert [column.name for column in RENTAL_COLUMNS] == [field.name for field in fields(RentalEntity)]
@@ -0,0 +1,67 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from common.interfaces.logger_interface import ILogger
+from services.rental_archiver import RentalArchiver
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """Fixture for mocking the AsyncSession used by an archive batch."""
+    return AsyncMock()
+
+@pytest.fixture
+def mock_archive_repo() -> AsyncMock:
+    """Fixture for mocking the Rental Archive Repository bound to the archiver session."""
+    return AsyncMock()
+
+@pytest.fixture
+def rental_archiver(mock_session: AsyncMock) -> RentalArchiver:
+    """Fixture that provides a RentalArchiver whose session factory yields the mocked session."""
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = mock_session
+    return RentalArchiver(Mock(spec=ILogger), session_factory, archive_after=timedelta(days=30), batch_size=500, interval_seconds=0)
+
+@pytest.mark.asyncio
+async def test_archive_batch_creates_partitions_once(rental_archiver: RentalArchiver, mock_session: AsyncMock, mock_archive_repo: AsyncMock) -> None:
+    """
+    Move a batch of old rentals into the archive.
+
+    Verifies that rentals ended before the horizon are moved in one committed
+    transaction, and that a month's partition is only created the first time
+    this archiver sees that month.
+    """
+    # Setup
+    mock_archive_repo.archivable_months.side_effect = [[date(2024, 1, 1)], [date(2024, 1, 1), date(2024, 2, 1)]]
+    mock_archive_repo.archive_ended_before.side_effect = [500, 120]
+
+    # Act
+    with patch("services.rental_archiver.RentalArchiveRepository", return_value=mock_archive_repo):
+        first = await rental_archiver.archive_batch()
+        second = await rental_archiver.archive_batch()
+
+    # Assert
+    assert (first, second) == (500, 120)
+    assert [call.args[0] for call in mock_archive_repo.create_partition.await_args_list] == [date(2024, 1, 1), date(2024, 2, 1)]
+    ended_before, limit = mock_archive_repo.archive_ended_before.await_args.args
+    assert limit == 500
+    assert abs(datetime.now(timezone.utc) - timedelta(days=30) - ended_before) < timedelta(minutes=1)
+    assert mock_session.commit.await_count == 2
+
+@pytest.mark.asyncio
+async def test_archive_batch_nothing_to_archive(rental_archiver: RentalArchiver, mock_session: AsyncMock, mock_archive_repo: AsyncMock) -> None:
+    """
+    Skip the batch when no rental is old enough.
+
+    Verifies that nothing is moved or committed.
+    """
+    # Setup
+    mock_archive_repo.archivable_months.return_value = []
+
+    # Act
+    with patch("services.rental_archiver.RentalArchiveRepository", return_value=mock_archive_repo):
+        archived = await rental_archiver.archive_batch()
+
+    # Assert
+    assert archived == 0
+    mock_archive_repo.archive_ended_before.assert_not_awaited()
+    mock_session.commit.assert_not_awaited()
@@ -1,12 +1,16 @@
 import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.dialects import postgresql
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 from domain.entities.car import CarEntity, CarStatus
-from domain.entities.rental import RentalEntity
-from common.exceptions import NotFoundException, CarStatusUnavailableException, InputValidationException, RentalAlreadyEndedException
+from domain.entities.rental import RentalEntity, RentalFilter
+from common.pagination import decode_cursor
+from common.exceptions import NotFoundException, CarStatusUnavailableException, InputValidationException
 from services.rental_service import RentalService
-from repositories.interfaces.car_repository_interface import ICarRepository
+from repositories.rental_repository import RentalRepository
 from repositories.interfaces.rental_repository_interface import IRentalRepository
+from repositories.interfaces.unit_of_work_interface import IUnitOfWork
 from common.interfaces.message_publisher_interface import IMessagePublisher
 import common.messaging.messaging_constants as constants
 from common.interfaces.logger_interface import ILogger
@@ -21,54 +25,52 @@ def mock_message_publisher() -> Mock:
     """Fixture for mocking the Message Publisher interface."""
     return Mock(spec=IMessagePublisher)
 
-@pytest.fixture
-def mock_car_repo() -> AsyncMock:
-    """Fixture for mocking the Car Repository interface."""
-    return AsyncMock(spec=ICarRepository)
-
 @pytest.fixture
 def mock_rental_repo() -> AsyncMock:
     """Fixture for mocking the Rental Repository interface."""
     return AsyncMock(spec=IRentalRepository)
 
 @pytest.fixture
-def rental_service(mock_logger: Mock, mock_message_publisher: Mock, mock_rental_repo: AsyncMock, mock_car_repo: AsyncMock) -> RentalService:
+def mock_unit_of_work() -> AsyncMock:
+    """Fixture for mocking the Unit of Work interface."""
+    return AsyncMock(spec=IUnitOfWork)
+
+@pytest.fixture
+def rental_service(mock_logger: Mock, mock_message_publisher: Mock, mock_rental_repo: AsyncMock, mock_unit_of_work: AsyncMock) -> RentalService:
     """Fixture that provides a RentalService instance injected with mocked dependencies."""
     return RentalService(
         logger=mock_logger,
         message_publisher=mock_message_publisher,
         rental_repository=mock_rental_repo,
-        car_repository=mock_car_repo
+        unit_of_work=mock_unit_of_work
     )
 
 @pytest.mark.asyncio
-async def test_create_rental_success(rental_service: RentalService, mock_car_repo: AsyncMock, mock_rental_repo: AsyncMock, mock_message_publisher: Mock) -> None:
+async def test_create_rental_success(rental_service: RentalService, mock_rental_repo: AsyncMock, mock_message_publisher: Mock, mock_unit_of_work: AsyncMock) -> None:
     """
     Successfully create a new rental.
     
     Verifies that providing valid inputs for an available car will properly
-    create the rental, change the car status to IN_USE, and update metrics.
+    start the rental through the single conditional repository operation and
+    update metrics, committing all of it (including the outbox event) in a
+    single transaction without any separate car reads or writes.
     """
     # Setup
     car_id = uuid4()
-    mock_car = CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.AVAILABLE)
-    mock_car_repo.get_by_id.return_value = mock_car
-    
+    claimed_car = CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.IN_USE)
     expected_rental = RentalEntity(id=uuid4(), car_id=car_id, customer_name="Moshe Binieli")
-    mock_rental_repo.create.return_value = expected_rental
+    mock_rental_repo.start_rental.return_value = (claimed_car, expected_rental)
 
     # Act
     rental = await rental_service.create_rental(car_id=car_id, customer_name="Moshe Binieli")
 
     # Assert
     assert rental == expected_rental
-    assert mock_car.status == CarStatus.IN_USE
-    mock_car_repo.get_by_id.assert_called_once_with(car_id)
-    mock_car_repo.update.assert_called_once_with(mock_car)
-    mock_rental_repo.create.assert_called_once_with(car_id=car_id, customer_name="Moshe Binieli")
+    mock_rental_repo.start_rental.assert_called_once_with(car_id=car_id, customer_name="Moshe Binieli")
     mock_message_publisher.publish_event.assert_called_once_with(
         constants.EVENT_RENTAL_CREATED, {"car_id": str(car_id), "rental_id": str(expected_rental.id)}
     )
+    mock_unit_of_work.commit.assert_awaited_once()
 
 @pytest.mark.asyncio
 async def test_create_rental_empty_customer_name(rental_service: RentalService) -> None:
@@ -84,15 +86,15 @@ async def test_create_rental_empty_customer_name(rental_service: RentalService)
     assert "Customer name cannot be empty" in str(exc_info.value)
 
 @pytest.mark.asyncio
-async def test_create_rental_car_not_found(rental_service: RentalService, mock_car_repo: AsyncMock) -> None:
+async def test_create_rental_car_not_found(rental_service: RentalService, mock_rental_repo: AsyncMock) -> None:
     """
     Fail to create a rental when the target car does not exist.
     
-    Verifies that a NotFoundException is raised if the car repository returns None.
+    Verifies that a NotFoundException is raised if the rental repository finds no car row.
     """
     # Setup
     car_id = uuid4()
-    mock_car_repo.get_by_id.return_value = None
+    mock_rental_repo.start_rental.return_value = (None, None)
 
     # Act / Assert
     with pytest.raises(NotFoundException) as exc_info:
@@ -100,7 +102,7 @@ async def test_create_rental_car_not_found(rental_service: RentalService, mock_c
     assert f"Car {car_id} not found" in str(exc_info.value)
 
 @pytest.mark.asyncio
-async def test_create_rental_car_not_available(rental_service: RentalService, mock_car_repo: AsyncMock) -> None:
+async def test_create_rental_car_not_available(rental_service: RentalService, mock_rental_repo: AsyncMock, mock_unit_of_work: AsyncMock) -> None:
     """
     Fail to create a rental when the target car is already in use.
     
@@ -109,69 +111,129 @@ async def test_create_rental_car_not_available(rental_service: RentalService, mo
     """
     # Setup
     car_id = uuid4()
-    mock_car_repo.get_by_id.return_value = CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.IN_USE)
+    mock_rental_repo.start_rental.return_value = (CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.IN_USE), None)
 
     # Act / Assert
     with pytest.raises(CarStatusUnavailableException) as exc_info:
         await rental_service.create_rental(car_id=car_id, customer_name="Moshe Binieli")
     assert "Car is not available for rent" in str(exc_info.value)
+    mock_unit_of_work.commit.assert_not_awaited()
 
 @pytest.mark.asyncio
-async def test_get_all_rentals(rental_service: RentalService, mock_rental_repo: AsyncMock) -> None:
+async def test_create_rental_car_reserved(rental_service: RentalService, mock_rental_repo: AsyncMock, mock_message_publisher: Mock, mock_unit_of_work: AsyncMock) -> None:
     """
-    Successfully retrieve a list of all rentals.
+    Fail to create a rental when another customer has booked the car.
     
-    Verifies that the service simply delegates to the repository correctly.
+    The car is still AVAILABLE, but the conditional update refused to claim it
+    because of an upcoming reservation, so no rental row was inserted. Verifies
+    that this comes back as a CarStatusUnavailableException and that nothing is
+    staged or committed.
     """
     # Setup
-    mock_rentals = [RentalEntity(id=uuid4(), car_id=uuid4(), customer_name="Moshe Binieli"), RentalEntity(id=uuid4(), car_id=uuid4(), customer_name="Moshe Binieli")]
-    mock_rental_repo.get_all.return_value = mock_rentals
+    car_id = uuid4()
+    mock_rental_repo.start_rental.return_value = (CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.AVAILABLE), None)
+
+    # Act / Assert
+    with pytest.raises(CarStatusUnavailableException) as exc_info:
+        await rental_service.create_rental(car_id=car_id, customer_name="Moshe Binieli")
+    assert "reserved by another customer" in str(exc_info.value)
+    mock_message_publisher.publish_event.assert_not_called()
+    mock_unit_of_work.commit.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_get_rentals_page(rental_service: RentalService, mock_rental_repo: AsyncMock) -> None:
+    """
+    Successfully retrieve a filtered page of rentals.
+    
+    Verifies that the service passes the filters through to the repository,
+    over-fetches by one row, and returns a cursor for the next page.
+    """
+
+    # Setup
+    car_id = uuid4()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    mock_rentals = [RentalEntity(id=uuid4(), car_id=car_id, customer_name="Moshe Binieli", start_date=start - timedelta(hours=i)) for i in range(3)]
+    mock_rental_repo.get_page.return_value = mock_rentals
+    filters = RentalFilter(active=True, car_id=car_id)
     
     # Act
-    rentals = await rental_service.get_all_rentals()
+    rentals, next_cursor = await rental_service.get_rentals_page(filters, limit=2)
     
     # Assert
-    assert rentals == mock_rentals
-    mock_rental_repo.get_all.assert_called_once()
+    assert rentals == mock_rentals[:2]
+    assert decode_cursor(next_cursor) == (mock_rentals[1].start_date, mock_rentals[1].id)
+    mock_rental_repo.get_page.assert_called_once_with(filters=filters, limit=3, before=None)
 
 @pytest.mark.asyncio
-async def test_end_rental_success(rental_service: RentalService, mock_car_repo: AsyncMock, mock_rental_repo: AsyncMock, mock_message_publisher: Mock) -> None:
+async def test_get_rentals_page_invalid_window(rental_service: RentalService, mock_rental_repo: AsyncMock) -> None:
+    """
+    Fail to list rentals for an empty time window.
+    
+    Verifies that a window whose start is not before its end is rejected with an
+    InputValidationException before hitting the repository.
+    """
+
+    # Setup
+    now = datetime.now(timezone.utc)
+
+    # Act / Assert
+    with pytest.raises(InputValidationException):
+        await rental_service.get_rentals_page(RentalFilter(from_time=now, to_time=now), limit=10)
+    mock_rental_repo.get_page.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_rentals_page_rejects_naive_window(rental_service: RentalService, mock_rental_repo: AsyncMock) -> None:
+    """
+    Fail to list rentals for a window with a bound lacking a time zone.
+    
+    Verifies that mixing a naive and an aware bound is rejected with an
+    InputValidationException instead of failing on the comparison, and that
+    a lone naive bound is rejected too.
+    """
+
+    # Act / Assert
+    with pytest.raises(InputValidationException) as exc_info:
+        await rental_service.get_rentals_page(RentalFilter(from_time=datetime(2024, 1, 1), to_time=datetime(2024, 2, 1, tzinfo=timezone.utc)), limit=10)
+    assert "must include a time zone" in str(exc_info.value)
+    with pytest.raises(InputValidationException):
+        await rental_service.get_rentals_page(RentalFilter(from_time=datetime(2024, 1, 1)), limit=10)
+    mock_rental_repo.get_page.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_end_rental_success(rental_service: RentalService, mock_rental_repo: AsyncMock, mock_message_publisher: Mock, mock_unit_of_work: AsyncMock) -> None:
     """
     Successfully ends an ongoing rental.
     
-    Verifies that the service retrieves the car and rental, marks the car as
-    AVAILABLE, ends the rental in the DB, and flips the metrics appropriately.
+    Verifies that the service closes the active rental and releases the car
+    through the single repository operation, then stages the metrics event and
+    commits once, returning the ended rental as the repository reported it.
     """
+
     # Setup
     car_id = uuid4()
-    mock_car = CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.IN_USE)
-    mock_car_repo.get_by_id.return_value = mock_car
-    
-    mock_active_rental = RentalEntity(id=uuid4(), car_id=car_id, customer_name="Moshe Binieli")
-    mock_rental_repo.get_active_rental_by_car_id.return_value = mock_active_rental
+    released_car = CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.AVAILABLE)
+    ended = RentalEntity(id=uuid4(), car_id=car_id, customer_name="Moshe Binieli", end_date=datetime.now(timezone.utc))
+    mock_rental_repo.end_active_rental.return_value = (released_car, ended)
     
     # Act
     ended_rental = await rental_service.end_rental_by_car_id(car_id)
     
     # Assert
-    assert ended_rental == mock_active_rental
-    assert mock_car.status == CarStatus.AVAILABLE
-    mock_car_repo.get_by_id.assert_called_once_with(car_id)
-    mock_rental_repo.get_active_rental_by_car_id.assert_called_once_with(car_id)
-    mock_rental_repo.end_rental.assert_called_once_with(mock_active_rental)
-    mock_car_repo.update.assert_called_once_with(mock_car)
+    assert ended_rental == ended
+    mock_rental_repo.end_active_rental.assert_called_once_with(car_id)
     mock_message_publisher.publish_event.assert_called_once_with(
-        constants.EVENT_RENTAL_ENDED, {"car_id": str(car_id), "rental_id": str(mock_active_rental.id)}
+        constants.EVENT_RENTAL_ENDED, {"car_id": str(car_id), "rental_id": str(ended.id)}
     )
+    mock_unit_of_work.commit.assert_awaited_once()
 
 @pytest.mark.asyncio
-async def test_end_rental_car_not_found(rental_service: RentalService, mock_car_repo: AsyncMock) -> None:
+async def test_end_rental_car_not_found(rental_service: RentalService, mock_rental_repo: AsyncMock) -> None:
     """
     Fail to end a rental if the target car doesn't exist.
     """
     # Setup
     car_id = uuid4()
-    mock_car_repo.get_by_id.return_value = None
+    mock_rental_repo.end_active_rental.return_value = (None, None)
     
     # Act / Assert
     with pytest.raises(NotFoundException) as exc_info:
@@ -179,37 +241,39 @@ async def test_end_rental_car_not_found(rental_service: RentalService, mock_car_
     assert f"Car {car_id} not found" in str(exc_info.value)
 
 @pytest.mark.asyncio
-async def test_end_rental_active_rental_not_found(rental_service: RentalService, mock_car_repo: AsyncMock, mock_rental_repo: AsyncMock) -> None:
+async def test_end_rental_active_rental_not_found(rental_service: RentalService, mock_rental_repo: AsyncMock, mock_unit_of_work: AsyncMock) -> None:
     """
     Fail to end a rental if the car exists but has no ongoing rental associated.
     """
     # Setup
     car_id = uuid4()
-    mock_car_repo.get_by_id.return_value = CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.IN_USE)
-    mock_rental_repo.get_active_rental_by_car_id.return_value = None
+    mock_rental_repo.end_active_rental.return_value = (CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.AVAILABLE), None)
     
     # Act / Assert
     with pytest.raises(NotFoundException) as exc_info:
         await rental_service.end_rental_by_car_id(car_id)
     assert f"No active rental found for car {car_id}" in str(exc_info.value)
+    mock_unit_of_work.commit.assert_not_awaited()
 
 @pytest.mark.asyncio
-async def test_end_rental_already_ended(rental_service: RentalService, mock_car_repo: AsyncMock, mock_rental_repo: AsyncMock) -> None:
+async def test_customer_name_filter_is_an_index_range() -> None:
     """
-    Fail to end a rental if the active rental retrieved strangely has an end_date.
-    
-    This guards against data inconsistency states.
+    Filter rentals by customer name prefix with an index range.
+
+    Verifies that the prefix becomes a >= / < range on the "C"-collated
+    lowercase name, which the prefix index can serve in generic plans, and
+    that LIKE wildcards in the prefix are matched literally.
     """
-    from datetime import datetime
-    
     # Setup
-    car_id = uuid4()
-    mock_car_repo.get_by_id.return_value = CarEntity(id=car_id, model="Kia", year=2021, status=CarStatus.IN_USE)
-    
-    ended_rental = RentalEntity(id=uuid4(), car_id=car_id, customer_name="Moshe Binieli", end_date=datetime.now())
-    mock_rental_repo.get_active_rental_by_car_id.return_value = ended_rental
-    
-    # Act / Assert
-    with pytest.raises(RentalAlreadyEndedException) as exc_info:
-        await rental_service.end_rental_by_car_id(car_id)
-    assert "Rental already ended" in str(exc_info.value)
+    session = AsyncMock()
+    session.execute.return_value = []
+
+    # Act
+    await RentalRepository(session).get_page(RentalFilter(customer_name="Da%"), limit=5)
+
+    # Assert
+    statement = session.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.asyncpg.dialect()))
+    assert "LIKE" not in sql
+    assert 'lower(rentals.customer_name) COLLATE "C") >=' in sql
+    assert set(statement.compile().params.values()) >= {"da%", "da&"}
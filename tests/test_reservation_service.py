@@ -0,0 +1,138 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+from domain.entities.car import CarEntity
+from domain.entities.reservation import ReservationEntity
+from common.exceptions import NotFoundException, InputValidationException, ReservationConflictException
+from common.pagination import decode_cursor
+from services.reservation_service import ReservationService
+from repositories.interfaces.reservation_repository_interface import IReservationRepository
+from repositories.interfaces.unit_of_work_interface import IUnitOfWork
+from common.interfaces.logger_interface import ILogger
+
+@pytest.fixture
+def mock_reservation_repo() -> AsyncMock:
+    """Fixture for mocking the Reservation Repository interface."""
+    return AsyncMock(spec=IReservationRepository)
+
+@pytest.fixture
+def mock_unit_of_work() -> AsyncMock:
+    """Fixture for mocking the Unit of Work interface."""
+    return AsyncMock(spec=IUnitOfWork)
+
+@pytest.fixture
+def reservation_service(mock_reservation_repo: AsyncMock, mock_unit_of_work: AsyncMock) -> ReservationService:
+    """Fixture that provides a ReservationService instance injected with mocked dependencies."""
+    return ReservationService(logger=Mock(spec=ILogger), reservation_repository=mock_reservation_repo, unit_of_work=mock_unit_of_work)
+
+def _window() -> tuple[datetime, datetime]:
+    start = datetime.now(timezone.utc) + timedelta(days=2)
+    return start, start + timedelta(days=1)
+
+@pytest.mark.asyncio
+async def test_create_reservation_success(reservation_service: ReservationService, mock_reservation_repo: AsyncMock, mock_unit_of_work: AsyncMock) -> None:
+    """
+    Successfully book a car for a future window.
+
+    Verifies that the window is passed to the repository unchanged and that the
+    booking is committed.
+    """
+    # Setup
+    car_id = uuid4()
+    start, end = _window()
+    booked = ReservationEntity(car_id=car_id, customer_name="Dana", start_time=start, end_time=end, created_at=datetime.now(timezone.utc))
+    mock_reservation_repo.create.return_value = (True, booked)
+
+    # Act
+    reservation = await reservation_service.create_reservation(car_id, "Dana", start, end)
+
+    # Assert
+    assert reservation == booked
+    mock_reservation_repo.create.assert_called_once_with(car_id, "Dana", start, end)
+    mock_unit_of_work.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_create_reservation_conflict(reservation_service: ReservationService, mock_reservation_repo: AsyncMock, mock_unit_of_work: AsyncMock) -> None:
+    """
+    Fail to book a window that overlaps an existing booking.
+
+    Verifies that a car that exists but could not be booked raises a
+    ReservationConflictException and that nothing is committed.
+    """
+    # Setup
+    mock_reservation_repo.create.return_value = (True, None)
+
+    # Act / Assert
+    with pytest.raises(ReservationConflictException):
+        await reservation_service.create_reservation(uuid4(), "Dana", *_window())
+    mock_unit_of_work.commit.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_create_reservation_car_not_found(reservation_service: ReservationService, mock_reservation_repo: AsyncMock) -> None:
+    """
+    Fail to book a car that does not exist.
+
+    Verifies that a NotFoundException is raised when the repository did not find the car.
+    """
+    # Setup
+    mock_reservation_repo.create.return_value = (False, None)
+
+    # Act / Assert
+    with pytest.raises(NotFoundException):
+        await reservation_service.create_reservation(uuid4(), "Dana", *_window())
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("start, end, message", [
+    (datetime(2030, 1, 2, tzinfo=timezone.utc), datetime(2030, 1, 1, tzinfo=timezone.utc), "start_time must be earlier than end_time"),
+    (datetime(2030, 1, 1), datetime(2030, 1, 2), "must include a time zone"),
+    (datetime(2020, 1, 1, tzinfo=timezone.utc), datetime(2020, 1, 2, tzinfo=timezone.utc), "must end in the future"),
+])
+async def test_create_reservation_rejects_invalid_window(reservation_service: ReservationService, mock_reservation_repo: AsyncMock, start: datetime, end: datetime, message: str) -> None:
+    """
+    Refuse an empty, naive or past booking window.
+
+    Verifies that the window is validated before the repository is called.
+    """
+    # Act / Assert
+    with pytest.raises(InputValidationException) as exc_info:
+        await reservation_service.create_reservation(uuid4(), "Dana", start, end)
+    assert message in str(exc_info.value)
+    mock_reservation_repo.create.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_cancel_reservation_not_found(reservation_service: ReservationService, mock_reservation_repo: AsyncMock, mock_unit_of_work: AsyncMock) -> None:
+    """
+    Fail to cancel a booking that does not exist.
+
+    Verifies that a NotFoundException is raised and nothing is committed.
+    """
+    # Setup
+    mock_reservation_repo.cancel.return_value = False
+
+    # Act / Assert
+    with pytest.raises(NotFoundException):
+        await reservation_service.cancel_reservation(uuid4())
+    mock_unit_of_work.commit.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_get_free_cars_page(reservation_service: ReservationService, mock_reservation_repo: AsyncMock) -> None:
+    """
+    List cars free during a window one page at a time.
+
+    Verifies that one extra row is requested to detect a following page and that
+    the cursor points at the last car returned.
+    """
+    # Setup
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    cars = [CarEntity(id=uuid4(), model="Kia", year=2021, created_at=created + timedelta(minutes=i)) for i in range(3)]
+    mock_reservation_repo.get_free_cars.return_value = cars
+    start, end = _window()
+
+    # Act
+    page, next_cursor = await reservation_service.get_free_cars_page(start, end, limit=2)
+
+    # Assert
+    assert page == cars[:2]
+    assert decode_cursor(next_cursor) == (cars[1].created_at, cars[1].id)
+    mock_reservation_repo.get_free_cars.assert_called_once_with(start, end, limit=3, after=None)
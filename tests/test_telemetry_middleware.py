@@ -0,0 +1,114 @@
+import pytest
+from typing import AsyncIterator
+from unittest.mock import Mock
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from api.middleware.telemetry_middleware import TelemetryMiddleware
+from common.interfaces.logger_interface import ILogger
+from services.interfaces.metrics_service_interface import IMetricsService
+
+@pytest.fixture
+def mock_metrics_service() -> Mock:
+    """Fixture for mocking the Metrics Service interface."""
+    return Mock(spec=IMetricsService)
+
+@pytest.fixture
+def mock_logger() -> Mock:
+    """Fixture for mocking the Logger interface."""
+    return Mock(spec=ILogger)
+
+@pytest.fixture
+def client(mock_metrics_service: Mock, mock_logger: Mock) -> TestClient:
+    """Fixture that provides a small app wrapped by the telemetry middleware."""
+    app = FastAPI()
+    app.add_middleware(TelemetryMiddleware, metrics_service=mock_metrics_service, logger=mock_logger)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/stream")
+    async def stream():
+        async def body() -> AsyncIterator[str]:
+            for chunk in ("a\n", "b\n", "c\n"):
+                # Nothing may be recorded until the last chunk has gone out.
+                assert mock_metrics_service.record_request_time.call_count == 0
+                yield chunk
+        return StreamingResponse(body(), media_type="text/plain")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+def test_middleware_records_route_template_once(client: TestClient, mock_metrics_service: Mock, mock_logger: Mock) -> None:
+    """
+    Record one latency sample and one access log line per request.
+
+    Verifies that the sample is labelled with the route template and the
+    response status code.
+    """
+    # Act
+    response = client.get("/items/7")
+
+    # Assert
+    assert response.status_code == 200
+    mock_metrics_service.record_request_time.assert_called_once()
+    method, endpoint, status_code, elapsed = mock_metrics_service.record_request_time.call_args.args
+    assert (method, endpoint, status_code) == ("GET", "/items/{item_id}", 200)
+    assert elapsed >= 0
+    mock_logger.info.assert_called_once()
+
+def test_middleware_records_streaming_response_after_last_chunk(client: TestClient, mock_metrics_service: Mock) -> None:
+    """
+    Time streaming responses until their final chunk.
+
+    Verifies that the body is passed through untouched and recorded only once
+    the whole stream has been sent.
+    """
+    # Act
+    response = client.get("/stream")
+
+    # Assert
+    assert response.text == "a\nb\nc\n"
+    mock_metrics_service.record_request_time.assert_called_once()
+    assert mock_metrics_service.record_request_time.call_args.args[1:3] == ("/stream", 200)
+
+def test_middleware_records_unhandled_errors(client: TestClient, mock_metrics_service: Mock, mock_logger: Mock) -> None:
+    """
+    Record requests that fail with an unhandled exception.
+
+    Verifies that they are counted as 500 responses and logged as errors.
+    """
+    # Act
+    response = client.get("/boom")
+
+    # Assert
+    assert response.status_code == 500
+    mock_metrics_service.record_request_time.assert_called_once()
+    assert mock_metrics_service.record_request_time.call_args.args[1:3] == ("/boom", 500)
+    mock_logger.error.assert_called_once()
+
+def test_middleware_samples_access_log(mock_metrics_service: Mock, mock_logger: Mock) -> None:
+    """
+    Sample the access log without sampling the metrics.
+
+    Verifies that with a sample rate of zero successful requests are still
+    timed but not logged.
+    """
+    # Setup
+    app = FastAPI()
+    app.add_middleware(TelemetryMiddleware, metrics_service=mock_metrics_service, logger=mock_logger, access_log_sample_rate=0.0)
+
+    @app.get("/ping")
+    async def ping():
+        return {}
+
+    # Act
+    TestClient(app).get("/ping")
+
+    # Assert
+    mock_metrics_service.record_request_time.assert_called_once()
+    mock_logger.info.assert_not_called()
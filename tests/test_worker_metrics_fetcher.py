@@ -0,0 +1,50 @@
+import httpx
+import pytest
+from unittest.mock import Mock
+from common.interfaces.logger_interface import ILogger
+from services.worker_metrics_fetcher import WorkerMetricsFetcher
+
+def _fetcher(handler) -> WorkerMetricsFetcher:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return WorkerMetricsFetcher(Mock(spec=ILogger), url="http://worker:8001", refresh_interval_seconds=60, client=client)
+
+@pytest.mark.asyncio
+async def test_refresh_stores_worker_payload() -> None:
+    """
+    Keep the latest worker payload in memory.
+
+    Verifies that a successful refresh replaces the served payload and resets
+    its age.
+    """
+    # Setup
+    fetcher = _fetcher(lambda request: httpx.Response(200, text="drivenow_available_cars_total 3.0\n"))
+    assert fetcher.age_seconds() == -1.0
+
+    # Act
+    refreshed = await fetcher.refresh()
+
+    # Assert
+    assert refreshed is True
+    assert fetcher.get_payload() == "drivenow_available_cars_total 3.0\n"
+    assert 0 <= fetcher.age_seconds() < 1
+    await fetcher.stop()
+
+@pytest.mark.asyncio
+async def test_refresh_failure_keeps_stale_payload() -> None:
+    """
+    Serve the last good payload while the worker is unavailable.
+
+    Verifies that a failed refresh neither clears the cached payload nor raises.
+    """
+    # Setup
+    responses = iter([httpx.Response(200, text="drivenow_active_rentals_total 1.0\n"), httpx.Response(503)])
+    fetcher = _fetcher(lambda request: next(responses))
+    await fetcher.refresh()
+
+    # Act
+    refreshed = await fetcher.refresh()
+
+    # Assert
+    assert refreshed is False
+    assert fetcher.get_payload() == "drivenow_active_rentals_total 1.0\n"
+    await fetcher.stop()
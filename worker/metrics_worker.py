@@ -1,52 +1,219 @@
-import json
+import os
+from common.config import settings
+
+# prometheus_client picks its value storage when it is first imported, so multiprocess mode must be set up before that.
+if settings.WORKER_PROCESSES > 1:
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = settings.WORKER_METRICS_MULTIPROC_DIR
+
 import aio_pika
 from aio_pika.abc import AbstractIncomingMessage
 import asyncio
-from prometheus_client import start_http_server, Gauge
-from common.config import settings
+import glob
+import multiprocessing
+import signal
+import sys
+import time
+from collections import Counter as EventCounter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, Iterable, List, Optional, Set
+from prometheus_client import start_http_server, CollectorRegistry, Counter, Gauge, Histogram, multiprocess
+from pydantic import ValidationError
 from common.messaging.message_schema import MessageEvent
 import common.messaging.messaging_constants as constants
 from common.logger import Logger
+from db.database import AsyncSessionLocal, engine
+from domain.entities.fleet_snapshot import FleetSnapshot
+from repositories.fleet_snapshot_repository import FleetSnapshotRepository
 
 logger = Logger()
 
-AVAILABLE_CARS_GAUGE = Gauge('drivenow_available_cars_total', 'Total number of cars currently available for rent in the fleet')
-ACTIVE_RENTALS_GAUGE = Gauge('drivenow_active_rentals_total', 'Total number of active rentals that have not yet been ended')
+# In multiprocess mode the supervisor's value is the snapshot seed and each consumer's value is the net of the
+# deltas it applied, so the exported gauge is their sum (kept for exited consumers, whose deltas still count).
+AVAILABLE_CARS_GAUGE = Gauge('drivenow_available_cars_total', 'Total number of cars currently available for rent in the fleet', multiprocess_mode='sum')
+ACTIVE_RENTALS_GAUGE = Gauge('drivenow_active_rentals_total', 'Total number of active rentals that have not yet been ended', multiprocess_mode='sum')
+WORKER_EVENTS_PROCESSED = Counter('drivenow_worker_events_processed', 'Number of queue events applied to the gauges by the metrics worker', ['event_type'])
+WORKER_EVENTS_SKIPPED = Counter('drivenow_worker_events_skipped', 'Number of queue events not applied because the startup snapshot already counted them or they were duplicates', ['reason'])
+WORKER_MALFORMED_MESSAGES = Counter('drivenow_worker_malformed_messages', 'Number of queue messages the metrics worker could not decode')
+WORKER_BATCH_SIZE = Histogram('drivenow_worker_batch_size', 'Number of messages applied and acknowledged together', buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000))
+WORKER_FAILED_BATCHES = Counter('drivenow_worker_failed_batches', 'Number of batches the metrics worker failed to apply and rejected, by whether they were requeued or dropped', ['action'])
+WORKER_CONSUMER_LAG = Gauge('drivenow_worker_consumer_lag_seconds', 'Age of the oldest event in the last applied batch, measured from when the event occurred', multiprocess_mode='livemax')
+
+@dataclass
+class GaugeDeltas:
+    available_cars: int = 0
+    active_rentals: int = 0
+    unknown_event_types: EventCounter = field(default_factory=EventCounter)
+
+# Events whose payload carries a gauge delta, and the field it is read from.
+_DELTA_PAYLOAD_FIELDS = {
+    constants.EVENT_CAR_CREATED_AVAILABLE: "count",
+    constants.EVENT_CARS_AVAILABILITY_CHANGED: "delta",
+}
+
+def has_valid_deltas(event: MessageEvent) -> bool:
+    field_name = _DELTA_PAYLOAD_FIELDS.get(event.event_type)
+    if field_name is None or field_name not in event.payload:
+        return True
+    value = event.payload[field_name]
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def aggregate_deltas(events: Iterable[MessageEvent]) -> GaugeDeltas:
+    deltas = GaugeDeltas()
+    for event in events:
+        event_type = event.event_type
+        if event_type == constants.EVENT_CAR_CREATED_AVAILABLE:
+            # Bulk registrations publish one event carrying how many cars were added.
+            deltas.available_cars += event.payload.get("count", 1)
+        elif event_type == constants.EVENT_CARS_AVAILABILITY_CHANGED:
+            deltas.available_cars += event.payload.get("delta", 0)
+        elif event_type == constants.EVENT_CAR_STATUS_CHANGED_TO_AVAILABLE:
+            deltas.available_cars += 1
+        elif event_type == constants.EVENT_CAR_STATUS_CHANGED_FROM_AVAILABLE:
+            deltas.available_cars -= 1
+        elif event_type == constants.EVENT_RENTAL_CREATED:
+            deltas.active_rentals += 1
+            deltas.available_cars -= 1
+        elif event_type == constants.EVENT_RENTAL_ENDED:
+            deltas.active_rentals -= 1
+            deltas.available_cars += 1
+        else:
+            deltas.unknown_event_types[event_type] += 1
+    return deltas
+
+def apply_deltas(deltas: GaugeDeltas) -> None:
+    if deltas.available_cars:
+        AVAILABLE_CARS_GAUGE.inc(deltas.available_cars)
+    if deltas.active_rentals:
+        ACTIVE_RENTALS_GAUGE.inc(deltas.active_rentals)
+
+class SnapshotEventFilter:
+    def __init__(self, snapshot: FleetSnapshot, dedup_window: int = settings.WORKER_DEDUP_WINDOW) -> None:
+        self.snapshot = snapshot
+        self.dedup_window = dedup_window
+        self._seen: Set[int] = set()
+        self._seen_order: Deque[int] = deque()
+
+    def accept(self, event: MessageEvent) -> bool:
+        if event.txid is not None and self.snapshot.includes_transaction(event.txid):
+            WORKER_EVENTS_SKIPPED.labels(reason="snapshot").inc()
+            return False
+
+        if event.sequence is None:
+            return True
+        if event.sequence in self._seen:
+            # The outbox relay delivers at least once, e.g. when a batch is confirmed but its delete is rolled back.
+            WORKER_EVENTS_SKIPPED.labels(reason="duplicate").inc()
+            return False
+
+        self._seen.add(event.sequence)
+        self._seen_order.append(event.sequence)
+        if len(self._seen_order) > self.dedup_window:
+            self._seen.discard(self._seen_order.popleft())
+        return True
 
-async def process_message(message: AbstractIncomingMessage) -> None:
-    async with message.process():
+class MetricsBatchConsumer:
+    def __init__(self, event_filter: Optional[SnapshotEventFilter] = None, batch_size: int = settings.WORKER_BATCH_SIZE, batch_timeout_seconds: float = settings.WORKER_BATCH_TIMEOUT_SECONDS) -> None:
+        self.event_filter = event_filter
+        self.batch_size = batch_size
+        self.batch_timeout_seconds = batch_timeout_seconds
+        self._messages: asyncio.Queue[AbstractIncomingMessage] = asyncio.Queue()
+
+    async def on_message(self, message: AbstractIncomingMessage) -> None:
+        # The consume callback only enqueues; acknowledgement happens once per batch in run().
+        self._messages.put_nowait(message)
+
+    async def run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.process_batch(batch)
+            except Exception as e:
+                # Only settling the batch can fail here; the broker requeues unsettled deliveries if the channel closed.
+                logger.error("Error settling batch of %d messages: %s", len(batch), e)
+
+    async def _next_batch(self) -> List[AbstractIncomingMessage]:
+        batch = [await self._messages.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_timeout_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._messages.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def process_batch(self, messages: List[AbstractIncomingMessage]) -> None:
         try:
-            data = json.loads(message.body)
-            event = MessageEvent(**data)
-            event_type = event.event_type
-            
-            logger.info(f"Worker received event: {event_type}")
-            
-            if event_type in (constants.EVENT_CAR_CREATED_AVAILABLE, constants.EVENT_CAR_STATUS_CHANGED_TO_AVAILABLE):
-                logger.info("Incrementing available cars gauge")
-                AVAILABLE_CARS_GAUGE.inc()
-            elif event_type == constants.EVENT_CAR_STATUS_CHANGED_FROM_AVAILABLE:
-                logger.info("Decrementing available cars gauge")
-                AVAILABLE_CARS_GAUGE.dec()
-            elif event_type == constants.EVENT_RENTAL_CREATED:
-                logger.info("Incrementing active rentals and decrementing available cars gauges")
-                ACTIVE_RENTALS_GAUGE.inc()
-                AVAILABLE_CARS_GAUGE.dec()
-            elif event_type == constants.EVENT_RENTAL_ENDED:
-                logger.info("Decrementing active rentals and incrementing available cars gauges")
-                ACTIVE_RENTALS_GAUGE.dec()
-                AVAILABLE_CARS_GAUGE.inc()
-            else:
-                logger.warning(f"Worker received unknown event type: {event_type}")
-                
+            await self._apply_batch(messages)
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            # Unsettled deliveries keep counting against the prefetch limit, so a failed batch is always
+            # rejected: requeued once for transient errors, dropped if any of it was already redelivered.
+            requeue = not any(message.redelivered for message in messages)
+            logger.error("Error processing batch of %d messages, %s it: %s", len(messages), "requeueing" if requeue else "dropping", e)
+            WORKER_FAILED_BATCHES.labels(action="requeued" if requeue else "dropped").inc()
+            await messages[-1].nack(multiple=True, requeue=requeue)
 
-async def start_worker() -> None:
-    logger.info("Starting Metrics Worker service...")
-    start_http_server(8001)
-    logger.info("Metrics HTTP server started on port 8001")
-    
+    async def _apply_batch(self, messages: List[AbstractIncomingMessage]) -> None:
+        events: List[MessageEvent] = []
+        for message in messages:
+            try:
+                event = MessageEvent.model_validate_json(message.body)
+            except ValidationError as e:
+                WORKER_MALFORMED_MESSAGES.inc()
+                logger.error("Dropping malformed message: %s", e)
+                continue
+            # One bad delta must not fail the batch, or every good event in it would be requeued and then dropped.
+            if not has_valid_deltas(event):
+                WORKER_MALFORMED_MESSAGES.inc()
+                logger.error("Dropping %s message with a non-integer delta: %s", event.event_type, event.payload)
+                continue
+            events.append(event)
+
+        lag = _consumer_lag_seconds(events)
+        if self.event_filter is not None:
+            events = [event for event in events if self.event_filter.accept(event)]
+
+        deltas = aggregate_deltas(events)
+        apply_deltas(deltas)
+        for event_type, count in EventCounter(event.event_type for event in events).items():
+            WORKER_EVENTS_PROCESSED.labels(event_type=event_type).inc(count)
+        WORKER_BATCH_SIZE.observe(len(messages))
+        if lag is not None:
+            WORKER_CONSUMER_LAG.set(lag)
+
+        # Deliveries on a channel are acknowledged in order, so acking the last one covers the whole batch.
+        await messages[-1].ack(multiple=True)
+
+        logger.info("Applied %d events (available cars %+d, active rentals %+d)", len(events), deltas.available_cars, deltas.active_rentals)
+        if deltas.unknown_event_types:
+            logger.warning("Worker received unknown event types: %s", dict(deltas.unknown_event_types))
+
+def _consumer_lag_seconds(events: List[MessageEvent]) -> Optional[float]:
+    # Timestamps without a time zone are taken as UTC, which is what the publishers emit.
+    occurred = [event.occurred_at if event.occurred_at.tzinfo else event.occurred_at.replace(tzinfo=timezone.utc) for event in events if event.occurred_at is not None]
+    if not occurred:
+        return None
+    return max(0.0, (datetime.now(timezone.utc) - min(occurred)).total_seconds())
+
+async def seed_gauges() -> FleetSnapshot:
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                snapshot = await FleetSnapshotRepository(session).get_snapshot()
+            break
+        except Exception as e:
+            logger.warning("Database not ready for the gauge snapshot, retrying in 2 seconds: %s", e)
+            await asyncio.sleep(2)
+
+    AVAILABLE_CARS_GAUGE.set(snapshot.available_cars)
+    ACTIVE_RENTALS_GAUGE.set(snapshot.active_rentals)
+    logger.info("Seeded gauges from database snapshot %s:%s: %d available cars, %d active rentals", snapshot.xmin, snapshot.xmax, snapshot.available_cars, snapshot.active_rentals)
+    return snapshot
+
+async def consume(snapshot: FleetSnapshot) -> None:
     connection = None
     while not connection:
         try:
@@ -54,19 +221,84 @@ async def start_worker() -> None:
         except Exception:
             logger.warning("RabbitMQ not ready yet, retrying in 2 seconds...")
             await asyncio.sleep(2)
-            
+
     async with connection:
         channel = await connection.channel()
+        # A batch can only fill up if the broker is allowed to have at least that many messages in flight.
+        await channel.set_qos(prefetch_count=max(settings.WORKER_PREFETCH_COUNT, settings.WORKER_BATCH_SIZE))
         queue = await channel.declare_queue(constants.METRICS_QUEUE_NAME, durable=True)
 
-        logger.info(f"Connected to RabbitMQ. Waiting for messages on queue: {constants.METRICS_QUEUE_NAME}")
-        await queue.consume(process_message)
-        
+        # Events from transactions the snapshot already saw (including ones still queued) are skipped.
+        consumer = MetricsBatchConsumer(SnapshotEventFilter(snapshot))
+        logger.info("Connected to RabbitMQ. Waiting for messages on queue: %s", constants.METRICS_QUEUE_NAME)
+        await queue.consume(consumer.on_message)
+
         # Wait until termination
-        await asyncio.Future()
+        await consumer.run()
+
+async def start_worker() -> None:
+    logger.info("Starting Metrics Worker service...")
+    start_http_server(8001)
+    logger.info("Metrics HTTP server started on port 8001")
+    await consume(await seed_gauges())
+
+def run_consumer_process(snapshot: FleetSnapshot) -> None:
+    try:
+        asyncio.run(consume(snapshot))
+    except KeyboardInterrupt:
+        pass
+
+async def _seed_supervisor_gauges() -> FleetSnapshot:
+    try:
+        return await seed_gauges()
+    finally:
+        # Consumers never touch the database, and this pool's connections belong to a loop that is about to close.
+        await engine.dispose()
+
+def run_supervisor(processes: int) -> None:
+    metrics_dir = settings.WORKER_METRICS_MULTIPROC_DIR
+    os.makedirs(metrics_dir, exist_ok=True)
+    for stale_file in glob.glob(os.path.join(metrics_dir, "*.db")):
+        os.remove(stale_file)
+
+    logger.info("Starting Metrics Worker supervisor with %d consumer processes...", processes)
+    snapshot = asyncio.run(_seed_supervisor_gauges())
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    start_http_server(8001, registry=registry)
+    logger.info("Aggregated metrics HTTP server started on port 8001")
+
+    context = multiprocessing.get_context("spawn")
+    consumers: List[multiprocessing.process.BaseProcess] = []
+
+    def spawn_consumer() -> multiprocessing.process.BaseProcess:
+        process = context.Process(target=run_consumer_process, args=(snapshot,), daemon=True)
+        process.start()
+        return process
+
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        consumers = [spawn_consumer() for _ in range(processes)]
+        while True:
+            time.sleep(1)
+            for index, process in enumerate(consumers):
+                if process.is_alive():
+                    continue
+                logger.warning("Metrics consumer process %s exited with code %s, restarting", process.pid, process.exitcode)
+                multiprocess.mark_process_dead(process.pid)
+                consumers[index] = spawn_consumer()
+    finally:
+        for process in consumers:
+            process.terminate()
+        for process in consumers:
+            process.join(timeout=5)
 
 if __name__ == '__main__':
     try:
-        asyncio.run(start_worker())
+        if settings.WORKER_PROCESSES > 1:
+            run_supervisor(settings.WORKER_PROCESSES)
+        else:
+            asyncio.run(start_worker())
     except KeyboardInterrupt:
         pass